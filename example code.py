@@ -28,62 +28,64 @@ display.show(main_group)
 # ----------------------------------------------------
 
 gauge1 = Gauge(
-    xcenter=30,
-    ycenter=30,
+    x=30,
+    y=30,
     radius=27,
     width=3,
     progress=10,
-    lineColor=0xFFFFFF,
-    progressColor=0x00FF00,
-    backgroundColor=0x000000,
+    outline=0xFFFFFF,
+    fill=0x00FF00,
+    background=0x000000,
 )
 main_group.append(gauge1)
 
 gauge2 = Gauge(
-    xcenter=90,
-    ycenter=30,
+    x=90,
+    y=30,
     radius=27,
     width=8,
     progress=30,
-    lineColor=0xFFFFFF,
-    progressColor=0x00FF00,
-    backgroundColor=0x000000,
+    outline=0xFFFFFF,
+    fill=0x00FF00,
+    background=0x000000,
 )
 main_group.append(gauge2)
 gauge3 = Gauge(
-    xcenter=150,
-    ycenter=30,
+    x=150,
+    y=30,
     radius=27,
     width=10,
     progress=60,
-    lineColor=0xFFFFFF,
-    progressColor=0xFF0000,
-    backgroundColor=0x000000,
+    outline=0xFFFFFF,
+    fill=0xFF0000,
+    background=0x000000,
 )
 main_group.append(gauge3)
 
 gauge4 = Gauge(
-    xcenter=210,
-    ycenter=30,
+    x=210,
+    y=30,
     radius=28,
     width=12,
     progress=0,
-    lineColor=0xFFFFFF,
-    progressColor=0xFF0000,
-    backgroundColor=0x000000,
+    outline=0xFFFFFF,
+    fill=0x00FF00,
+    background=0x000000,
+    zones=[(80, 0xFF0000)],
 )
 main_group.append(gauge4)
 
 
 gauge5 = Gauge(
-    xcenter=120,
-    ycenter=120,
+    x=120,
+    y=120,
     radius=50,
     width=20,
     progress=0,
-    lineColor=0xFFFFFF,
-    progressColor=0x00FF00,
-    backgroundColor=0x000000,
+    outline=0xFFFFFF,
+    fill=0x00FF00,
+    background=0x000000,
+    zones=[(80, 0xFF0000)],
 )
 main_group.append(gauge5)
 
@@ -91,28 +93,14 @@ main_group.append(gauge5)
 
 while True:
 
+    # The fill turns red from 80% on, through the zones given above
     for i in range(0, 101, 4):
-        if i >= 80:
-            gauge4.progressColor = 0xFF0000
-            gauge5.progressColor = 0xFF0000
-        else:
-            gauge4.progressColor = 0x00FF00
-            gauge5.progressColor = 0x00FF00
-
-        gauge4.progress= i
+        gauge4.progress = i
         gauge5.progress = i
         time.sleep(0.1)
 
 
     for i in range(100, 0, -4):
-        if i >= 80:
-            gauge4.progressColor = 0xFF0000
-            gauge5.progressColor = 0xFF0000
-        else:
-            gauge4.progressColor = 0x00FF00
-            gauge5.progressColor = 0x00FF00
-
-        gauge4.progress= i
+        gauge4.progress = i
         gauge5.progress = i
         time.sleep(0.1)
-
@@ -8,7 +8,12 @@
 
 Various common shapes for use with displayio - Gauge shape!
 
-A 270-degree progress gauge for CircuitPython displays.
+An arc progress gauge for CircuitPython displays, 270 degrees by default.
+
+Companion modules build on it: `gauge_animation` tweens gauges from asyncio
+and `gauge_scheduler` batches their updates into paced display refreshes.
+`gauge_binding` feeds a gauge from sensor readings, and `gauge_epaper`
+budgets e-paper refreshes.
 
 * Author(s): Your Name
 
@@ -27,6 +32,10 @@ except ImportError:
     pass
 
 import math
+import os
+import struct
+import time
+from array import array
 import displayio
 import bitmaptools
 
@@ -34,8 +43,1346 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/your_repo/Adafruit_CircuitPython_Display_Shapes.git"
 
 
+# Free RAM in bytes left over after building a sprite sheet
+_SPRITE_SHEET_HEADROOM = 8192
+
+# Maximum number of gauge shapes kept in the geometry cache
+_geometry_cache_size = 4
+_geometry_cache = {}
+_geometry_order = []
+
+# Small ids for (radius, width, start angle, sweep) shapes, for packed cache keys
+_shape_ids = {}
+
+# Pre-rotated needle sprites, keyed by shape id and level packed into one
+# small int, evicted oldest first
+_needle_cache_size = 64
+_needle_cache = {}
+_needle_order = []
+
+# Built-in 5x7 readout font: one 5-bit row mask per line, top to bottom
+_READOUT_FONT = {
+    "0": b"\x0e\x11\x13\x15\x19\x11\x0e",
+    "1": b"\x04\x0c\x04\x04\x04\x04\x0e",
+    "2": b"\x0e\x11\x01\x02\x04\x08\x1f",
+    "3": b"\x1f\x02\x04\x02\x01\x11\x0e",
+    "4": b"\x02\x06\x0a\x12\x1f\x02\x02",
+    "5": b"\x1f\x10\x1e\x01\x01\x11\x0e",
+    "6": b"\x06\x08\x10\x1e\x11\x11\x0e",
+    "7": b"\x1f\x01\x02\x04\x08\x08\x08",
+    "8": b"\x0e\x11\x11\x0e\x11\x11\x0e",
+    "9": b"\x0e\x11\x11\x0f\x01\x02\x0c",
+    "%": b"\x18\x19\x02\x04\x08\x13\x03",
+    ".": b"\x00\x00\x00\x00\x00\x0c\x0c",
+    "-": b"\x00\x00\x00\x1f\x00\x00\x00",
+}
+_READOUT_CHARS = "0123456789%.- "
+# Progress values the readout cells are sized for: both ends and a repeating fraction
+_READOUT_SAMPLES = (0.0, 100.0, 100 / 3)
+
+# Readout glyph cells, by (font, scale, value_count, char), and cell metrics by font
+_glyph_cache = {}
+_font_metrics = {}
+
+# Blank stand-in bitmaps for lazy or released gauges, by (width, height)
+_placeholders = {}
+
+# Cache directories whose version marker was checked this session
+_frame_cache_dirs = set()
+# The subdirectory of a cache_dir that holds the cached frames and their marker
+_FRAME_CACHE_SUBDIR = "gauge_cache"
+
+# Shared fixed-point sine table covering a quarter turn, grown on demand
+_TRIG_SHIFT = 14
+_trig_quarter = 0
+_sine_table = array("h")
+
+
+def _trace_circle(radius: int) -> tuple:
+    """Trace a circle with Bresenham's circle algorithm.
+
+    Instead of plotting pixels, the circle is recorded row by row as the range
+    of ``|dx|`` it covers on each side of the center. The gauge clips these
+    rows to its sweep.
+
+    :return: ``(low, high)``. Row ``dy`` (``-radius`` to ``radius``) covers
+             ``low[dy + radius] <= |dx| <= high[dy + radius]``.
+    """
+    low = [-1] * (2 * radius + 1)
+    high = [-1] * (2 * radius + 1)
+    x = 0
+    y = radius
+    d = 3 - 2 * radius
+
+    while x <= y:
+        # Octants 2 & 3 (top), 7 & 0 (bottom), 5 & 6 (upper sides) and 1 & 4 (lower sides)
+        for dx, dy in ((x, -y), (x, y), (y, -x), (y, x)):
+            row = dy + radius
+            if low[row] < 0 or dx < low[row]:
+                low[row] = dx
+            if dx > high[row]:
+                high[row] = dx
+
+        if d <= 0:
+            d = d + (4 * x) + 6
+        else:
+            d = d + 4 * (x - y) + 10
+            y = y - 1
+        x = x + 1
+    return low, high
+
+
+def _trace_line(x2: int, y2: int) -> list:
+    """Return the pixels of a Bresenham line from the origin to (``x2``, ``y2``), in order."""
+    pixels = []
+    width = abs(x2)
+    height = -abs(y2)
+    step_x = 1 if x2 > 0 else -1
+    step_y = 1 if y2 > 0 else -1
+    error = width + height
+    x = y = 0
+    while True:
+        pixels.append((x, y))
+        if x == x2 and y == y2:
+            return pixels
+        double = 2 * error
+        if double >= height:
+            error += height
+            x += step_x
+        if double <= width:
+            error += width
+            y += step_y
+
+
+def _merge_runs(runs: list) -> list:
+    """Sort inclusive ``(first, last)`` runs and join the ones that overlap or touch."""
+    merged = []
+    for first, last in sorted(runs):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    return merged
+
+
+def _subtract_run(runs: list, first: int, last: int) -> list:
+    """Remove ``first`` to ``last`` from a list of inclusive ``(first, last)`` runs."""
+    result = []
+    for start, stop in runs:
+        if stop < first or start > last:
+            result.append((start, stop))
+            continue
+        if start < first:
+            result.append((start, first - 1))
+        if stop > last:
+            result.append((last + 1, stop))
+    return result
+
+
+def _mirror(first: int, last: int) -> tuple:
+    """Mirror a run right of the center (``|dx|`` from ``first`` to ``last``) to both sides.
+
+    :return: The resulting runs as inclusive ``(first, last)`` dx pairs, left to right.
+    """
+    if first == 0:
+        return ((-last, last),)
+    return ((-last, -first), (first, last))
+
+
+def _ensure_trig_resolution(quarter: int) -> int:
+    """Grow the shared sine table to at least ``quarter`` entries per right angle.
+
+    Entry ``i`` holds ``sin(i * 90 / quarter degrees)`` scaled by ``2 ** _TRIG_SHIFT``.
+    Sizes are powers of two, so every smaller resolution stays an exact stride
+    of the table and rays do not depend on which gauges were built before.
+
+    :return: ``quarter`` rounded up to a power of two.
+    """
+    global _trig_quarter, _sine_table  # pylint: disable=global-statement
+    resolution = 1
+    while resolution < quarter:
+        resolution <<= 1
+    quarter = resolution
+    if quarter <= _trig_quarter:
+        return resolution
+    scale = 1 << _TRIG_SHIFT
+    _sine_table = array(
+        "h", [int(round(math.sin(i * math.pi / 2 / quarter) * scale)) for i in range(quarter + 1)]
+    )
+    _trig_quarter = quarter
+    return resolution
+
+
+def _fixed_sin(angle: int) -> int:
+    """Look up the fixed-point sine of ``angle``, in table steps of a quarter turn.
+
+    Integer-only and allocation-free. The cosine is ``_fixed_sin(angle + _trig_quarter)``.
+    """
+    quarter = _trig_quarter
+    angle %= 4 * quarter
+    if angle < quarter:
+        return _sine_table[angle]
+    if angle < 2 * quarter:
+        return _sine_table[2 * quarter - angle]
+    if angle < 3 * quarter:
+        return -_sine_table[angle - 2 * quarter]
+    return -_sine_table[4 * quarter - angle]
+
+
+def _fixed_sin_cos(angle: int) -> tuple:
+    """Look up the fixed-point (sine, cosine) of ``angle``, in table steps of a quarter turn."""
+    return _fixed_sin(angle), _fixed_sin(angle + _trig_quarter)
+
+
+def _draw_index_levels(
+    bitmap, geometry, left: int, top: int, old: int, new: int, color: int = 2
+) -> None:
+    """Recolor a gauge's angular buckets between levels ``old`` and ``new``.
+
+    Growing progress is painted with ``color``, shrinking progress is cleared.
+    The gauge frame sits at (``left``, ``top``) inside ``bitmap``.
+    """
+    offsets, pixels = geometry.angle_index()
+    if new > old:
+        start, stop = offsets[old], offsets[new]
+    else:
+        start, stop, color = offsets[new], offsets[old], 0
+    bitmap_width = geometry.bitmap_width
+    # Linear indices avoid building an (x, y) tuple per pixel
+    stride = bitmap.width
+    if left == top == 0 and stride == bitmap_width:
+        for i in range(start, stop):
+            bitmap[pixels[i]] = color
+        return
+    for i in range(start, stop):
+        index = pixels[i]
+        bitmap[(top + index // bitmap_width) * stride + left + index % bitmap_width] = color
+
+
+def _span_cut(
+    geometry, level: int, sine: int, cosine: int, dy: int, first: int, last: int
+) -> int:
+    """Count the pixels of one ring span that ``level`` fills.
+
+    The span covers dx offsets ``first`` to ``last`` on row ``dy``, relative to
+    the center. Spans lie inside the sweep and never cross the start ray, and
+    progress runs clockwise, so rows above the center fill from the left end of
+    the span and rows below it from the right end. A pixel is filled when it
+    lies on the start side of the progress ray, which takes integer cross
+    products against the start ray and the progress ray's fixed-point ``sine``
+    and ``cosine``.
+    """
+    count = last - first + 1
+    if level <= 0:
+        return 0
+    if level >= geometry.steps:
+        return count
+    # The pixel at the filled end decides whether the span is reached at all
+    x = first if dy <= 0 else last
+    before_ray = x * cosine > dy * sine
+    before_start = x * geometry.start_cosine > dy * geometry.start_sine
+    if level <= geometry.half_turn:
+        filled = before_ray and not before_start
+    else:
+        # Past half a turn only the gap between the rays is still empty
+        filled = before_ray or not before_start
+    if not filled:
+        return 0
+    if dy < 0 and cosine < 0:
+        # The ray crosses this row: filled while dx * cosine > dy * sine
+        cut = (-dy * sine - 1) // -cosine
+        reached = cut - first + 1
+    elif dy > 0 and cosine > 0:
+        # The ray crosses this row: filled from dx * cosine > dy * sine on
+        cut = dy * sine // cosine + 1
+        reached = last - cut + 1
+    else:
+        return count
+    # A crossing outside the span lies in a part of the row the sweep reaches earlier
+    return min(count, reached) if reached > 0 else count
+
+
+def _draw_span_levels(
+    bitmap, geometry, left: int, top: int, old: int, new: int, color: int = 2
+) -> int:
+    """Fill (with ``color``) or clear the ring sector between levels ``old`` and ``new``.
+
+    Each affected ring span is clipped against both progress rays and the part
+    between them is written with a single `_fill_region`. The gauge frame sits
+    at (``left``, ``top``) inside ``bitmap``. Integer-only, and allocates
+    nothing on the heap.
+
+    :return: The number of pixels written.
+    """
+    if new == old:
+        return 0
+    if new > old:
+        low, high = old, new
+    else:
+        low, high, color = new, old, 0
+    radius = geometry.radius
+    inner_radius = geometry.inner_radius
+    center_x = geometry.center_x
+    center_y = geometry.center_y
+    rows = geometry.ring_rows
+    spans = geometry.ring_spans
+    quarter = _trig_quarter
+    low_angle = geometry.ray_angle(low)
+    high_angle = geometry.ray_angle(high)
+    low_sine = _fixed_sin(low_angle)
+    low_cosine = _fixed_sin(low_angle + quarter)
+    high_sine = _fixed_sin(high_angle)
+    high_cosine = _fixed_sin(high_angle + quarter)
+
+    # Only visit the rows between where the two rays cross the ring
+    low_outer = (low_cosine * radius) >> _TRIG_SHIFT
+    low_inner = (low_cosine * inner_radius) >> _TRIG_SHIFT
+    high_outer = (high_cosine * radius) >> _TRIG_SHIFT
+    high_inner = (high_cosine * inner_radius) >> _TRIG_SHIFT
+    axes = geometry.axis_turns
+    low_turn = low * geometry.sweep
+    high_turn = high * geometry.sweep
+    if low_turn < axes[2] < high_turn:
+        # The ring's top row lies between the two rays once they straddle straight up
+        first_row = center_y - radius
+    else:
+        first_row = center_y + min(low_outer, low_inner, high_outer, high_inner) - 1
+    if low_turn < axes[0] < high_turn:
+        last_row = center_y + radius
+    else:
+        last_row = center_y + max(low_outer, low_inner, high_outer, high_inner) + 1
+    written = 0
+    for y in range(max(0, first_row), min(geometry.bitmap_height - 1, last_row) + 1):
+        dy = y - center_y
+        for i in range(rows[y], rows[y + 1]):
+            start = spans[2 * i]
+            stop = spans[2 * i + 1]
+            low_cut = _span_cut(
+                geometry, low, low_sine, low_cosine, dy, start - center_x, stop - center_x - 1
+            )
+            high_cut = _span_cut(
+                geometry, high, high_sine, high_cosine, dy, start - center_x, stop - center_x - 1
+            )
+            if high_cut == low_cut:
+                continue
+            if dy <= 0:
+                x1, x2 = start + low_cut, start + high_cut
+            else:
+                x1, x2 = stop - high_cut, stop - low_cut
+            _fill_region(bitmap, left + x1, top + y, left + x2, top + y + 1, color)
+            written += x2 - x1
+    return written
+
+
+def _zeros(typecode: str, length: int) -> array:
+    """Allocate a zeroed ``H`` (16-bit) or ``I`` (32-bit) array."""
+    return array(typecode, bytes(length * (2 if typecode == "H" else 4)))
+
+
+class _TiledBitmap:
+    """Drawing surface for a gauge split into square tiles, only some of them stored.
+
+    Only the tiles the outline or ring passes through get their own storage in
+    the ``bitmap`` atlas. Every other cell of the tile map points at the shared
+    blank tile 0. Pixels are addressed in frame coordinates, as in a full gauge
+    bitmap, and writes that land on the blank tile are dropped.
+
+    The atlas ``bitmap`` is attached by the gauge once it allocates it, and
+    its size is given by ``atlas_size``.
+
+    :param _GaugeGeometry geometry: The gauge shape.
+    :param int tile_size: The tile edge length in pixels.
+    """
+
+    def __init__(self, geometry, tile_size: int) -> None:
+        self.width = geometry.bitmap_width
+        self.height = geometry.bitmap_height
+        self.tile_size = tile_size
+        self.columns = (self.width + tile_size - 1) // tile_size
+        self.rows = (self.height + tile_size - 1) // tile_size
+
+        # Flag the cells any outline or ring span passes through
+        used = bytearray(self.columns * self.rows)
+        spans = geometry.outline_spans
+        for i in range(0, len(spans), 3):
+            self._mark(used, spans[i], spans[i + 1], spans[i + 2])
+        spans = geometry.ring_spans
+        for y in range(self.height):
+            for i in range(geometry.ring_rows[y], geometry.ring_rows[y + 1]):
+                self._mark(used, y, spans[2 * i], spans[2 * i + 1])
+
+        self.tiles = _zeros("H", len(used))
+        """The atlas tile shown in each cell, row by row, with 0 for blank cells."""
+        count = 1
+        for cell, flag in enumerate(used):
+            if flag:
+                self.tiles[cell] = count
+                count += 1
+        self.atlas_columns, atlas_rows = _sheet_layout(count)
+        self.atlas_size = (self.atlas_columns * tile_size, atlas_rows * tile_size)
+        self.atlas_width = self.atlas_size[0]
+        self.bitmap = None
+
+    def _mark(self, used: bytearray, y: int, start: int, stop: int) -> None:
+        row = y // self.tile_size * self.columns
+        for column in range(start // self.tile_size, (stop - 1) // self.tile_size + 1):
+            used[row + column] = 1
+
+    def __getitem__(self, index) -> int:
+        if isinstance(index, int):
+            x = index % self.width
+            y = index // self.width
+        else:
+            x, y = index
+        size = self.tile_size
+        tile = self.tiles[y // size * self.columns + x // size]
+        return self.bitmap[
+            (tile // self.atlas_columns * size + y % size) * self.atlas_width
+            + tile % self.atlas_columns * size + x % size
+        ]
+
+    def __setitem__(self, index, value: int) -> None:
+        if isinstance(index, int):
+            x = index % self.width
+            y = index // self.width
+        else:
+            x, y = index
+        size = self.tile_size
+        tile = self.tiles[y // size * self.columns + x // size]
+        if tile:
+            # A linear index keeps per-pixel writes free of (x, y) tuples
+            self.bitmap[
+                (tile // self.atlas_columns * size + y % size) * self.atlas_width
+                + tile % self.atlas_columns * size + x % size
+            ] = value
+
+    def fill_region(self, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        """Fill the frame rectangle from (x1, y1) up to (x2, y2), one tile at a time."""
+        if x1 >= x2 or y1 >= y2:
+            return
+        size = self.tile_size
+        for row in range(y1 // size, (y2 - 1) // size + 1):
+            top = row * size
+            for column in range(x1 // size, (x2 - 1) // size + 1):
+                tile = self.tiles[row * self.columns + column]
+                if not tile:
+                    continue
+                left = column * size
+                # Offset from frame coordinates to the tile's place in the atlas
+                dx = tile % self.atlas_columns * size - left
+                dy = tile // self.atlas_columns * size - top
+                bitmaptools.fill_region(
+                    self.bitmap,
+                    max(x1, left) + dx, max(y1, top) + dy,
+                    min(x2, left + size) + dx, min(y2, top + size) + dy,
+                    value
+                )
+
+
+def _fill_region(bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    """Call ``bitmaptools.fill_region``, going through the tile map of a `_TiledBitmap`."""
+    if isinstance(bitmap, _TiledBitmap):
+        bitmap.fill_region(x1, y1, x2, y2, value)
+    else:
+        bitmaptools.fill_region(bitmap, x1, y1, x2, y2, value)
+
+
+class _GaugeGeometry:
+    """Outline geometry shared by every gauge with the same shape.
+
+    The ring is stored as horizontal spans, one list for the outline and one
+    for the interior that progress fills, so drawing needs neither per-pixel
+    writes nor a flood fill. The bitmap covers exactly the pixels of the
+    outline, and the center sits at (``center_x``, ``center_y``) in it, which
+    may lie outside the bitmap for short sweeps.
+
+    :param int radius: The radius of the gauge.
+    :param int width: The width of the gauge arc.
+    :param bool cached: Whether to keep the empty outline in ``base`` once it is rendered.
+    :param int start_angle: The direction of 0% progress, in degrees counterclockwise
+                            from straight down.
+    :param int sweep: The degrees the arc spans clockwise from ``start_angle``.
+    :param bool hub: Also cover the 3x3 pixels around the center, where a needle pivots.
+    """
+
+    def __init__(
+        self,
+        radius: int,
+        width: int,
+        cached: bool = True,
+        start_angle: int = 315,
+        sweep: int = 270,
+        hub: bool = False,
+    ) -> None:
+        self.radius = radius
+        self.width = width
+        self.inner_radius = max(0, radius - width + 1)
+        self.start_angle = start_angle
+        self.sweep = sweep
+        self.shape_id = _shape_ids.setdefault((radius, width, start_angle, sweep), len(_shape_ids))
+        self.outline_spans = array("H")
+        """Outline spans as ``(y, x start, x stop)`` triples, ``x stop`` exclusive."""
+        self.ring_spans = array("H")
+        """Interior spans as ``(x start, x stop)`` pairs, ordered by row."""
+        self.cached = cached
+        self.base = None
+        # One angular bucket per pixel along the outer arc
+        self.steps = max(1, math.ceil(math.pi * radius * sweep / 180))
+        self._angle_index = None
+        # Six or more table entries per angular bucket keep every ray well within a pixel
+        self.trig_resolution = _ensure_trig_resolution(-(-540 * self.steps // sweep))
+        # Ray angles per level in trig_resolution steps, worked out once because
+        # the products behind them outgrow small ints on large gauges
+        resolution = self.trig_resolution
+        steps = self.steps
+        self._ray_angles = array("i", [
+            (2 * resolution * (start_angle * steps - level * sweep) + 90 * steps) // (180 * steps)
+            for level in range(steps + 1)
+        ])
+        self.start_sine, self.start_cosine = self.direction(0)
+        self.end_sine, self.end_cosine = self.direction(self.steps)
+        # The last level whose ray is at most half a turn from the start
+        self.half_turn = 180 * self.steps // sweep
+        # Where the ray points down, right, up and left, as level * sweep, or -1 outside the sweep
+        self.axis_turns = array("i", [-1] * 4)
+        for i, angle in enumerate((0, 90, 180, 270)):
+            turn = (start_angle - angle) % 360
+            if turn <= sweep:
+                self.axis_turns[i] = turn * self.steps
+        self._build_spans(hub)
+
+    def in_sector(self, x: int, y: int) -> bool:
+        """Check whether the pixel at offset (``x``, ``y``) from the center lies in the sweep."""
+        before_start = x * self.start_cosine > y * self.start_sine
+        past_end = x * self.end_cosine < y * self.end_sine
+        if self.sweep <= 180:
+            return not before_start and not past_end
+        return not (before_start and past_end)
+
+    def _clip_run(self, dy: int, first: int, last: int) -> list:
+        """Clip the dx offsets ``first`` to ``last`` on row ``dy`` to the sweep.
+
+        Pixels change sides only where the start or end ray crosses the row, so
+        one test per piece between crossings is enough. A full circle is split
+        at the start ray instead, which the fill must not cross.
+
+        :return: The inclusive ``(first, last)`` runs inside the sweep.
+        """
+        full = self.sweep >= 360
+        breaks = [first]
+        rays = ((self.start_sine, self.start_cosine), (self.end_sine, self.end_cosine))
+        for sine, cosine in rays[:1] if full else rays:
+            if dy == 0:
+                cut = 0
+            elif cosine != 0 and (cosine < 0) == (dy < 0):
+                cut = dy * sine // cosine
+            else:
+                continue
+            for x in (cut, cut + 1):
+                if first < x <= last:
+                    breaks.append(x)
+        breaks.sort()
+
+        runs = []
+        previous = None
+        for i, x in enumerate(breaks):
+            stop = breaks[i + 1] - 1 if i + 1 < len(breaks) else last
+            if stop < x:
+                continue
+            if full:
+                side = x * self.start_cosine > dy * self.start_sine
+            elif self.in_sector(x, dy):
+                side = True
+            else:
+                previous = None
+                continue
+            if runs and side == previous:
+                runs[-1] = (runs[-1][0], stop)
+            else:
+                runs.append((x, stop))
+            previous = side
+        return runs
+
+    def _closing_line(self, level: int, outer: tuple, inner: tuple) -> list:
+        """Trace the straight edge of the ring along the ray at ``level``.
+
+        The line runs along the ray from the inner arc to the outer arc. Where
+        it passes between two inner arc pixels, it starts one pixel early to
+        close the corner.
+
+        :param tuple outer: The outer circle rows, from `_trace_circle`.
+        :param tuple inner: The inner circle rows, from `_trace_circle`.
+        :return: ``(dy, first, last)`` dx runs relative to the center.
+        """
+        radius = self.radius
+        inner_radius = self.inner_radius
+        sine, cosine = self.direction(level)
+        half = 1 << (_TRIG_SHIFT - 1)
+        pixels = _trace_line(
+            (sine * (radius + 1) + half) >> _TRIG_SHIFT,
+            (cosine * (radius + 1) + half) >> _TRIG_SHIFT,
+        )
+
+        def in_ring(x, y):
+            if abs(y) > radius or abs(x) > outer[1][y + radius]:
+                return False
+            return abs(y) > inner_radius or abs(x) >= inner[0][y + inner_radius]
+
+        entry = 0
+        while entry < len(pixels) and not in_ring(*pixels[entry]):
+            entry += 1
+        if entry == len(pixels):
+            return []
+        first = entry
+        x, y = pixels[entry]
+        if entry and not (abs(y) <= inner_radius and abs(x) <= inner[1][y + inner_radius]):
+            first -= 1
+        rows = {}
+        for i in range(first, len(pixels)):
+            x, y = pixels[i]
+            if i > entry and not in_ring(x, y):
+                break
+            if y in rows:
+                rows[y][0] = min(rows[y][0], x)
+                rows[y][1] = max(rows[y][1], x)
+            else:
+                rows[y] = [x, x]
+        return [(y, run[0], run[1]) for y, run in rows.items()]
+
+    def _build_spans(self, hub: bool) -> None:
+        radius = self.radius
+        inner_radius = self.inner_radius
+        outer = _trace_circle(radius)
+        inner = _trace_circle(inner_radius)
+
+        # The straight edges along the start and end rays
+        edges = {}
+        for level in (0,) if self.sweep >= 360 else (0, self.steps):
+            for dy, first, last in self._closing_line(level, outer, inner):
+                edges.setdefault(dy, []).append((first, last))
+
+        # Clip each row of the full ring to the sweep, as dx runs relative to the center
+        rows = []
+        left = top = radius + 1
+        right = bottom = -radius - 1
+        for dy in range(-radius, radius + 1):
+            # Runs right of the center as |dx| ranges: the inner arc, then the outer arc
+            arc = [outer[0][dy + radius], outer[1][dy + radius]]
+            hole = None
+            if -inner_radius <= dy <= inner_radius:
+                hole = [inner[0][dy + inner_radius], inner[1][dy + inner_radius]]
+            if hole is None:
+                arcs = (arc,)
+                interior = (0, arc[0] - 1)
+            elif hole[1] + 1 >= arc[0]:
+                arcs = ([hole[0], arc[1]],)
+                interior = None
+            else:
+                arcs = (hole, arc)
+                interior = (hole[1] + 1, arc[0] - 1)
+
+            outline = list(edges.get(dy, ()))
+            for run in arcs:
+                for first, last in _mirror(run[0], run[1]):
+                    outline.extend(self._clip_run(dy, first, last))
+            ring = []
+            if interior is not None and interior[0] <= interior[1]:
+                for first, last in _mirror(interior[0], interior[1]):
+                    ring.extend(self._clip_run(dy, first, last))
+            for first, last in edges.get(dy, ()):
+                ring = _subtract_run(ring, first, last)
+            outline = _merge_runs(outline)
+            rows.append((outline, ring))
+            for first, last in outline + ring:
+                left = min(left, first)
+                right = max(right, last)
+                top = min(top, dy)
+                bottom = max(bottom, dy)
+
+        # The bitmap is the bounding box of the outline, plus the hub if asked for
+        self.contains_hub = left <= -1 and top <= -1 and right >= 1 and bottom >= 1
+        if hub:
+            left = min(left, -1)
+            top = min(top, -1)
+            right = max(right, 1)
+            bottom = max(bottom, 1)
+        self.center_x = -left
+        self.center_y = -top
+        self.bitmap_width = right - left + 1
+        self.bitmap_height = bottom - top + 1
+        self.ring_rows = _zeros("H", self.bitmap_height + 1)
+        """Row ``y`` owns interior spans ``ring_rows[y]`` up to ``ring_rows[y + 1]``."""
+        self.outline_pixels = 0
+        """The number of pixels the outline covers."""
+        for y in range(self.bitmap_height):
+            dy = y + top
+            if -radius <= dy <= radius:
+                outline, ring = rows[dy + radius]
+                for first, last in outline:
+                    self.outline_spans.extend((y, first - left, last - left + 1))
+                    self.outline_pixels += last - first + 1
+                for first, last in sorted(ring):
+                    self.ring_spans.extend((first - left, last - left + 1))
+            self.ring_rows[y + 1] = len(self.ring_spans) // 2
+
+    def draw_outline(self, bitmap) -> None:
+        """Rasterize the empty gauge outline into a cleared bitmap."""
+        spans = self.outline_spans
+        for i in range(0, len(spans), 3):
+            y = spans[i]
+            _fill_region(bitmap, spans[i + 1], y, spans[i + 2], y + 1, 1)
+
+    def level(self, progress: float) -> int:
+        """Convert a progress percentage to the nearest number of filled angular buckets."""
+        return int(progress * self.steps / 100 + 0.5)
+
+    def filled_pixels(self, level: int) -> int:
+        """Count the ring pixels `_draw_span_levels` fills from level 0 up to ``level``."""
+        center_x = self.center_x
+        center_y = self.center_y
+        rows = self.ring_rows
+        spans = self.ring_spans
+        angle = self.ray_angle(level)
+        sine = _fixed_sin(angle)
+        cosine = _fixed_sin(angle + _trig_quarter)
+        count = 0
+        for y in range(self.bitmap_height):
+            dy = y - center_y
+            for i in range(rows[y], rows[y + 1]):
+                count += _span_cut(
+                    self, level, sine, cosine, dy,
+                    spans[2 * i] - center_x, spans[2 * i + 1] - center_x - 1
+                )
+        return count
+
+    def ray_angle(self, level: int) -> int:
+        """Return the progress ray at ``level`` as an angle in shared sine table steps.
+
+        The ray points at ``start_angle - level * sweep / steps`` degrees, which
+        is ``(start_angle * steps - level * sweep) / (90 * steps)`` quarter turns,
+        rounded to the nearest of ``trig_resolution`` steps per quarter turn.
+        The table may have grown since, so the angle is scaled to its stride.
+        """
+        return self._ray_angles[level] * (_trig_quarter // self.trig_resolution)
+
+    def direction(self, level: int) -> tuple:
+        """Return the progress ray at ``level`` as a fixed-point (sine, cosine) pair."""
+        return _fixed_sin_cos(self.ray_angle(level))
+
+    def sector_box(self, low: int, high: int, box: array) -> None:
+        """Store the bitmap rectangle around the ring between levels ``low`` and ``high``.
+
+        ``box`` receives ``x1, y1, x2, y2``, with ``x2`` and ``y2`` exclusive. The
+        rectangle spans the ray ends on both ring edges, widened to the ring's
+        extreme in every direction the sector passes, plus a pixel of rounding
+        margin.
+        """
+        radius = self.radius
+        inner_radius = self.inner_radius
+        quarter = _trig_quarter
+        low_angle = self.ray_angle(low)
+        high_angle = self.ray_angle(high)
+        low_sine = _fixed_sin(low_angle)
+        low_cosine = _fixed_sin(low_angle + quarter)
+        high_sine = _fixed_sin(high_angle)
+        high_cosine = _fixed_sin(high_angle + quarter)
+        x_values = (
+            (low_sine * radius) >> _TRIG_SHIFT, (low_sine * inner_radius) >> _TRIG_SHIFT,
+            (high_sine * radius) >> _TRIG_SHIFT, (high_sine * inner_radius) >> _TRIG_SHIFT,
+        )
+        y_values = (
+            (low_cosine * radius) >> _TRIG_SHIFT, (low_cosine * inner_radius) >> _TRIG_SHIFT,
+            (high_cosine * radius) >> _TRIG_SHIFT, (high_cosine * inner_radius) >> _TRIG_SHIFT,
+        )
+        axes = self.axis_turns
+        low_turn = low * self.sweep
+        high_turn = high * self.sweep
+        x1 = -radius if low_turn < axes[3] < high_turn else min(x_values) - 1
+        x2 = radius if low_turn < axes[1] < high_turn else max(x_values) + 1
+        y1 = -radius if low_turn < axes[2] < high_turn else min(y_values) - 1
+        y2 = radius if low_turn < axes[0] < high_turn else max(y_values) + 1
+        box[0] = max(0, self.center_x + x1)
+        box[1] = max(0, self.center_y + y1)
+        box[2] = min(self.bitmap_width, self.center_x + x2 + 1)
+        box[3] = min(self.bitmap_height, self.center_y + y2 + 1)
+
+    def base_frame(self) -> displayio.Bitmap:
+        """Return the empty-outline bitmap, rendering it on first use.
+
+        Uncached geometries render a fresh bitmap on every call.
+        """
+        if self.base is not None:
+            return self.base
+        bitmap = displayio.Bitmap(self.bitmap_width, self.bitmap_height, 3)
+        self.draw_outline(bitmap)
+        if self.cached:
+            self.base = bitmap
+        return bitmap
+
+    def angle_index(self) -> tuple:
+        """Return the ring pixels sorted into angular buckets.
+
+        Bucket ``k`` holds the pixels whose progress lies between
+        ``k * 100 / steps`` and ``(k + 1) * 100 / steps``. The result is a
+        ``(offsets, pixels)`` pair: ``pixels`` holds linear bitmap indices
+        ordered by bucket and bucket ``k`` spans
+        ``pixels[offsets[k]:offsets[k + 1]]``. It is built once per geometry.
+        """
+        if self._angle_index is None:
+            self._angle_index = self._build_angle_index()
+        return self._angle_index
+
+    def _build_angle_index(self) -> tuple:
+        center_x = self.center_x
+        center_y = self.center_y
+        bitmap_width = self.bitmap_width
+        bitmap_height = self.bitmap_height
+        steps = self.steps
+        typecode = "H" if bitmap_width * bitmap_height <= 0x10000 else "I"
+
+        # The ring interior, the same region progress covers at 100%
+        ring = array(typecode)
+        spans = self.ring_spans
+        for y in range(bitmap_height):
+            for i in range(self.ring_rows[y], self.ring_rows[y + 1]):
+                for x in range(spans[2 * i], spans[2 * i + 1]):
+                    ring.append(y * bitmap_width + x)
+
+        # Bucket every pixel by the first level whose `_span_cut` reaches it,
+        # so indexed drawing fills exactly the pixels span clipping fills
+        quarter = _trig_quarter
+        buckets = _zeros("H", len(ring))
+        counts = _zeros("I", steps + 1)
+        position = 0
+        for y in range(bitmap_height):
+            dy = y - center_y
+            for i in range(self.ring_rows[y], self.ring_rows[y + 1]):
+                first = spans[2 * i] - center_x
+                last = spans[2 * i + 1] - center_x - 1
+                count = last - first + 1
+                level = 1
+                for k in range(count):
+                    # Pixels further from the filled end are reached no earlier
+                    low, high = level, steps
+                    while low < high:
+                        middle = (low + high) // 2
+                        angle = self.ray_angle(middle)
+                        cut = _span_cut(
+                            self, middle, _fixed_sin(angle), _fixed_sin(angle + quarter),
+                            dy, first, last
+                        )
+                        if cut > k:
+                            high = middle
+                        else:
+                            low = middle + 1
+                    level = low
+                    # Rows below the center fill from the right end of the span
+                    bucket = level - 1
+                    buckets[position + (k if dy <= 0 else count - 1 - k)] = bucket
+                    counts[bucket + 1] += 1
+                position += count
+
+        # Counting sort into bucket order
+        for k in range(steps):
+            counts[k + 1] += counts[k]
+        offsets = array("I", counts)
+        pixels = _zeros(typecode, len(ring))
+        for i, index in enumerate(ring):
+            bucket = buckets[i]
+            pixels[counts[bucket]] = index
+            counts[bucket] += 1
+        return offsets, pixels
+
+
+def _get_geometry(
+    radius: int, width: int, start_angle: int = 315, sweep: int = 270, hub: bool = False
+) -> _GaugeGeometry:
+    """Return the cached geometry for a gauge shape, building it on first use.
+
+    Needle gauges ask for the ``hub``. Shapes whose outline already covers it
+    share a single geometry, and base frame, between needle and fill gauges.
+    """
+    key = (radius, width, start_angle, sweep, False)
+    hub_key = (radius, width, start_angle, sweep, True)
+    for candidate in (key, hub_key) if hub else (key,):
+        geometry = _geometry_cache.get(candidate)
+        if geometry is not None and (not hub or candidate[4] or geometry.contains_hub):
+            # Keep recently used shapes at the end of the eviction order
+            _geometry_order.remove(candidate)
+            _geometry_order.append(candidate)
+            return geometry
+
+    if _geometry_cache_size <= 0:
+        return _GaugeGeometry(radius, width, False, start_angle, sweep, hub)
+
+    while len(_geometry_order) >= _geometry_cache_size:
+        del _geometry_cache[_geometry_order.pop(0)]
+    geometry = _GaugeGeometry(radius, width, True, start_angle, sweep, hub)
+    if hub and not geometry.contains_hub:
+        key = hub_key
+    _geometry_cache[key] = geometry
+    _geometry_order.append(key)
+    return geometry
+
+
+def set_geometry_cache_size(size: int) -> None:
+    """Set how many gauge shapes keep their geometry and base frame cached.
+
+    Gauges created with a cached shape copy the pre-rendered outline instead
+    of rasterizing it. Each entry holds one empty-outline bitmap, so
+    lower the size (or set it to 0 to disable caching) on boards short of RAM.
+
+    :param int size: The maximum number of cached shapes.
+    """
+    global _geometry_cache_size  # pylint: disable=global-statement
+    _geometry_cache_size = max(0, size)
+    while len(_geometry_order) > _geometry_cache_size:
+        del _geometry_cache[_geometry_order.pop(0)]
+
+
+def clear_geometry_cache() -> None:
+    """Drop every cached gauge geometry and base frame."""
+    _geometry_cache.clear()
+    del _geometry_order[:]
+
+
+def _needle_length(radius: int, width: int) -> int:
+    """Return the needle length that puts its tip in the middle of the arc."""
+    return max(1, radius - width // 2 - 1)
+
+
+def _build_needle(geometry: _GaugeGeometry, level: int) -> tuple:
+    """Rasterize the needle pointing at ``level`` into its own small bitmap.
+
+    :return: ``(sprite, left, top)``. ``sprite`` holds the needle as value 2 on
+             a transparent 0 background. ``left`` and ``top`` place it relative
+             to the gauge center.
+    """
+    length = _needle_length(geometry.radius, geometry.width)
+    sine, cosine = geometry.direction(level)
+    half = 1 << (_TRIG_SHIFT - 1)
+    tip_x = (sine * length + half) >> _TRIG_SHIFT
+    tip_y = (cosine * length + half) >> _TRIG_SHIFT
+    # A 3x3 hub covers the center
+    left = min(-1, tip_x)
+    top = min(-1, tip_y)
+    sprite = displayio.Bitmap(max(1, tip_x) - left + 1, max(1, tip_y) - top + 1, 3)
+    bitmaptools.fill_region(sprite, -1 - left, -1 - top, 2 - left, 2 - top, 2)
+    bitmaptools.draw_line(sprite, -left, -top, tip_x - left, tip_y - top, 2)
+    return sprite, left, top
+
+
+def _get_needle(geometry: _GaugeGeometry, level: int) -> tuple:
+    """Return the cached needle sprite for ``level``, rasterizing it on first use."""
+    # A packed int key, unlike a tuple, costs no allocation on a hit
+    key = (geometry.shape_id << 16) | level
+    needle = _needle_cache.get(key)
+    if needle is not None:
+        _needle_order.remove(key)
+        _needle_order.append(key)
+        return needle
+
+    needle = _build_needle(geometry, level)
+    if _needle_cache_size > 0:
+        while len(_needle_order) >= _needle_cache_size:
+            del _needle_cache[_needle_order.pop(0)]
+        _needle_cache[key] = needle
+        _needle_order.append(key)
+    return needle
+
+
+def set_needle_cache_size(size: int) -> None:
+    """Set how many needle sprites are kept for reuse across updates and gauges.
+
+    Each entry is a bitmap about the size of the needle's bounding box. Needles
+    that sweep back and forth over a range hit the cache when it holds that
+    range. 0 disables caching, so every update rasterizes its needle.
+
+    :param int size: The maximum number of cached sprites.
+    """
+    global _needle_cache_size  # pylint: disable=global-statement
+    _needle_cache_size = max(0, size)
+    while len(_needle_order) > _needle_cache_size:
+        del _needle_cache[_needle_order.pop(0)]
+
+
+def clear_needle_cache() -> None:
+    """Drop every cached needle sprite."""
+    _needle_cache.clear()
+    del _needle_order[:]
+
+
+def _readout_metrics(font) -> tuple:
+    """Return the ``(cell_width, cell_height, baseline)`` of a readout font, unscaled.
+
+    ``None`` is the built-in 5x7 font. Other fonts are ``adafruit_bitmap_font``
+    fonts, whose cells are as wide as the widest advance among the readout
+    characters and as tall as the font's bounding box.
+    """
+    if font is None:
+        return 6, 7, 7
+    metrics = _font_metrics.get(font)
+    if metrics is None:
+        if hasattr(font, "load_glyphs"):
+            font.load_glyphs(_READOUT_CHARS)
+        _, height, _, y_offset = font.get_bounding_box()[:4]
+        advance = 1
+        for char in _READOUT_CHARS:
+            glyph = font.get_glyph(ord(char))
+            if glyph is not None:
+                advance = max(advance, glyph.shift_x)
+        metrics = _font_metrics[font] = (advance, height, height + y_offset)
+    return metrics
+
+
+def _get_glyph(font, scale: int, value_count: int, char: str) -> displayio.Bitmap:
+    """Return the readout cell for ``char``, rasterizing it on first use.
+
+    Cells are opaque: ink is value 1 (the outline color) on value 0, so a blit
+    replaces whatever the previous character left. They are shared by every
+    gauge with the same font, scale and bitmap depth.
+    """
+    key = (font, scale, value_count, char)
+    cell = _glyph_cache.get(key)
+    if cell is not None:
+        return cell
+
+    cell_width, cell_height, baseline = _readout_metrics(font)
+    cell = displayio.Bitmap(cell_width * scale, cell_height * scale, value_count)
+    if font is None:
+        rows = _READOUT_FONT.get(char, b"")
+        for y, mask in enumerate(rows):
+            for x in range(5):
+                if mask & (0x10 >> x):
+                    bitmaptools.fill_region(
+                        cell, x * scale, y * scale, (x + 1) * scale, (y + 1) * scale, 1
+                    )
+    else:
+        glyph = font.get_glyph(ord(char)) if char != " " else None
+        if glyph is not None:
+            left = glyph.dx
+            top = baseline - glyph.dy - glyph.height
+            for y in range(glyph.height):
+                for x in range(glyph.width):
+                    cell_x = left + x
+                    cell_y = top + y
+                    if (
+                        glyph.bitmap[x, y]
+                        and 0 <= cell_x < cell_width
+                        and 0 <= cell_y < cell_height
+                    ):
+                        bitmaptools.fill_region(
+                            cell, cell_x * scale, cell_y * scale,
+                            (cell_x + 1) * scale, (cell_y + 1) * scale, 1
+                        )
+    _glyph_cache[key] = cell
+    return cell
+
+
+def clear_glyph_cache() -> None:
+    """Drop every cached readout glyph, such as after unloading a font."""
+    _glyph_cache.clear()
+    _font_metrics.clear()
+
+
+def _placeholder(width: int, height: int) -> displayio.Bitmap:
+    """Return the shared one-bit bitmap that unrendered gauges of this size display."""
+    key = (width, height)
+    bitmap = _placeholders.get(key)
+    if bitmap is None:
+        bitmap = _placeholders[key] = displayio.Bitmap(width, height, 1)
+    return bitmap
+
+
+def _sheet_layout(frames: int) -> tuple:
+    """Return the (columns, rows) grid used to lay out ``frames`` sprite frames."""
+    columns = math.ceil(math.sqrt(frames))
+    return columns, math.ceil(frames / columns)
+
+
+def _bits_per_value(value_count: int) -> int:
+    """Return the bits per pixel ``displayio.Bitmap`` uses for ``value_count`` values."""
+    bits = 1
+    while 1 << bits < value_count:
+        bits *= 2
+    return bits
+
+
+def sprite_sheet_size(
+    radius: int,
+    steps: int,
+    value_count: int = 3,
+    *,
+    width: Optional[int] = None,
+    start_angle: int = 315,
+    sweep: int = 270,
+) -> int:
+    """Estimate the RAM in bytes a pre-rendered sprite sheet needs.
+
+    The sheet holds ``steps + 1`` frames (0% to 100%) at two bits per pixel
+    (four with more than four palette indices, see ``segmented`` zones), with
+    every bitmap row padded to a 32-bit word.
+
+    :param int radius: The radius of the gauge.
+    :param int steps: The number of visible progress steps.
+    :param int value_count: The number of palette indices in the sheet.
+    :param int|None width: The width of the gauge arc. Defaults to the radius, the
+                           largest frame for the sweep.
+    :param int start_angle: The start angle of the gauge, as for `Gauge`.
+    :param int sweep: The sweep of the gauge, as for `Gauge`.
+    """
+    width = max(2, width if width is not None else radius)
+    start_angle %= 360
+    geometry = _geometry_cache.get((radius, width, start_angle, sweep, False))
+    if geometry is None:
+        geometry = _GaugeGeometry(radius, width, False, start_angle, sweep)
+    frame_width = geometry.bitmap_width
+    frame_height = geometry.bitmap_height
+    columns, rows = _sheet_layout(steps + 1)
+    bits = _bits_per_value(value_count)
+    return (columns * frame_width * bits + 31) // 32 * 4 * rows * frame_height
+
+
+def _fits_in_ram(size: int) -> bool:
+    """Check whether ``size`` bytes can be allocated while keeping some headroom."""
+    try:
+        import gc  # pylint: disable=import-outside-toplevel
+
+        gc.collect()
+        free = gc.mem_free()
+    except (ImportError, AttributeError):
+        # Only CircuitPython reports free memory
+        return True
+    return size + _SPRITE_SHEET_HEADROOM <= free
+
+
+def _frame_cache_key(
+    radius: int, width: int, start_angle: int, sweep: int, steps: int, zone_levels: list
+) -> int:
+    """Hash a sprite sheet's shape into a 32-bit FNV-1a key.
+
+    Colors are not part of the key: the files hold palette indices and every
+    gauge shades them with its own palette.
+    """
+    text = "{}/{}/{}/{}/{}/{}/{}".format(
+        __version__, radius, width, start_angle, sweep, steps, zone_levels
+    )
+    key = 0x811C9DC5
+    for char in text.encode():
+        key = ((key ^ char) * 0x01000193) & 0xFFFFFFFF
+    return key
+
+
+def _frame_cache_path(directory: str, key: int) -> str:
+    """Return the file for ``key`` under ``directory``, dropping entries of other versions.
+
+    Frames live in a ``gauge_cache`` subdirectory that the cache owns, so a
+    shared ``directory`` such as the CIRCUITPY root is never touched. The
+    first lookup compares the subdirectory's ``VERSION`` marker with
+    ``__version__`` and deletes the cached frames on a mismatch.
+    """
+    directory = directory.rstrip("/")
+    frames = directory + "/" + _FRAME_CACHE_SUBDIR
+    if directory not in _frame_cache_dirs:
+        _frame_cache_dirs.add(directory)
+        marker = frames + "/VERSION"
+        try:
+            with open(marker) as file:
+                current = file.read() == __version__
+        except OSError:
+            current = False
+        if not current:
+            try:
+                for path in (directory, frames):
+                    try:
+                        os.mkdir(path)
+                    except OSError:
+                        pass  # Already exists
+                for name in os.listdir(frames):
+                    if _is_frame_cache_name(name):
+                        os.remove(frames + "/" + name)
+                with open(marker, "w") as file:
+                    file.write(__version__)
+            except OSError:
+                pass  # Read-only filesystem, frames are not saved
+    return "{}/{:08x}.bmp".format(frames, key)
+
+
+def _is_frame_cache_name(name: str) -> bool:
+    """Check whether ``name`` has the ``{:08x}.bmp`` form of a cached sprite sheet."""
+    if len(name) != 12 or not name.endswith(".bmp"):
+        return False
+    for char in name[:8]:
+        if char not in "0123456789abcdef":
+            return False
+    return True
+
+
+def _file_exists(path: str) -> bool:
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
+
+
+def _save_bmp(path: str, bitmap, palette) -> bool:
+    """Write ``bitmap`` to ``path`` as an indexed BMP that `displayio.OnDiskBitmap` can load.
+
+    Uses four bits per pixel for up to 16 colors and eight otherwise. Rows are
+    written one at a time to keep memory use low.
+
+    :return: ``True`` if the file was written, ``False`` if the filesystem refused it.
+    """
+    colors = len(palette)
+    depth = 4 if colors <= 16 else 8
+    width = bitmap.width
+    height = bitmap.height
+    stride = (width * depth + 31) // 32 * 4
+    offset = 14 + 40 + 4 * colors
+    row = bytearray(stride)
+    try:
+        with open(path, "wb") as file:
+            file.write(struct.pack("<2sIHHI", b"BM", offset + stride * height, 0, 0, offset))
+            file.write(
+                struct.pack("<IiiHHIIiiII", 40, width, height, 1, depth, 0,
+                            stride * height, 2835, 2835, colors, colors)
+            )
+            for index in range(colors):
+                color = palette[index]
+                file.write(struct.pack("<BBBB", color & 0xFF, color >> 8 & 0xFF, color >> 16, 0))
+            # BMP rows run bottom-up
+            for y in range(height - 1, -1, -1):
+                if depth == 8:
+                    for x in range(width):
+                        row[x] = bitmap[x, y]
+                else:
+                    for x in range(0, width - 1, 2):
+                        row[x >> 1] = bitmap[x, y] << 4 | bitmap[x + 1, y]
+                    if width & 1:
+                        row[width >> 1] = bitmap[width - 1, y] << 4
+                file.write(row)
+    except OSError:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+# Instrumentation: per-gauge counters are opt-in through Gauge.enable_stats()
+_STAT_COUNTERS = ("updates", "redraws", "pixels", "fill_region")
+_TIMED_METHODS = (
+    "set_progress", "_draw_gauge", "_draw_progress", "_draw_regress", "_draw_levels", "_draw_needle"
+)
+
+
+def _new_stats() -> dict:
+    counters = {name: 0 for name in _STAT_COUNTERS}
+    counters["time_ns"] = {name: 0 for name in _TIMED_METHODS}
+    return counters
+
+
+stats = _new_stats()
+"""Counters summed over every gauge with stats enabled.
+
+``updates`` counts progress assignments and ``redraws`` those that changed the
+bitmap. ``pixels`` counts pixels written by span, blit and bucket drawing and
+``fill_region`` the spans written. ``time_ns`` holds the cumulative
+``time.monotonic_ns`` spent in each drawing method, nested calls included.
+"""
+
+_stats_hook = None
+_instrumented_gauges = 0
+_active_stats = None
+_bitmaptools = bitmaptools
+
+
+def _charge(counter: str, amount: int) -> None:
+    """Add to a counter of the gauge being drawn and of the module aggregate."""
+    if _active_stats is not None:
+        _active_stats[counter] += amount
+        stats[counter] += amount
+
+
+class _CountingBitmaptools:
+    """Stands in for ``bitmaptools`` while any gauge has stats enabled."""
+
+    @staticmethod
+    def fill_region(bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        _charge("fill_region", 1)
+        _charge("pixels", abs(x2 - x1) * abs(y2 - y1))
+        _bitmaptools.fill_region(bitmap, x1, y1, x2, y2, value)
+
+    @staticmethod
+    def draw_line(bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        _charge("pixels", max(abs(x2 - x1), abs(y2 - y1)) + 1)
+        _bitmaptools.draw_line(bitmap, x1, y1, x2, y2, value)
+
+    @staticmethod
+    def blit(dest, source, x: int, y: int, **kwargs) -> None:
+        _charge(
+            "pixels",
+            (kwargs.get("x2", source.width) - kwargs.get("x1", 0))
+            * (kwargs.get("y2", source.height) - kwargs.get("y1", 0)),
+        )
+        _bitmaptools.blit(dest, source, x, y, **kwargs)
+
+
+def _instrument(gauge, name: str):
+    """Wrap one of ``gauge``'s methods to time it and collect its counters."""
+    method = getattr(gauge, name)
+    gauge_stats = gauge._stats  # pylint: disable=protected-access
+
+    def instrumented(*args):
+        global _active_stats  # pylint: disable=global-statement
+        outer = _active_stats
+        _active_stats = gauge_stats
+        start = time.monotonic_ns()
+        try:
+            result = method(*args)
+        finally:
+            elapsed = time.monotonic_ns() - start
+            _active_stats = outer
+        stats["time_ns"][name] += elapsed
+        gauge_stats["time_ns"][name] += elapsed
+
+        _active_stats = gauge_stats
+        if name == "set_progress":
+            _charge("updates", 1)
+            if result:
+                _charge("redraws", 1)
+        elif name == "_draw_levels":
+            _charge("pixels", result)
+        _active_stats = outer
+
+        if name == "set_progress" and _stats_hook is not None:
+            _stats_hook(gauge, gauge_stats)
+        return result
+
+    return instrumented
+
+
+def set_stats_hook(hook) -> None:
+    """Call ``hook(gauge, stats)`` after every progress update of a gauge with stats.
+
+    Use it to stream counters to a serial log. Pass ``None`` to remove the hook.
+    """
+    global _stats_hook  # pylint: disable=global-statement
+    _stats_hook = hook
+
+
+def reset_stats() -> None:
+    """Zero the module-wide aggregate `stats`."""
+    for name in _STAT_COUNTERS:
+        stats[name] = 0
+    for name in _TIMED_METHODS:
+        stats["time_ns"][name] = 0
+
+
 class Gauge(displayio.TileGrid):
-    """A 270-degree progress gauge.
+    """A progress gauge along a circular arc, 270 degrees by default.
     
     :param int x: The x-position of the center.
     :param int y: The y-position of the center.
@@ -48,6 +1395,76 @@ class Gauge(displayio.TileGrid):
                          ``None`` for no fill.
     :param int|None background: The background color. Can be a hex value for a color or
                                ``None`` for transparent.
+    :param int start_angle: Where the arc starts, at 0% progress, in whole degrees
+                            counterclockwise from straight down: 315 is lower left,
+                            270 left and 180 up.
+    :param int sweep: The whole degrees the arc spans clockwise from ``start_angle``,
+                      1 to 360. ``start_angle=270, sweep=180`` makes a half-circle
+                      dial. The bitmap covers just the bounding box of the arc, so
+                      shorter sweeps use less RAM and the center may lie outside it.
+    :param bool incremental: Recolor the ring pixel by pixel from a per-pixel angle
+                             index shared by gauges of the same shape, instead of
+                             clipping spans against the progress angles on every update.
+    :param int sprite_steps: Pre-render ``sprite_steps + 1`` quantized progress frames
+                             into a sprite sheet, so progress changes only swap the
+                             tile index. Falls back to normal drawing when the sheet
+                             (see `sprite_sheet_size`) would not fit in RAM. 0 disables
+                             the sprite sheet.
+    :param int tile_size: Split the gauge into square tiles of this many pixels and
+                          store only the tiles the ring passes through, sharing one
+                          blank tile for the rest. Saves most of the RAM of large,
+                          thin gauges. The gauge then covers whole tiles, so the
+                          background may reach up to ``tile_size - 1`` pixels past
+                          its right and bottom edges. Ignored when a sprite sheet is
+                          in use. 0 stores the full bitmap.
+    :param list|None zones: ``(threshold, color)`` pairs that switch the fill to
+                            ``color`` from ``threshold`` percent upward, such as
+                            ``[(80, 0xFF0000)]`` for red from 80%. ``fill`` is used
+                            below the first threshold.
+    :param bool segmented: Paint each zone's part of the ring in its own color, one
+                           extra palette index per zone, so crossing a threshold
+                           writes nothing. Otherwise the whole fill takes the color
+                           of the zone the progress is in, at the cost of one palette
+                           write per crossing. More than one segmented zone doubles
+                           the bits per pixel of the bitmap.
+    :param bool needle: Show a needle pointing at the progress instead of filling
+                        the arc. Needles are rasterized once per angular bucket
+                        into a shared cache (see `set_needle_cache_size`), and an
+                        update restores the rectangle under the old needle and
+                        blits the new one. Zones recolor the needle. Ignores
+                        ``incremental``, ``sprite_steps``, ``tile_size`` and
+                        ``segmented``.
+    :param str|None readout: Show the progress as text inside the gauge, formatted
+                             with this format string, such as ``"{:.0f}%"``. Only
+                             the character cells that change are redrawn, from
+                             glyphs rasterized once per font and shared between
+                             gauges. The text is right-aligned in as many cells as
+                             0.0, 100.0 or a fractional value such as 100 / 3 need,
+                             drawn in the outline color, and sits in the hollow
+                             center, or below the hub for needles, whose sweep must
+                             then leave the bottom open. Raises ``ValueError`` when
+                             the text does not fit there, or when a later value
+                             formats wider than the cells.
+                             Disables ``sprite_steps`` and ``tile_size``.
+    :param readout_font: An ``adafruit_bitmap_font`` font for the readout, or
+                         ``None`` for the built-in 5x7 digits.
+    :param int readout_scale: Integer scale of the readout glyphs.
+    :param str|None cache_dir: Save the sprite sheet as a BMP file under this directory,
+                               and on later runs stream it from flash through
+                               `displayio.OnDiskBitmap` instead of rendering it into
+                               RAM. Needs ``sprite_steps``. Files go in a
+                               ``gauge_cache`` subdirectory of their own, are keyed by
+                               the gauge shape and are dropped when ``__version__``
+                               changes.
+                               Nothing is saved while the filesystem is read-only,
+                               as CIRCUITPY is unless remounted in ``boot.py``.
+    :param bool lazy: Defer allocating and drawing the bitmap. The gauge starts
+                      hidden and is rendered on `render`, or when ``hidden`` is
+                      first cleared. Progress set before then is only recorded.
+                      The angle index and the sprite sheet RAM check also wait
+                      for the first render. A lazy sprite sheet gauge without a
+                      cached file holds a single frame that frames are copied
+                      into, and ignores ``tile_size``.
     """
 
     def __init__(
@@ -61,199 +1478,583 @@ class Gauge(displayio.TileGrid):
         outline: Optional[int] = 0xFFFFFF,
         fill: Optional[int] = 0x00FF00,
         background: Optional[int] = 0x000000,
+        start_angle: int = 315,
+        sweep: int = 270,
+        incremental: bool = False,
+        sprite_steps: int = 0,
+        tile_size: int = 0,
+        zones: Optional[list] = None,
+        segmented: bool = False,
+        needle: bool = False,
+        readout: Optional[str] = None,
+        readout_font=None,
+        readout_scale: int = 1,
+        cache_dir: Optional[str] = None,
+        lazy: bool = False,
     ) -> None:
         self._x = x
         self._y = y
         self._radius = radius
         self._width = max(width, 2)  # Minimum width of 2
         self._progress = max(0, min(100, progress))  # Clamp between 0-100
+        if not 0 < sweep <= 360:
+            raise ValueError("sweep must be between 1 and 360 degrees")
+        self._start_angle = start_angle % 360
+        self._sweep = sweep
         
-        # Calculate bitmap dimensions
-        tile_grid_width = 2 * self._radius + 1
-        tile_grid_height = math.ceil(0.71 * self._radius) + self._radius + 1
-        
-        # Create bitmap and palette
-        self._bitmap = displayio.Bitmap(tile_grid_width, tile_grid_height, 3)
-        self._palette = displayio.Palette(3)
-        self._palette[0] = background if background is not None else 0x000000
-        self._palette[1] = outline if outline is not None else 0xFFFFFF
-        self._palette[2] = fill if fill is not None else 0x00FF00
+        # Outline geometry is shared between gauges of the same shape
+        self._geometry = _get_geometry(
+            self._radius, self._width, self._start_angle, sweep, hub=needle
+        )
+        self._needle = None
+        self._needle_base = None
+        self._needle_length = _needle_length(self._radius, self._width) if needle else 0
+        if needle:
+            incremental = segmented = False
+            sprite_steps = tile_size = 0
+        self._readout = readout
+        self._readout_text = None
+        if readout is not None:
+            # Glyphs are blitted straight into a single full bitmap
+            sprite_steps = tile_size = 0
+            self._layout_readout(readout_font, readout_scale)
+        # The shared angle index is looked up when the bitmap is allocated
+        self._incremental = incremental
+        self._index = None
+        self._level = 0
+        self._stats = None
+        self._mem_alloc = None
+        self._scheduler = None
+        self._epaper = None
+        self._box = _zeros("H", 4)
+        frame_width = self._geometry.bitmap_width
+        frame_height = self._geometry.bitmap_height
+
+        # Fill color zones, as thresholds plus one color entry per zone
+        zones = sorted(zones) if zones else []
+        self._zone_starts = [threshold for threshold, _ in zones]
+        self._zone_levels = [self._geometry.level(threshold) for threshold in self._zone_starts]
+        self._segmented = segmented and bool(zones)
+        self._zone = self._zone_of(self._progress)
+        self._colors = [
+            background if background is not None else 0x000000,
+            outline if outline is not None else 0xFFFFFF,
+            fill if fill is not None else 0x00FF00,
+        ] + [color for _, color in zones]
+        self._value_count = len(self._colors) if self._segmented else 3
+        # Scratch space for the fill runs of one update, one triple per zone
+        self._runs = _zeros("H", 3 * (len(zones) + 1))
+
+        # Lay out the bitmap: a sprite sheet of every progress frame when it
+        # fits, a sparse tile atlas, or a single frame
+        self._bitmap = None
+        self._bitmap_size = None
+        self._surface = None
+        self._sheet = None
+        self._tiles = None
+        self._tile_size = tile_size
+        self._sprite_request = max(0, sprite_steps)
+        self._sprite_steps = 0
+        self._cache_path = None
+        if sprite_steps > 0 and cache_dir:
+            self._cache_path = _frame_cache_path(
+                cache_dir,
+                _frame_cache_key(
+                    self._radius, self._width, self._start_angle, self._sweep, sprite_steps,
+                    self._zone_levels if self._segmented else []
+                ),
+            )
+        if not lazy:
+            # Picks the layout, as nothing is shown yet
+            self._allocate()
+        elif self._sprite_request:
+            # Only a cached sheet is shown by tile index. Otherwise the RAM check
+            # waits for the first render, and the tile grid holds one frame
+            if self._cache_path is not None and _file_exists(self._cache_path):
+                self._bitmap_size = self._sheet_size()
+            else:
+                self._bitmap_size = (frame_width, frame_height)
+        else:
+            self._bitmap_size = self._frame_layout()
+
+        self._palette = displayio.Palette(self._value_count)
+        for index in range(self._value_count):
+            self._palette[index] = self._colors[index]
+        if not self._segmented:
+            self._palette[2] = self._colors[2 + self._zone]
         
         # Calculate position offset
-        x_offset = self._x - self._radius + 1
-        y_offset = self._y - self._radius + 1
+        x_offset = self._x - self._geometry.center_x + 1
+        y_offset = self._y - self._geometry.center_y + 1
 
-        super().__init__(
-            self._bitmap, 
-            pixel_shader=self._palette, 
-            x=x_offset, 
-            y=y_offset
-        )
+        bitmap = self._bitmap if self._bitmap is not None else _placeholder(*self._bitmap_size)
+        if self._tiles is None:
+            super().__init__(
+                bitmap, 
+                pixel_shader=self._palette, 
+                tile_width=frame_width,
+                tile_height=frame_height,
+                x=x_offset, 
+                y=y_offset
+            )
+        else:
+            super().__init__(
+                bitmap,
+                pixel_shader=self._palette,
+                width=self._tiles.columns,
+                height=self._tiles.rows,
+                tile_width=tile_size,
+                tile_height=tile_size,
+                default_tile=0,
+                x=x_offset,
+                y=y_offset
+            )
+            for cell, tile in enumerate(self._tiles.tiles):
+                if tile:
+                    self[cell] = tile
+
+        if lazy:
+            super(Gauge, self.__class__).hidden.fset(self, True)
+        else:
+            self._draw_gauge()
+
+    def _allocate(self) -> None:
+        """Allocate the bitmap the gauge is drawn into, or open its cached frames.
+
+        A requested sprite sheet is used when its cached file opens, or when it
+        fits in RAM and can be allocated. Otherwise the gauge falls back to
+        normal drawing. Before the tile grid is laid out (``_bitmap_size`` is
+        ``None``) this also picks the layout. ``_surface`` stays ``None`` when
+        the frames stream from a file.
+        """
+        if self._incremental and self._index is None:
+            self._index = self._geometry.angle_index()
+        self._sprite_steps = 0
+        self._sheet = None
+        size = self._bitmap_size
+        if self._sprite_request:
+            sheet_size = self._sheet_size()
+            if size is None or size == sheet_size:
+                # The tile grid shows the frames of the sheet by index
+                if self._cache_path is not None:
+                    try:
+                        frames = displayio.OnDiskBitmap(self._cache_path)
+                    except (OSError, ValueError):
+                        frames = None
+                    if frames is not None and (frames.width, frames.height) == sheet_size:
+                        self._sprite_steps = self._sprite_request
+                        self._bitmap_size = sheet_size
+                        self._bitmap = frames
+                        self._surface = None
+                        return
+                # A grid laid out for the sheet cannot show anything smaller
+                sheet = self._allocate_sheet(sheet_size, size is not None)
+                if sheet is not None:
+                    self._sprite_steps = self._sprite_request
+                    self._bitmap_size = sheet_size
+                    self._bitmap = self._surface = sheet
+                    return
+            else:
+                # A lazy gauge's single frame, which sheet frames are copied into
+                self._sheet = self._allocate_sheet(sheet_size, False)
+                if self._sheet is not None:
+                    self._sprite_steps = self._sprite_request
+        if size is None:
+            size = self._bitmap_size = self._frame_layout()
+        self._bitmap = displayio.Bitmap(size[0], size[1], self._value_count)
+        if self._tiles is not None:
+            self._tiles.bitmap = self._bitmap
+            self._surface = self._tiles
+        else:
+            self._surface = self._bitmap
+
+    def _sheet_size(self) -> tuple:
+        """Return the (width, height) of the requested sprite sheet."""
+        columns, rows = _sheet_layout(self._sprite_request + 1)
+        return columns * self._geometry.bitmap_width, rows * self._geometry.bitmap_height
+
+    def _allocate_sheet(self, size: tuple, required: bool) -> Optional[displayio.Bitmap]:
+        """Allocate a sprite sheet in RAM, or return ``None`` when it does not fit.
+
+        :param tuple size: The (width, height) of the sheet.
+        :param bool required: Skip the RAM check and let a `MemoryError` through.
+        """
+        if not required and not _fits_in_ram(
+            sprite_sheet_size(
+                self._radius, self._sprite_request, self._value_count, width=self._width,
+                start_angle=self._start_angle, sweep=self._sweep
+            )
+        ):
+            return None
+        try:
+            return displayio.Bitmap(size[0], size[1], self._value_count)
+        except MemoryError:
+            if required:
+                raise
+            return None
+
+    def _frame_layout(self) -> tuple:
+        """Set up the tile atlas if one was asked for, and return the bitmap size."""
+        if self._tile_size > 0:
+            self._tiles = _TiledBitmap(self._geometry, self._tile_size)
+            return self._tiles.atlas_size
+        return self._geometry.bitmap_width, self._geometry.bitmap_height
 
+    def render(self) -> None:
+        """Allocate and draw the bitmap of a lazy or released gauge, and show it.
+
+        Does nothing if the gauge is already rendered.
+        """
+        if self._bitmap is not None:
+            return
+        self._allocate()
+        self.bitmap = self._bitmap
         self._draw_gauge()
+        super(Gauge, self.__class__).hidden.fset(self, False)
+
+    def release(self) -> None:
+        """Free the bitmap of an off-screen gauge and hide it.
+
+        Progress and colors are kept, and the bitmap is rebuilt by `render` or
+        when ``hidden`` is cleared.
+        """
+        if self._bitmap is None:
+            return
+        super(Gauge, self.__class__).hidden.fset(self, True)
+        self.bitmap = _placeholder(*self._bitmap_size)
+        if self._tiles is not None:
+            self._tiles.bitmap = None
+        self._bitmap = None
+        self._surface = None
+        self._sheet = None
+        self._needle = None
+        self._needle_base = None
+
+    @property
+    def rendered(self) -> bool:
+        """Whether the gauge currently holds a drawn bitmap."""
+        return self._bitmap is not None
+
+    @property
+    def hidden(self) -> bool:
+        """Whether the gauge is hidden. Showing a lazy or released gauge renders it."""
+        return super(Gauge, self.__class__).hidden.fget(self)
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        if not value and self._bitmap is None:
+            self.render()
+        else:
+            super(Gauge, self.__class__).hidden.fset(self, value)
 
     def _draw_gauge(self) -> None:
-        """Draw the gauge outline using Bresenham's circle algorithm."""
-        # Clear bitmap
-        self._bitmap.fill(0)
-        
-        # Draw outer arc (octants 1-6, skipping 0 & 7 for 270-degree gauge)
-        self._draw_arc(self._radius, 1)
-        
-        # Draw inner arc
-        inner_radius = self._radius - self._width + 1
-        self._draw_arc(inner_radius, 1)
-        
-        # Connect inner and outer arcs at endpoints
-        outer_end_x = self._get_arc_endpoint_x(self._radius)
-        outer_end_y = self._get_arc_endpoint_y(self._radius)
-        inner_end_x = self._get_arc_endpoint_x(inner_radius)
-        inner_end_y = self._get_arc_endpoint_y(inner_radius)
-        
-        # Draw connecting lines
-        bitmaptools.draw_line(
-            self._bitmap, 
-            self._radius + outer_end_x, self._radius + outer_end_y,
-            self._radius + inner_end_x, self._radius + inner_end_y, 
-            1
+        """Draw the gauge outline, copying the shared base frame when one is cached."""
+        geometry = self._geometry
+        self._readout_text = None
+        if self._sprite_steps:
+            sheet = self._sheet if self._sheet is not None else self._surface
+            if sheet is not None:
+                self._draw_sprite_sheet(sheet)
+                if self._cache_path is not None:
+                    _save_bmp(self._cache_path, sheet, self._palette)
+            self._level = self._progress_level(self._progress)
+            self._show_frame(self._level)
+            return
+
+        self._draw_base()
+
+        if self._needle_length:
+            # Restores copy from the base frame, which uncached shapes keep per gauge
+            self._needle_base = geometry.base_frame()
+            self._needle = None
+            self._level = self._progress_level(self._progress)
+            self._draw_needle(self._level)
+            if self._readout is not None:
+                self._draw_readout()
+            return
+
+        # Draw progress
+        if self._index is not None:
+            self._level = 0
+            self._draw_levels(self._progress_level(self._progress))
+        else:
+            self._level = 0
+            self._draw_progress()
+            self._level = self._progress_level(self._progress)
+        if self._readout is not None:
+            self._draw_readout()
+
+    def _draw_base(self, bitmap=None) -> None:
+        """Draw the empty outline at the top-left of the bitmap, or of a sprite ``bitmap``."""
+        geometry = self._geometry
+        surface = self._surface
+        if bitmap is None:
+            bitmap = self._bitmap
+        else:
+            surface = bitmap
+        # Cached base frames hold two bits per pixel and blit needs matching depths
+        if geometry.cached and self._tiles is None and self._value_count <= 4:
+            bitmaptools.blit(bitmap, geometry.base_frame(), 0, 0)
+        else:
+            bitmap.fill(0)
+            geometry.draw_outline(surface)
+
+    def _draw_sprite_sheet(self, sheet) -> None:
+        """Render every quantized progress frame into the sprite ``sheet``."""
+        geometry = self._geometry
+        frame_width = geometry.bitmap_width
+        frame_height = geometry.bitmap_height
+        columns = sheet.width // frame_width
+        steps = self._sprite_steps
+
+        # Each frame is the previous one plus the buckets it newly covers
+        self._draw_base(sheet)
+        level = 0
+        for frame in range(1, steps + 1):
+            left = frame % columns * frame_width
+            top = frame // columns * frame_height
+            previous_left = (frame - 1) % columns * frame_width
+            previous_top = (frame - 1) // columns * frame_height
+            bitmaptools.blit(
+                sheet, sheet, left, top,
+                x1=previous_left, y1=previous_top,
+                x2=previous_left + frame_width, y2=previous_top + frame_height
+            )
+            new_level = int(frame * geometry.steps / steps + 0.5)
+            runs = self._runs
+            for run in range(0, 3 * self._fill_runs(level, new_level), 3):
+                _draw_index_levels(
+                    sheet, geometry, left, top, runs[run], runs[run + 1], runs[run + 2]
+                )
+            level = new_level
+
+    def _show_frame(self, frame: int) -> None:
+        """Show sprite sheet ``frame``, by tile index or by copying it into the single frame."""
+        sheet = self._sheet
+        if sheet is None:
+            self[0] = frame
+            return
+        geometry = self._geometry
+        frame_width = geometry.bitmap_width
+        frame_height = geometry.bitmap_height
+        columns = sheet.width // frame_width
+        left = frame % columns * frame_width
+        top = frame // columns * frame_height
+        bitmaptools.blit(
+            self._bitmap, sheet, 0, 0,
+            x1=left, y1=top, x2=left + frame_width, y2=top + frame_height
         )
-        bitmaptools.draw_line(
-            self._bitmap, 
-            self._radius - outer_end_x, self._radius + outer_end_y,
-            self._radius - inner_end_x, self._radius + inner_end_y, 
-            1
+
+    def _layout_readout(self, font, scale: int) -> None:
+        """Size the readout cells and place them where the gauge never draws."""
+        cell_width, cell_height, _ = _readout_metrics(font)
+        cell_width *= scale
+        cell_height *= scale
+        # Progress is a float, so the widths of the ends and of a fractional value
+        cells = 0
+        for value in _READOUT_SAMPLES:
+            cells = max(cells, len(self._readout.format(value)))
+        text_width = cells * cell_width
+        geometry = self._geometry
+        center_x = geometry.center_x
+        center_y = geometry.center_y
+        left = center_x - text_width // 2
+        if self._needle_length:
+            # Below the hub, where the needle never points
+            top = center_y + 2 + (text_width + 1) // 2
+            fits = True
+            reach = (self._needle_length + 1) ** 2
+            for y in range(top - center_y, top + cell_height - center_y):
+                for x in range(left - center_x, left + text_width - center_x):
+                    if x * x + y * y <= reach and geometry.in_sector(x, y):
+                        fits = False
+            # Needles at the ends of the sweep come closest, and their lines can
+            # round onto pixels just outside it
+            for level in (0, geometry.steps):
+                sprite, x, y = _get_needle(geometry, level)
+                x += center_x
+                y += center_y
+                for row in range(max(top, y), min(top + cell_height, y + sprite.height)):
+                    for column in range(max(left, x), min(left + text_width, x + sprite.width)):
+                        if sprite[column - x, row - y]:
+                            fits = False
+        else:
+            top = center_y - cell_height // 2
+            reach = geometry.inner_radius - 1
+            fits = (
+                max(center_x - left, left + text_width - center_x) ** 2
+                + max(center_y - top, top + cell_height - center_y) ** 2
+                <= reach * reach
+            )
+        fits = (
+            fits and left >= 0 and top >= 0
+            and left + text_width <= geometry.bitmap_width
+            and top + cell_height <= geometry.bitmap_height
         )
-        
-        # Draw progress
-        self._draw_progress()
-
-    def _draw_arc(self, radius: int, color: int) -> None:
-        """Draw an arc using Bresenham's circle algorithm."""
-        x = 0
-        y = radius
-        d = 3 - 2 * radius
-
-        while x <= y:
-            # Draw 6 octants (excluding bottom octants 0 & 7)
-            self._bitmap[-x + self._radius, -y + self._radius] = color  # Octant 3
-            self._bitmap[x + self._radius, -y + self._radius] = color   # Octant 2
-            self._bitmap[y + self._radius, x + self._radius] = color    # Octant 1
-            self._bitmap[-y + self._radius, x + self._radius] = color   # Octant 4
-            self._bitmap[-y + self._radius, -x + self._radius] = color  # Octant 5
-            self._bitmap[y + self._radius, -x + self._radius] = color   # Octant 6
-
-            if d <= 0:
-                d = d + (4 * x) + 6
-            else:
-                d = d + 4 * (x - y) + 10
-                y = y - 1
-            x = x + 1
-
-    def _get_arc_endpoint_x(self, radius: int) -> int:
-        """Get the x endpoint of the arc."""
-        x = 0
-        y = radius
-        d = 3 - 2 * radius
-
-        while x <= y:
-            if d <= 0:
-                d = d + (4 * x) + 6
-            else:
-                d = d + 4 * (x - y) + 10
-                y = y - 1
-            x = x + 1
-        return x - 1
-
-    def _get_arc_endpoint_y(self, radius: int) -> int:
-        """Get the y endpoint of the arc."""
-        return self._get_arc_endpoint_x(radius)
-
-    def _draw_progress(self) -> None:
-        """Draw the progress fill."""
-        if self._progress <= 0:
+        if not fits:
+            raise ValueError("Readout does not fit inside the gauge")
+        self._readout_font = font
+        self._readout_scale = scale
+        self._readout_cells = cells
+        self._readout_box = (left, top, cell_width, cell_height)
+
+    def _draw_readout(self) -> bool:
+        """Blit the readout cells whose character changed.
+
+        :return: ``True`` if any cell was redrawn.
+        """
+        text = self._readout.format(self._progress)
+        if len(text) > self._readout_cells:
+            raise ValueError(
+                "Readout {!r} is wider than its {} cells".format(text, self._readout_cells)
+            )
+        text = " " * (self._readout_cells - len(text)) + text
+        shown = self._readout_text
+        if text == shown:
+            return False
+        left, top, cell_width, _ = self._readout_box
+        for i, char in enumerate(text):
+            if shown is None or shown[i] != char:
+                bitmaptools.blit(
+                    self._bitmap,
+                    _get_glyph(self._readout_font, self._readout_scale, self._value_count, char),
+                    left + i * cell_width, top
+                )
+        self._readout_text = text
+        return True
+
+    def _restore_readout(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Redraw the readout cells overlapping a restored rectangle."""
+        left, top, cell_width, cell_height = self._readout_box
+        if self._readout_text is None or y2 <= top or y1 >= top + cell_height:
             return
+        first = max(0, (x1 - left) // cell_width)
+        last = min(self._readout_cells, (x2 - left + cell_width - 1) // cell_width)
+        for i in range(first, last):
+            bitmaptools.blit(
+                self._bitmap,
+                _get_glyph(
+                    self._readout_font, self._readout_scale, self._value_count,
+                    self._readout_text[i]
+                ),
+                left + i * cell_width, top
+            )
 
-        # Calculate progress end angle (315° - progress percentage of 270°)
-        progress_angle = 315 - (self._progress * 270 / 100)
-        
-        # Calculate end line coordinates
-        sin_val = math.sin(math.radians(progress_angle))
-        cos_val = math.cos(math.radians(progress_angle))
-        
-        start_x = self._radius + int(round(sin_val * (self._radius - 1), 0))
-        start_y = self._radius + int(round(cos_val * (self._radius - 1), 0))
-        end_x = self._radius + int(round(sin_val * (self._radius - self._width + 2), 0))
-        end_y = self._radius + int(round(cos_val * (self._radius - self._width + 2), 0))
-
-        # Draw progress end line (unless at 100%)
-        if self._progress != 100:
-            bitmaptools.draw_line(self._bitmap, start_x, start_y, end_x, end_y, 2)
-
-        # Find fill start point
-        fill_angle = progress_angle + 1
-        fill_x = self._radius + int(round(
-            math.sin(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-        ))
-        fill_y = self._radius + int(round(
-            math.cos(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-        ))
-        
-        # Search for a blank pixel to start fill
-        for i in range(1, 5):
-            if self._bitmap[fill_x, fill_y] == 0:
-                break
-            fill_angle = progress_angle + i
-            fill_x = self._radius + int(round(
-                math.sin(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-            ))
-            fill_y = self._radius + int(round(
-                math.cos(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-            ))
-
-        # Fill the progress area
-        bitmaptools.paint_fill(self._bitmap, fill_x, fill_y, 2, 0)
-
-    def _draw_regress(self) -> None:
-        """Clear progress fill when progress decreases."""
-        # Calculate progress end angle
-        progress_angle = 315 - (self._progress * 270 / 100)
-        
-        # Calculate end line coordinates
-        sin_val = math.sin(math.radians(progress_angle))
-        cos_val = math.cos(math.radians(progress_angle))
-        
-        start_x = self._radius + int(round(sin_val * (self._radius - 1), 0))
-        start_y = self._radius + int(round(cos_val * (self._radius - 1), 0))
-        end_x = self._radius + int(round(sin_val * (self._radius - self._width + 2), 0))
-        end_y = self._radius + int(round(cos_val * (self._radius - self._width + 2), 0))
-
-        # Clear the end line (unless at 100% or 0%)
-        if 0 < self._progress < 100:
-            bitmaptools.draw_line(self._bitmap, start_x, start_y, end_x, end_y, 0)
-
-        # Find fill start point for clearing
-        fill_angle = progress_angle - 1
-        fill_x = self._radius + int(round(
-            math.sin(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-        ))
-        fill_y = self._radius + int(round(
-            math.cos(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-        ))
-        
-        # Search for a filled pixel to start clearing
-        for i in range(1, 5):
-            if self._bitmap[fill_x, fill_y] == 2:
-                break
-            fill_angle = progress_angle - i
-            fill_x = self._radius + int(round(
-                math.sin(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-            ))
-            fill_y = self._radius + int(round(
-                math.cos(math.radians(fill_angle)) * (self._radius - self._width // 2), 0
-            ))
+    @property
+    def readout(self) -> Optional[str]:
+        """The text shown by the readout, or ``None`` without one."""
+        if self._readout is None:
+            return None
+        return self._readout_text or self._readout.format(self._progress)
 
-        # Clear the progress area
-        bitmaptools.paint_fill(self._bitmap, fill_x, fill_y, 0, 2)
+    def _draw_needle(self, level: int) -> None:
+        """Restore the background under the current needle and blit the needle for ``level``."""
+        center_x = self._geometry.center_x
+        center_y = self._geometry.center_y
+        bitmap = self._bitmap
+        if self._needle is not None:
+            sprite, left, top = self._needle
+            x = center_x + left
+            y = center_y + top
+            bitmaptools.blit(
+                bitmap, self._needle_base, x, y,
+                x1=x, y1=y, x2=x + sprite.width, y2=y + sprite.height
+            )
+            if self._readout is not None:
+                self._restore_readout(x, y, x + sprite.width, y + sprite.height)
+        self._needle = _get_needle(self._geometry, level)
+        sprite, left, top = self._needle
+        bitmaptools.blit(bitmap, sprite, center_x + left, center_y + top, skip_source_index=0)
+
+    def _progress_level(self, progress: float) -> int:
+        """Convert a progress percentage to a number of filled angular buckets.
+
+        In sprite-sheet mode this is the frame index instead.
+        """
+        if self._sprite_steps:
+            return int(progress * self._sprite_steps / 100 + 0.5)
+        return self._geometry.level(progress)
+
+    def _draw_levels(self, level: int) -> int:
+        """Recolor the angular buckets between the drawn level and ``level``.
+
+        :return: The number of pixels written.
+        """
+        offsets, pixels = self._index
+        bitmap = self._surface
+        runs = self._runs
+        written = 0
+        for run in range(0, 3 * self._fill_runs(self._level, level), 3):
+            old = runs[run]
+            new = runs[run + 1]
+            color = runs[run + 2]
+            if new > old:
+                start, stop = offsets[old], offsets[new]
+            else:
+                start, stop, color = offsets[new], offsets[old], 0
+            for i in range(start, stop):
+                bitmap[pixels[i]] = color
+            written += stop - start
+        self._level = level
+        return written
+
+    def _fill_runs(self, old: int, new: int) -> int:
+        """Split a level change into runs, one per segmented zone.
+
+        The runs are stored as ``old, new, color`` triples in the preallocated
+        ``_runs`` array, so updates allocate nothing.
+
+        :return: The number of runs.
+        """
+        runs = self._runs
+        color = 2
+        count = 0
+        if new > old and self._segmented:
+            for boundary in self._zone_levels:
+                if boundary <= old:
+                    color += 1
+                elif boundary < new:
+                    runs[count] = old
+                    runs[count + 1] = boundary
+                    runs[count + 2] = color
+                    count += 3
+                    old = boundary
+                    color += 1
+        runs[count] = old
+        runs[count + 1] = new
+        runs[count + 2] = color
+        return count // 3 + 1
+
+    def _zone_of(self, progress: float) -> int:
+        """Return the index of the zone ``progress`` falls in, 0 below every threshold."""
+        zone = 0
+        for threshold in self._zone_starts:
+            if progress >= threshold:
+                zone += 1
+        return zone
+
+    def _draw_progress(self) -> int:
+        """Fill the ring from the drawn level up to the current progress.
+
+        :return: The number of pixels written.
+        """
+        runs = self._runs
+        count = self._fill_runs(self._level, self._progress_level(self._progress))
+        written = 0
+        for run in range(0, 3 * count, 3):
+            written += _draw_span_levels(
+                self._surface, self._geometry, 0, 0, runs[run], runs[run + 1], runs[run + 2]
+            )
+        return written
+
+    def _draw_regress(self) -> int:
+        """Clear the ring from the drawn level down to the current progress.
+
+        :return: The number of pixels written.
+        """
+        return _draw_span_levels(
+            self._surface, self._geometry, 0, 0, self._level, self._progress_level(self._progress)
+        )
 
     @property
     def x(self) -> int:
@@ -264,7 +2065,7 @@ class Gauge(displayio.TileGrid):
     def x(self, x: int) -> None:
         self._x = x
         # Update TileGrid position
-        super().__setattr__("x", x - self._radius + 1)
+        super(Gauge, self.__class__).x.fset(self, x - self._geometry.center_x + 1)
 
     @property
     def y(self) -> int:
@@ -275,7 +2076,7 @@ class Gauge(displayio.TileGrid):
     def y(self, y: int) -> None:
         self._y = y
         # Update TileGrid position
-        super().__setattr__("y", y - self._radius + 1)
+        super(Gauge, self.__class__).y.fset(self, y - self._geometry.center_y + 1)
 
     @property
     def radius(self) -> int:
@@ -287,48 +2088,712 @@ class Gauge(displayio.TileGrid):
         """The width of the gauge arc."""
         return self._width
 
+    @property
+    def start_angle(self) -> int:
+        """Where the arc starts, in degrees counterclockwise from straight down."""
+        return self._start_angle
+
+    @property
+    def sweep(self) -> int:
+        """The degrees the arc spans clockwise from `start_angle`."""
+        return self._sweep
+
     @property
     def progress(self) -> float:
-        """The progress percentage (0-100)."""
+        """The progress percentage (0-100).
+
+        On a gauge registered with a `gauge_scheduler.GaugeDisplayScheduler`,
+        assignments are queued until the next frame.
+        """
+        if self._scheduler is not None:
+            return self._scheduler.pending(self, "progress", self._progress)
         return self._progress
 
     @progress.setter
     def progress(self, value: float) -> None:
+        if self._scheduler is not None:
+            # Queued values read back, so they are clamped like drawn ones
+            self._scheduler.request(self, "progress", max(0, min(100, value)))
+        else:
+            self.set_progress(value)
+
+    @property
+    def step(self) -> float:
+        """The smallest progress change that can alter a pixel of this gauge."""
+        if self._sprite_steps:
+            return 100 / self._sprite_steps
+        return 100 / self._geometry.steps
+
+    def set_progress(self, value: float) -> bool:
+        """Set the progress percentage, skipping redraws that would change no pixel.
+
+        :param float value: The progress percentage (0-100).
+        :return: ``True`` if the bitmap was redrawn.
+        """
         new_progress = max(0, min(100, value))  # Clamp between 0-100
-        
-        if new_progress >= self._progress:
-            self._progress = new_progress
-            self._draw_progress()
+        level = self._progress_level(new_progress)
+        self._progress = new_progress
+        recolored = False
+        if self._zone_starts and not self._segmented:
+            # The whole fill follows the zone of the current value
+            zone = self._zone_of(new_progress)
+            if zone != self._zone:
+                self._zone = zone
+                self._palette[2] = self._colors[2 + zone]
+                recolored = True
+        if self._bitmap is None:
+            # Unrendered gauges draw the recorded progress when rendered
+            return False
+        if recolored and self._epaper is not None:
+            # The fill drawn so far changed color along with the zone
+            self._report_palette(2)
+        changed = self._readout is not None and self._draw_readout()
+        if level == self._level:
+            if changed and self._epaper is not None:
+                self._report_readout()
+            return changed
+
+        old = self._level
+        needle = self._needle
+        written = 0
+        if self._sprite_steps:
+            self._show_frame(level)
+        elif self._needle_length:
+            self._draw_needle(level)
+        elif self._index is not None:
+            written = self._draw_levels(level)
+        elif level > self._level:
+            written = self._draw_progress()
+        else:
+            written = self._draw_regress()
+        self._level = level
+        if self._epaper is not None:
+            self._report_change(old, level, written, needle)
+            if changed:
+                self._report_readout()
+        return True
+
+    def _report_change(self, old: int, new: int, written: int, needle: Optional[tuple]) -> None:
+        """Tell the e-paper policy which display rectangle an update changed, and how much.
+
+        Fill modes report the pixels written. Needle and sprite sheet updates
+        report the area of their rectangle.
+        """
+        box = self._box
+        if self._needle_length:
+            # The union of the old and new needle sprites
+            center_x = self._geometry.center_x
+            center_y = self._geometry.center_y
+            sprite, left, top = self._needle
+            x1 = left
+            y1 = top
+            x2 = left + sprite.width
+            y2 = top + sprite.height
+            if needle is not None:
+                sprite, left, top = needle
+                x1 = min(x1, left)
+                y1 = min(y1, top)
+                x2 = max(x2, left + sprite.width)
+                y2 = max(y2, top + sprite.height)
+            box[0] = center_x + x1
+            box[1] = center_y + y1
+            box[2] = center_x + x2
+            box[3] = center_y + y2
+        else:
+            if self._sprite_steps:
+                # Frame indices to angular buckets
+                steps = self._geometry.steps
+                old = int(old * steps / self._sprite_steps + 0.5)
+                new = int(new * steps / self._sprite_steps + 0.5)
+            if old > new:
+                old, new = new, old
+            self._geometry.sector_box(old, new, box)
+        if not written:
+            written = (box[2] - box[0]) * (box[3] - box[1])
+        left = self._x - self._geometry.center_x + 1
+        top = self._y - self._geometry.center_y + 1
+        self._epaper.mark(left + box[0], top + box[1], left + box[2], top + box[3], written)
+
+    def _report_palette(self, index: int) -> None:
+        """Tell the e-paper policy a palette entry changed, over the whole gauge rectangle.
+
+        The pixel count comes from the geometry rather than the bitmap: the
+        outline, the filled part of each zone, the needle's rectangle, and the
+        rest of the frame for the background.
+        """
+        geometry = self._geometry
+        level = self._level
+        if self._sprite_steps:
+            level = int(level * geometry.steps / self._sprite_steps + 0.5)
+        area = geometry.bitmap_width * geometry.bitmap_height
+        filled = 0
+        if self._needle_length:
+            if self._needle is not None:
+                sprite = self._needle[0]
+                filled = sprite.width * sprite.height
+        elif index >= 2 or index == 0:
+            low = 0
+            high = level
+            if self._segmented and index >= 2:
+                # Zone ``index - 2`` spans the levels between its neighbouring thresholds
+                levels = self._zone_levels
+                if index > 2:
+                    low = levels[index - 3]
+                if index - 2 < len(levels):
+                    high = min(high, levels[index - 2])
+            filled = self._filled_pixels(low, high) if high > low else 0
+        outline = geometry.outline_pixels
+        if self._readout is not None:
+            box = self._readout_box
+            outline += self._readout_cells * box[2] * box[3]
+        if index == 0:
+            pixels = area - outline - filled
+        elif index == 1:
+            pixels = outline
+        else:
+            pixels = filled
+        if pixels <= 0:
+            return
+        left = self._x - geometry.center_x + 1
+        top = self._y - geometry.center_y + 1
+        self._epaper.mark(
+            left, top, left + geometry.bitmap_width, top + geometry.bitmap_height, pixels
+        )
+
+    def _filled_pixels(self, low: int, high: int) -> int:
+        """Count the ring pixels filled between levels ``low`` and ``high``."""
+        if self._index is not None:
+            offsets = self._index[0]
+            return offsets[high] - offsets[low]
+        geometry = self._geometry
+        return geometry.filled_pixels(high) - geometry.filled_pixels(low)
+
+    def _report_readout(self) -> None:
+        """Tell the e-paper policy the readout changed."""
+        x, y, cell_width, cell_height = self._readout_box
+        width = self._readout_cells * cell_width
+        left = self._x - self._geometry.center_x + 1 + x
+        top = self._y - self._geometry.center_y + 1 + y
+        self._epaper.mark(left, top, left + width, top + cell_height, width * cell_height)
+
+    @property
+    def stats(self) -> Optional[dict]:
+        """This gauge's counters (see the module-level `stats`), or ``None`` when disabled."""
+        return self._stats
+
+    def enable_stats(self) -> dict:
+        """Start counting updates, redraws, pixels and drawing time for this gauge.
+
+        Instrumentation wraps this gauge's drawing methods, so gauges without
+        stats (and this one, once disabled) run the unwrapped code.
+
+        :return: The gauge's counters, also available as `stats`.
+        """
+        global bitmaptools, _instrumented_gauges  # pylint: disable=global-statement
+        if self._stats is None:
+            self._stats = _new_stats()
+            for name in _TIMED_METHODS:
+                if name != "set_progress":
+                    setattr(self, name, _instrument(self, name))
+            self._wrap_set_progress()
+            _instrumented_gauges += 1
+            bitmaptools = _CountingBitmaptools
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """Stop collecting stats and restore the uninstrumented drawing methods."""
+        global bitmaptools, _instrumented_gauges  # pylint: disable=global-statement
+        if self._stats is None:
+            return
+        for name in _TIMED_METHODS:
+            if name != "set_progress":
+                delattr(self, name)
+        self._stats = None
+        self._wrap_set_progress()
+        _instrumented_gauges -= 1
+        if not _instrumented_gauges:
+            bitmaptools = _bitmaptools
+
+    def enable_allocation_check(self) -> None:
+        """Make progress updates fail when they allocate heap memory.
+
+        A debug aid against the ``gc.collect`` pauses that short-lived objects
+        cause. Every `set_progress` call, and so every ``progress`` assignment,
+        compares ``gc.mem_alloc()`` before and after and raises `RuntimeError`
+        when it grew. The fill, needle (on a sprite cache hit) and sprite sheet
+        update paths are integer-only and allocate nothing. Readout text changes
+        and needle cache misses allocate by design. Stats, when enabled, are
+        collected outside the check.
+
+        :raises RuntimeError: Where ``gc.mem_alloc`` is missing, as on CPython.
+        """
+        import gc  # pylint: disable=import-outside-toplevel
+
+        if not hasattr(gc, "mem_alloc"):
+            raise RuntimeError("gc.mem_alloc() is only available on CircuitPython and MicroPython")
+        if self._mem_alloc is None:
+            self._mem_alloc = gc.mem_alloc
+            self._wrap_set_progress()
+
+    def disable_allocation_check(self) -> None:
+        """Stop checking progress updates for heap allocations."""
+        if self._mem_alloc is not None:
+            self._mem_alloc = None
+            self._wrap_set_progress()
+
+    def _wrap_set_progress(self) -> None:
+        """Rebuild this gauge's `set_progress` from the stats and allocation check settings.
+
+        Both wrap the same method, so it is always rebuilt from the class's
+        unwrapped one: the allocation check innermost, stats around it.
+        """
+        try:
+            del self.set_progress
+        except AttributeError:
+            pass
+        mem_alloc = self._mem_alloc
+        if mem_alloc is not None:
+            update = self.set_progress
+
+            def checked(value: float) -> bool:
+                before = mem_alloc()
+                result = update(value)
+                allocated = mem_alloc() - before
+                if allocated:
+                    raise RuntimeError("Progress update allocated {} bytes".format(allocated))
+                return result
+
+            self.set_progress = checked
+        if self._stats is not None:
+            self.set_progress = _instrument(self, "set_progress")
+
+    async def animate_to(
+        self,
+        target: float,
+        duration: float,
+        easing=None,
+        animator: Optional["GaugeAnimator"] = None,
+    ) -> bool:
+        """Animate the progress to ``target`` without blocking other tasks.
+
+        Calling it again before the animation ends retargets the running
+        animation from the current progress instead of queuing a new one.
+
+        :param float target: The final progress percentage (0-100).
+        :param float duration: The animation length in seconds.
+        :param easing: A function mapping elapsed time (0-1) to tween position (0-1),
+                       such as `gauge_animation.ease_in_out`. Defaults to
+                       `gauge_animation.linear`.
+        :param GaugeAnimator|None animator: The `gauge_animation.GaugeAnimator` to run
+                                            on. Defaults to a shared module-wide animator.
+        :return: ``True`` if the target was reached, ``False`` if the animation was
+                 replaced by a newer target first.
+        """
+        if animator is None:
+            from gauge_animation import default_animator  # pylint: disable=import-outside-toplevel
+
+            animator = default_animator()
+        return await animator.animate_to(self, target, duration, easing)
+
+    def bind(
+        self,
+        source,
+        *,
+        minimum: float = 0,
+        maximum: float = 100,
+        smoothing: Optional[str] = None,
+        alpha: float = 0.25,
+        window: int = 5,
+        hysteresis: float = 0,
+        max_rate: float = 0,
+    ) -> "GaugeBinding":
+        """Drive the progress from a stream of raw sensor readings.
+
+        Returns a `gauge_binding.GaugeBinding`: call its ``run()`` to consume an iterator,
+        await ``run_async()`` for an async iterator, or ``push()`` readings one
+        at a time.
+
+        :param source: An iterator or async iterator of readings, or ``None`` to
+                       only `GaugeBinding.push` readings.
+        :param float minimum: The reading shown as 0%.
+        :param float maximum: The reading shown as 100%.
+        :param str|None smoothing: ``"ema"`` for an exponential moving average,
+                                   ``"median"`` for a running median, or ``None``.
+        :param float alpha: The EMA weight of each new reading (0-1).
+        :param int window: The number of readings in the running median.
+        :param float hysteresis: Ignore values that differ from the one on the gauge by
+                                 less than this many percentage points.
+        :param float max_rate: The most progress updates per second, 0 for no limit.
+                               The latest held-back value is shown by the next reading
+                               that is let through, or when the source ends.
+        """
+        from gauge_binding import GaugeBinding  # pylint: disable=import-outside-toplevel
+
+        return GaugeBinding(
+            self, source,
+            minimum=minimum, maximum=maximum,
+            smoothing=smoothing, alpha=alpha, window=window,
+            hysteresis=hysteresis, max_rate=max_rate
+        )
+
+    def _set_color(self, index: int, color: Optional[int]) -> bool:
+        """Change a color entry unless it already holds ``color``.
+
+        The palette is only written while the entry is on screen.
+        """
+        if color is None or color == self._colors[index]:
+            return False
+        self._colors[index] = color
+        if index < 2 or self._segmented:
+            entry = index
+        elif index == 2 + self._zone:
+            entry = 2
         else:
-            self._progress = new_progress
-            self._draw_regress()
+            return True
+        self._palette[entry] = color
+        if self._epaper is not None and self._bitmap is not None:
+            self._report_palette(entry)
+        return True
+
+    @property
+    def zone(self) -> int:
+        """The index of the zone the progress is in, 0 below the first threshold."""
+        return self._zone_of(self._progress)
+
+    def _change_color(self, index: int, color: Optional[int]) -> None:
+        """Set a color entry now, or queue it when a scheduler batches this gauge."""
+        if self._scheduler is not None:
+            if color is not None:
+                self._scheduler.request(self, index, color)
+        else:
+            self._set_color(index, color)
+
+    def _queued_color(self, index: int) -> int:
+        if self._scheduler is not None:
+            return self._scheduler.pending(self, index, self._colors[index])
+        return self._colors[index]
+
+    def set_zone_color(self, zone: int, color: int) -> None:
+        """Change the fill color of a zone, 0 being the plain `fill` below every threshold."""
+        self._change_color(2 + zone, color)
 
     @property
     def outline(self) -> Optional[int]:
         """The outline color of the gauge."""
+        return self._queued_color(1)
+
+    @outline.setter
+    def outline(self, color: Optional[int]) -> None:
+        self._change_color(1, color)
+
+    @property
+    def fill(self) -> Optional[int]:
+        """The fill color of the progress, below the first zone threshold."""
+        return self._queued_color(2)
+
+    @fill.setter
+    def fill(self, color: Optional[int]) -> None:
+        self._change_color(2, color)
+
+    @property
+    def background(self) -> Optional[int]:
+        """The background color of the gauge."""
+        return self._queued_color(0)
+
+    @background.setter
+    def background(self, color: Optional[int]) -> None:
+        self._change_color(0, color)
+
+
+class GaugeBank(displayio.TileGrid):
+    """Many 270-degree gauges rendered into one shared bitmap and palette.
+
+    The display compositor walks a single layer for the whole bank, and a batch
+    of progress changes lands in one dirty region. Gauges are drawn with the
+    incremental angle index, so every update only recolors the changed pixels.
+
+    :param list gauges: One ``(x, y, radius, width)`` or ``(x, y, radius, width, progress)``
+                        tuple per gauge, with centers in display coordinates. The
+                        gauges must not overlap.
+    :param int|None outline: The color of the gauge outlines.
+    :param int|None fill: The color to fill the progress.
+    :param int|None background: The background color.
+    """
+
+    def __init__(
+        self,
+        gauges: list,
+        *,
+        outline: Optional[int] = 0xFFFFFF,
+        fill: Optional[int] = 0x00FF00,
+        background: Optional[int] = 0x000000,
+    ) -> None:
+        if not gauges:
+            raise ValueError("GaugeBank needs at least one gauge")
+
+        # Each slot is [geometry, left, top, level, progress], left/top in display coordinates
+        self._slots = []
+        for spec in gauges:
+            x, y, radius, width = spec[:4]
+            progress = spec[4] if len(spec) > 4 else 0
+            geometry = _get_geometry(radius, max(width, 2))
+            self._slots.append(
+                [
+                    geometry, x - geometry.center_x + 1, y - geometry.center_y + 1, 0,
+                    max(0, min(100, progress)),
+                ]
+            )
+
+        left = min(slot[1] for slot in self._slots)
+        top = min(slot[2] for slot in self._slots)
+        right = max(slot[1] + slot[0].bitmap_width for slot in self._slots)
+        bottom = max(slot[2] + slot[0].bitmap_height for slot in self._slots)
+        for i, slot in enumerate(self._slots):
+            slot[1] -= left
+            slot[2] -= top
+            for other in self._slots[:i]:
+                if (
+                    slot[1] < other[1] + other[0].bitmap_width
+                    and other[1] < slot[1] + slot[0].bitmap_width
+                    and slot[2] < other[2] + other[0].bitmap_height
+                    and other[2] < slot[2] + slot[0].bitmap_height
+                ):
+                    raise ValueError("Gauges in a GaugeBank must not overlap")
+
+        self._colors = [
+            background if background is not None else 0x000000,
+            outline if outline is not None else 0xFFFFFF,
+            fill if fill is not None else 0x00FF00,
+        ]
+        self._palette = displayio.Palette(3)
+        for index, color in enumerate(self._colors):
+            self._palette[index] = color
+        self._bitmap = displayio.Bitmap(right - left, bottom - top, 3)
+
+        super().__init__(self._bitmap, pixel_shader=self._palette, x=left, y=top)
+
+        for slot in self._slots:
+            geometry = slot[0]
+            bitmaptools.blit(self._bitmap, geometry.base_frame(), slot[1], slot[2])
+            slot[3] = self._slot_level(slot, slot[4])
+            _draw_index_levels(self._bitmap, geometry, slot[1], slot[2], 0, slot[3])
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def _slot_level(slot: list, progress: float) -> int:
+        return int(progress * slot[0].steps / 100 + 0.5)
+
+    def get_progress(self, index: int) -> float:
+        """Return the progress percentage (0-100) of gauge ``index``."""
+        return self._slots[index][4]
+
+    def set_progress(self, index: int, value: float) -> bool:
+        """Set the progress percentage of gauge ``index``.
+
+        :param int index: The position of the gauge in the bank.
+        :param float value: The progress percentage (0-100).
+        :return: ``True`` if the bitmap was redrawn.
+        """
+        slot = self._slots[index]
+        slot[4] = max(0, min(100, value))  # Clamp between 0-100
+        level = self._slot_level(slot, slot[4])
+        if level == slot[3]:
+            return False
+        _draw_index_levels(self._bitmap, slot[0], slot[1], slot[2], slot[3], level)
+        slot[3] = level
+        return True
+
+    def update(self, values: dict) -> int:
+        """Set the progress of several gauges at once.
+
+        :param dict values: Progress percentages keyed by gauge index.
+        :return: The number of gauges whose pixels changed.
+        """
+        changed = 0
+        for index, value in values.items():
+            if self.set_progress(index, value):
+                changed += 1
+        return changed
+
+    def _set_color(self, index: int, color: Optional[int]) -> bool:
+        """Write a palette entry unless it already holds ``color``."""
+        if color is None or color == self._colors[index]:
+            return False
+        self._colors[index] = color
+        self._palette[index] = color
+        return True
+
+    @property
+    def outline(self) -> Optional[int]:
+        """The outline color shared by every gauge in the bank."""
         return self._palette[1]
 
     @outline.setter
     def outline(self, color: Optional[int]) -> None:
-        if color is not None:
-            self._palette[1] = color
+        self._set_color(1, color)
 
     @property
     def fill(self) -> Optional[int]:
-        """The fill color of the progress."""
+        """The progress fill color shared by every gauge in the bank."""
         return self._palette[2]
 
     @fill.setter
     def fill(self, color: Optional[int]) -> None:
-        if color is not None:
-            self._palette[2] = color
+        self._set_color(2, color)
 
     @property
     def background(self) -> Optional[int]:
-        """The background color of the gauge."""
+        """The background color of the bank."""
         return self._palette[0]
 
     @background.setter
     def background(self, color: Optional[int]) -> None:
-        if color is not None:
-            self._palette[0] = color
+        self._set_color(0, color)
+
+
+class ScaledGauge(displayio.Group):
+    """A `Gauge` rendered at reduced resolution and enlarged by group scaling.
+
+    The gauge is drawn into a bitmap ``scale`` times smaller in each direction,
+    so construction, fills and RAM all drop by about ``scale ** 2``, and the
+    display's group scaling blows it back up. Edges get ``scale``-pixel steps
+    and outlines come out ``scale`` pixels thick, taking fill area from thin
+    arcs (see ``gauge_bench.py --scale-report`` for the pixel error). Meant for
+    full-screen gauges with a radius of 120 or more.
+
+    Position and size stay in screen coordinates. The inner radius and arc
+    width are rounded to the nearest multiple of ``scale``, with the arc at
+    least two scaled pixels wide.
+
+    :param int x: The x-position of the center of the gauge, as for `Gauge`.
+    :param int y: The y-position of the center of the gauge, as for `Gauge`.
+    :param int radius: The screen radius of the gauge.
+    :param int width: The screen width of the gauge arc.
+    :param float progress: The progress percentage (0-100).
+    :param int scale: The size of one gauge pixel on screen, usually 2 or 3.
+    :param kwargs: Any other `Gauge` keyword argument, such as colors or zones.
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        radius: int,
+        width: int,
+        progress: float = 0,
+        *,
+        scale: int = 2,
+        **kwargs
+    ) -> None:
+        if scale < 1:
+            raise ValueError("scale must be >= 1")
+        self._x = x
+        self._y = y
+        self._radius = radius
+        self._width = width
+        self._scale = scale
+        inner_radius = max(1, (radius + scale // 2) // scale)
+        inner_width = max(2, (width + scale // 2) // scale)
+        self._gauge = Gauge(0, 0, inner_radius, inner_width, progress, **kwargs)
+        # The inner gauge's bitmap sits at the group origin
+        geometry = self._gauge._geometry  # pylint: disable=protected-access
+        self._center_x = geometry.center_x
+        self._center_y = geometry.center_y
+        self._gauge.x = self._center_x - 1
+        self._gauge.y = self._center_y - 1
+        super().__init__(
+            scale=scale, x=self._origin(x, self._center_x), y=self._origin(y, self._center_y)
+        )
+        self.append(self._gauge)
+
+    def _origin(self, center: int, offset: int) -> int:
+        """Return the group position that centers the gauge on ``center`` like a `Gauge`.
+
+        An unscaled gauge's center pixel lands at ``center + 1``, so the middle
+        of the enlarged center pixel, ``offset`` pixels into the inner bitmap,
+        goes there too.
+        """
+        scale = self._scale
+        return center + 1 - offset * scale - (scale - 1) // 2
+
+    @property
+    def gauge(self) -> Gauge:
+        """The reduced-resolution `Gauge`, for the features not mirrored here."""
+        return self._gauge
+
+    @property
+    def x(self) -> int:
+        """The x-position of the center of the gauge."""
+        return self._x
+
+    @x.setter
+    def x(self, x: int) -> None:
+        self._x = x
+        super(ScaledGauge, self.__class__).x.fset(self, self._origin(x, self._center_x))
+
+    @property
+    def y(self) -> int:
+        """The y-position of the center of the gauge."""
+        return self._y
+
+    @y.setter
+    def y(self, y: int) -> None:
+        self._y = y
+        super(ScaledGauge, self.__class__).y.fset(self, self._origin(y, self._center_y))
+
+    @property
+    def radius(self) -> int:
+        """The screen radius of the gauge."""
+        return self._radius
+
+    @property
+    def width(self) -> int:
+        """The screen width of the gauge arc."""
+        return self._width
+
+    @property
+    def progress(self) -> float:
+        """The progress percentage (0-100)."""
+        return self._gauge.progress
+
+    @progress.setter
+    def progress(self, value: float) -> None:
+        self._gauge.progress = value
+
+    def set_progress(self, value: float) -> bool:
+        """Set the progress percentage, as `Gauge.set_progress`."""
+        return self._gauge.set_progress(value)
+
+    @property
+    def step(self) -> float:
+        """The smallest progress change that can alter a pixel of this gauge."""
+        return self._gauge.step
+
+    @property
+    def outline(self) -> Optional[int]:
+        """The outline color."""
+        return self._gauge.outline
+
+    @outline.setter
+    def outline(self, color: Optional[int]) -> None:
+        self._gauge.outline = color
+
+    @property
+    def fill(self) -> Optional[int]:
+        """The progress fill color."""
+        return self._gauge.fill
+
+    @fill.setter
+    def fill(self, color: Optional[int]) -> None:
+        self._gauge.fill = color
+
+    @property
+    def background(self) -> Optional[int]:
+        """The background color."""
+        return self._gauge.background
+
+    @background.setter
+    def background(self, color: Optional[int]) -> None:
+        self._gauge.background = color
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_animation`
+================================================================================
+
+Asyncio progress animations for `gauge`.
+
+`GaugeAnimator` tweens any number of gauges from a single task, dropping frames
+that run over budget instead of replaying them late. `Gauge.animate_to` runs on
+the shared `default_animator`. Easing functions map elapsed time (0-1) to tween
+position (0-1).
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+import time
+
+
+def linear(t: float) -> float:
+    """Constant-speed easing."""
+    return t
+
+
+def ease_in(t: float) -> float:
+    """Easing that starts slow and speeds up."""
+    return t * t
+
+
+def ease_out(t: float) -> float:
+    """Easing that starts fast and slows down."""
+    return t * (2 - t)
+
+
+def ease_in_out(t: float) -> float:
+    """Easing that is slow at both ends (smoothstep)."""
+    return t * t * (3 - 2 * t)
+
+
+async def _wait_for_frame(runner, deadline: int, lead_ns: int = 0) -> int:
+    """Sleep until the frame after ``deadline``, ``lead_ns`` early.
+
+    ``runner`` provides the frame length as ``_frame_ns`` and counts skipped
+    frames in ``dropped_frames``.
+
+    :return: The deadline of the frame slept to, in `time.monotonic_ns` units.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    frame_ns = runner._frame_ns  # pylint: disable=protected-access
+    deadline += frame_ns
+    now = time.monotonic_ns()
+    if now > deadline:
+        # Over budget: skip the frames we missed instead of rendering them late
+        missed = (now - deadline) // frame_ns + 1
+        runner.dropped_frames += missed
+        deadline += missed * frame_ns
+    await asyncio.sleep(max(0, deadline - now - lead_ns) / 1_000_000_000)
+    return deadline
+
+
+class _Tween:
+    """One running progress animation."""
+
+    def __init__(self, start: float, target: float, duration: float, easing) -> None:
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.start = start
+        self.target = max(0, min(100, target))
+        self.started = time.monotonic_ns()
+        self.duration = max(1, int(duration * 1_000_000_000))
+        self.easing = easing if easing is not None else linear
+        self.completed = False
+        self.done = asyncio.Event()
+
+    def value(self, now: int) -> float:
+        """Return the progress at ``now`` (nanoseconds)."""
+        position = self.easing((now - self.started) / self.duration)
+        return self.start + (self.target - self.start) * position
+
+
+class GaugeAnimator:
+    """Run progress animations for many gauges from a single asyncio task.
+
+    Every frame samples each tween at the current time, so frames that run over
+    budget are dropped rather than replayed late, and the animation still ends
+    on schedule. A new target for a gauge that is already animating replaces
+    its tween.
+
+    :param float frame_rate: The target number of frames per second.
+    """
+
+    def __init__(self, frame_rate: float = 30) -> None:
+        self._frame_ns = int(1_000_000_000 / frame_rate)
+        self._tweens = {}
+        self._task = None
+        self.frames = 0
+        """The number of frames rendered."""
+        self.dropped_frames = 0
+        """The number of frames skipped because the previous one ran over budget."""
+        self.retargets = 0
+        """The number of animations replaced by a newer target before finishing."""
+
+    @property
+    def active(self) -> int:
+        """The number of gauges currently animating."""
+        return len(self._tweens)
+
+    def animate(self, gauge, target: float, duration: float, easing=None) -> _Tween:
+        """Start animating ``gauge`` towards ``target`` and return the tween.
+
+        The animation runs once the event loop is free; use `animate_to` to wait
+        for it.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        previous = self._tweens.get(gauge)
+        if previous is not None:
+            self.retargets += 1
+            previous.done.set()
+        tween = _Tween(gauge.progress, target, duration, easing)
+        self._tweens[gauge] = tween
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+        return tween
+
+    async def animate_to(self, gauge, target: float, duration: float, easing=None) -> bool:
+        """Animate ``gauge`` towards ``target`` and wait until it is done.
+
+        :return: ``True`` if the target was reached, ``False`` if the animation was
+                 replaced by a newer target first.
+        """
+        tween = self.animate(gauge, target, duration, easing)
+        await tween.done.wait()
+        return tween.completed
+
+    def cancel(self, gauge) -> None:
+        """Stop animating ``gauge``, leaving its progress where it is."""
+        tween = self._tweens.pop(gauge, None)
+        if tween is not None:
+            tween.done.set()
+
+    async def run(self) -> None:
+        """Render animation frames until no gauge is animating."""
+        deadline = time.monotonic_ns()
+        try:
+            while self._tweens:
+                now = time.monotonic_ns()
+                for gauge, tween in list(self._tweens.items()):
+                    if now - tween.started >= tween.duration:
+                        gauge.progress = tween.target
+                        del self._tweens[gauge]
+                        tween.completed = True
+                        tween.done.set()
+                    else:
+                        gauge.progress = tween.value(now)
+                self.frames += 1
+                deadline = await _wait_for_frame(self, deadline)
+        finally:
+            self._task = None
+
+
+_animator = None
+
+
+def default_animator() -> GaugeAnimator:
+    """Return the module-wide `GaugeAnimator` used by `Gauge.animate_to`."""
+    global _animator  # pylint: disable=global-statement
+    if _animator is None:
+        _animator = GaugeAnimator()
+    return _animator
@@ -0,0 +1,487 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_bench`
+================================================================================
+
+Benchmark suite for `gauge` construction and update paths.
+
+Runs on CPython through the `gauge_headless` backend. Sweeps radius, arc width
+and progress patterns, and for every case reports the time per call of
+``Gauge.__init__``, ``_draw_gauge``, ``_draw_progress``, ``_draw_regress`` and
+the ``progress`` setter, along with pixel writes and ``bitmaptools`` calls per
+update. Results are saved as JSON and can be compared against a stored baseline
+to flag regressions. ``gauge_old.py`` can be benchmarked side by side.
+
+``--scale-report`` instead compares `gauge.ScaledGauge` against full-resolution
+gauges of the same screen size, showing the pixel error next to the savings.
+
+.. code-block:: shell
+
+    python gauge_bench.py --output results.json
+    python gauge_bench.py --impl new --baseline results.json --quick
+    python gauge_bench.py --scale-report --radius 120 --radius 160
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* CPython 3 with NumPy
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+try:
+    from typing import Callable, Dict, List, Optional
+except ImportError:
+    pass
+
+import gauge_headless
+
+gauge_headless.install()
+
+# pylint: disable=wrong-import-position
+import gauge
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/your_repo/Adafruit_CircuitPython_Display_Shapes.git"
+
+RADII = (10, 25, 50, 100, 200)
+QUICK_RADII = (10, 50)
+SCALE_RADII = (120, 160)
+SCALES = (2, 3)
+
+# Timing metrics may drift by the threshold ratio; count metrics must not grow at all
+TIME_METRICS = (
+    "init_us",
+    "init_cold_us",
+    "draw_gauge_us",
+    "update_us",
+    "draw_progress_us",
+    "draw_regress_us",
+)
+COUNT_METRICS = (
+    "init_pixel_writes",
+    "pixel_writes_per_update",
+    "paint_fill_per_update",
+    "draw_line_per_update",
+    "redraws",
+)
+
+
+def widths_for(radius: int, quick: bool = False) -> List[int]:
+    """Return the arc widths swept for ``radius``, from 2 up to the radius."""
+    if quick:
+        return sorted({2, max(2, radius // 4), radius})
+    return sorted(
+        {2, max(2, radius // 8), max(2, radius // 4), max(2, radius // 2), radius}
+    )
+
+
+def patterns() -> Dict[str, List[float]]:
+    """Return the progress sequences replayed against every gauge."""
+    rng = random.Random(451)
+    return {
+        # Steady increase, one percent at a time
+        "ramp": [float(i) for i in range(101)],
+        # Unrelated readings, both directions and any distance
+        "random": [rng.uniform(0, 100) for _ in range(101)],
+        # The up-and-down sweep of the example code loop
+        "oscillate": [float(i) for i in range(0, 101, 4)] + [float(i) for i in range(100, 0, -4)],
+    }
+
+
+def _old_factory() -> Callable:
+    import gauge_old  # pylint: disable=import-outside-toplevel
+
+    class OldGauge(gauge_old.Gauge):
+        """Old gauge with the TileGrid ``width`` shadowed so it can be assigned."""
+
+        width = None
+
+    def factory(radius: int, width: int, progress: float):
+        return OldGauge(radius, radius, radius, width, progress, 0xFFFFFF, 0x00FF00, 0x000000)
+
+    return factory
+
+
+def implementations() -> Dict[str, Callable]:
+    """Return the gauge constructors that can be benchmarked, by name."""
+    return {
+        "new": lambda radius, width, progress: gauge.Gauge(radius, radius, radius, width, progress),
+        "incremental": lambda radius, width, progress: gauge.Gauge(
+            radius, radius, radius, width, progress, incremental=True
+        ),
+        "old": _old_factory(),
+    }
+
+
+def _timed(target, name: str, totals: Dict[str, List[int]]) -> None:
+    """Wrap ``target.name`` so every call adds its duration and count to ``totals``."""
+    method = getattr(target, name)
+    record = totals.setdefault(name, [0, 0])
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        result = method(*args, **kwargs)
+        record[0] += time.perf_counter_ns() - start
+        record[1] += 1
+        return result
+
+    setattr(target, name, wrapper)
+
+
+def _mean_us(total_ns: int, calls: int) -> Optional[float]:
+    return round(total_ns / calls / 1000, 3) if calls else None
+
+
+def _median_us(timings: List[int]) -> float:
+    return round(sorted(timings)[len(timings) // 2] / 1000, 3)
+
+
+def bench_case(
+    factory: Callable, radius: int, width: int, values: List[float], repeat: int
+) -> dict:
+    """Benchmark one gauge shape against one progress pattern."""
+    result = {}
+
+    # Construction, with the shared geometry cache cold and then warm
+    timings = []
+    for _ in range(repeat):
+        gauge.clear_geometry_cache()
+        start = time.perf_counter_ns()
+        factory(radius, width, values[0])
+        timings.append(time.perf_counter_ns() - start)
+    result["init_cold_us"] = _median_us(timings)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        subject = factory(radius, width, values[0])
+        timings.append(time.perf_counter_ns() - start)
+    result["init_us"] = _median_us(timings)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        subject._draw_gauge()  # pylint: disable=protected-access
+        timings.append(time.perf_counter_ns() - start)
+    result["draw_gauge_us"] = _median_us(timings)
+
+    # Progress updates, timing the setter and the drawing methods behind it
+    subject = factory(radius, width, values[0])
+    totals = {}
+    _timed(subject, "_draw_progress", totals)
+    _timed(subject, "_draw_regress", totals)
+    elapsed = 0
+    for _ in range(repeat):
+        for value in values:
+            start = time.perf_counter_ns()
+            subject.progress = value
+            elapsed += time.perf_counter_ns() - start
+    updates = repeat * len(values)
+    result["update_us"] = _mean_us(elapsed, updates)
+    for name in ("_draw_progress", "_draw_regress"):
+        total, calls = totals[name]
+        result[name[1:] + "_us"] = _mean_us(total, calls)
+        result[name[1:] + "_calls"] = calls // repeat
+
+    # Pixel writes and bitmaptools calls, counted in a separate untimed pass
+    gauge_headless.reset_counters()
+    gauge_headless.set_counting(True)
+    try:
+        subject = factory(radius, width, values[0])
+        result["init_pixel_writes"] = gauge_headless.counters["pixel_writes"]
+        gauge_headless.reset_counters()
+        redraws = 0
+        for value in values:
+            calls = gauge_headless.counters["paint_fill"] + gauge_headless.counters["draw_line"]
+            writes = gauge_headless.counters["pixel_writes"]
+            subject.progress = value
+            if (
+                gauge_headless.counters["pixel_writes"] != writes
+                or gauge_headless.counters["paint_fill"] + gauge_headless.counters["draw_line"]
+                != calls
+            ):
+                redraws += 1
+    finally:
+        gauge_headless.set_counting(False)
+    updates = len(values)
+    result["pixel_writes_per_update"] = round(gauge_headless.counters["pixel_writes"] / updates, 2)
+    result["paint_fill_per_update"] = round(gauge_headless.counters["paint_fill"] / updates, 2)
+    result["draw_line_per_update"] = round(gauge_headless.counters["draw_line"] / updates, 2)
+    result["redraws"] = redraws
+    return result
+
+
+def run(
+    impls: List[str],
+    radii: List[int],
+    pattern_names: List[str],
+    repeat: int = 5,
+    quick: bool = False,
+    log: Optional[Callable] = None,
+) -> dict:
+    """Run the sweep and return a JSON-serializable report."""
+    factories = implementations()
+    sequences = patterns()
+    results = []
+    for impl in impls:
+        factory = factories[impl]
+        for radius in radii:
+            for width in widths_for(radius, quick):
+                for name in pattern_names:
+                    case = {"impl": impl, "radius": radius, "width": width, "pattern": name}
+                    # gauge_old prints debug output from its regress path
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        case.update(bench_case(factory, radius, width, sequences[name], repeat))
+                    results.append(case)
+                    if log is not None:
+                        log(case)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _key(case: dict) -> tuple:
+    return case["impl"], case["radius"], case["width"], case["pattern"]
+
+
+def compare(report: dict, baseline: dict, threshold: float = 1.25) -> List[str]:
+    """List the metrics in ``report`` that regressed against ``baseline``.
+
+    A time metric regresses when it exceeds the baseline by more than
+    ``threshold`` times. A count metric regresses on any increase, since counts
+    do not depend on the host.
+    """
+    previous = {_key(case): case for case in baseline["results"]}
+    regressions = []
+    for case in report["results"]:
+        old = previous.get(_key(case))
+        if old is None:
+            continue
+        label = "{}/r{}/w{}/{}".format(*_key(case))
+        for metric in TIME_METRICS:
+            if case.get(metric) and old.get(metric) and case[metric] > old[metric] * threshold:
+                regressions.append(
+                    "{} {}: {:.1f}us -> {:.1f}us ({:.2f}x)".format(
+                        label, metric, old[metric], case[metric], case[metric] / old[metric]
+                    )
+                )
+        for metric in COUNT_METRICS:
+            if metric in old and case.get(metric, 0) > old[metric]:
+                regressions.append(
+                    "{} {}: {} -> {}".format(label, metric, old[metric], case[metric])
+                )
+    return regressions
+
+
+def _error_distance(full: np.ndarray, scaled: np.ndarray, limit: int) -> int:
+    """Return how far, in screen pixels, any pixel of ``scaled`` is from the same color in ``full``.
+
+    The distance is the Chebyshev distance, capped at ``limit + 1``.
+    """
+    wrong = full != scaled
+    if not wrong.any():
+        return 0
+    colors = np.unique(scaled[wrong])
+    reach = {color: full == color for color in colors}
+    for distance in range(1, limit + 1):
+        for color, mask in reach.items():
+            grown = mask.copy()
+            grown[1:] |= mask[:-1]
+            grown[:-1] |= mask[1:]
+            grown[:, 1:] |= grown[:, :-1].copy()
+            grown[:, :-1] |= grown[:, 1:].copy()
+            reach[color] = grown
+        wrong &= ~np.logical_or.reduce(
+            [reach[color] & (scaled == color) for color in colors]
+        )
+        if not wrong.any():
+            return distance
+    return limit + 1
+
+
+def scale_case(radius: int, width: int, scale: int, values: List[float]) -> dict:
+    """Compare a `gauge.ScaledGauge` with the full-resolution gauge it stands in for."""
+    size = 2 * radius + 2 * scale + 4
+    center = size // 2
+    result = {"radius": radius, "width": width, "scale": scale}
+    costs = {}
+    for name, factory in (
+        ("full", lambda: gauge.Gauge(center, center, radius, width, values[0])),
+        (
+            "scaled",
+            lambda: gauge.ScaledGauge(center, center, radius, width, values[0], scale=scale),
+        ),
+    ):
+        gauge.clear_geometry_cache()
+        start = time.perf_counter_ns()
+        subject = factory()
+        init = time.perf_counter_ns() - start
+        target = subject.gauge if name == "scaled" else subject
+        gauge_headless.reset_counters()
+        gauge_headless.set_counting(True)
+        start = time.perf_counter_ns()
+        try:
+            for value in values:
+                subject.progress = value
+        finally:
+            gauge_headless.set_counting(False)
+        update = time.perf_counter_ns() - start
+        costs[name] = {
+            "init_us": round(init / 1000, 1),
+            "update_us": round(update / len(values) / 1000, 1),
+            "pixel_writes_per_update": round(
+                gauge_headless.counters["pixel_writes"] / len(values), 1
+            ),
+            "bitmap_bytes": (target.bitmap.width * target.bitmap.height + 3) // 4,
+        }
+        costs[name]["subject"] = subject
+    full = costs["full"].pop("subject")
+    scaled = costs["scaled"].pop("subject")
+    result.update(costs)
+
+    # Pixel error at a few progress values. Outlines come out ``scale`` pixels
+    # thick, so most mismatches are along them rather than in the fill.
+    mismatched = 0
+    ring = 0
+    filled = 0
+    fill_error = 0
+    farthest = 0
+    for value in (0, 25, 50, 75, 100):
+        full.progress = value
+        scaled.progress = value
+        expected = gauge_headless.compose(full, size, size)
+        actual = gauge_headless.compose(scaled, size, size)
+        ring += int((expected != full.background).sum())
+        mismatched += int((expected != actual).sum())
+        filled += int((expected == full.fill).sum())
+        fill_error += abs(int((actual == full.fill).sum()) - int((expected == full.fill).sum()))
+        farthest = max(farthest, _error_distance(expected, actual, 2 * scale))
+    result["mismatch_pct"] = round(100 * mismatched / ring, 2)
+    result["fill_area_error_pct"] = round(100 * fill_error / max(filled, 1), 2)
+    result["max_error_px"] = farthest
+    return result
+
+
+def scale_report(radii: List[int], scales: List[int], log: Optional[Callable] = None) -> List[dict]:
+    """Compare scaled gauges with full-resolution ones for every radius, width and scale."""
+    values = patterns()["random"]
+    report = []
+    for radius in radii:
+        for width in sorted({max(2, radius // 8), max(2, radius // 4)}):
+            for scale in scales:
+                case = scale_case(radius, width, scale, values)
+                report.append(case)
+                if log is not None:
+                    log(case)
+    return report
+
+
+def _print_scale_case(case: dict) -> None:
+    full = case["full"]
+    scaled = case["scaled"]
+    print(
+        "r={radius:<3} w={width:<3} scale={scale}  mismatch {mismatch_pct:>5.2f}% of ring pixels, "
+        "fill area off {fill_area_error_pct:>4.2f}%, max error {max_error_px}px  ".format(**case)
+        + "init {:.1f}x  update {:.1f}x  writes {:.1f}x  RAM {:.1f}x less".format(
+            full["init_us"] / scaled["init_us"],
+            full["update_us"] / scaled["update_us"],
+            full["pixel_writes_per_update"] / max(scaled["pixel_writes_per_update"], 1),
+            full["bitmap_bytes"] / scaled["bitmap_bytes"],
+        )
+    )
+
+
+def _print_case(case: dict) -> None:
+    print(
+        "{impl:>11} r={radius:<3} w={width:<3} {pattern:<9} "
+        "init {init_us:>9.1f}us  update {update_us:>8.1f}us  "
+        "writes/update {pixel_writes_per_update:>8.1f}  "
+        "paint_fill/update {paint_fill_per_update:.2f}".format(**case)
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument(
+        "--impl",
+        action="append",
+        choices=sorted(implementations()),
+        help="implementation to benchmark (repeatable, default: all)",
+    )
+    parser.add_argument("--radius", type=int, action="append", help="radius to sweep (repeatable)")
+    parser.add_argument(
+        "--pattern", action="append", choices=sorted(patterns()), help="progress pattern (repeatable)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per case")
+    parser.add_argument("--quick", action="store_true", help="small sweep for smoke testing")
+    parser.add_argument(
+        "--scale-report",
+        action="store_true",
+        help="compare ScaledGauge with full-resolution gauges instead of benchmarking",
+    )
+    parser.add_argument(
+        "--scale", type=int, action="append", help="scale for --scale-report (repeatable)"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON results file")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="allowed slowdown ratio for time metrics"
+    )
+    args = parser.parse_args(argv)
+
+    if args.scale_report:
+        report = scale_report(
+            args.radius or SCALE_RADII, args.scale or SCALES, log=_print_scale_case
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=1)
+        return 0
+
+    radii = args.radius or (QUICK_RADII if args.quick else RADII)
+    report = run(
+        args.impl or sorted(implementations()),
+        radii,
+        args.pattern or sorted(patterns()),
+        repeat=args.repeat,
+        quick=args.quick,
+        log=_print_case,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(report, json.load(file), args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+        print("No regressions against", args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
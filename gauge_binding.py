@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_binding`
+================================================================================
+
+Sensor data binding for `gauge`.
+
+`GaugeBinding`, created by `Gauge.bind`, scales raw readings to progress and
+passes them through optional smoothing, a hysteresis band and a rate limit
+before they reach the gauge.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+import time
+
+
+class GaugeBinding:
+    """Feeds a gauge from a stream of raw readings through a filter pipeline.
+
+    Each reading is scaled from ``minimum``-``maximum`` to 0-100, smoothed,
+    dropped while it stays within the hysteresis band of the value on the
+    gauge, and rate limited. Only values that pass every stage reach the
+    gauge's progress. Created by `Gauge.bind`, which describes the options.
+    """
+
+    def __init__(
+        self,
+        gauge,
+        source,
+        *,
+        minimum: float = 0,
+        maximum: float = 100,
+        smoothing: Optional[str] = None,
+        alpha: float = 0.25,
+        window: int = 5,
+        hysteresis: float = 0,
+        max_rate: float = 0,
+    ) -> None:
+        if smoothing not in (None, "ema", "median"):
+            raise ValueError("smoothing must be None, 'ema' or 'median'")
+        if maximum == minimum:
+            raise ValueError("maximum must differ from minimum")
+        self.gauge = gauge
+        self.source = source
+        self.minimum = minimum
+        self.maximum = maximum
+        self.smoothing = smoothing
+        self.alpha = alpha
+        self.window = max(1, window)
+        self.hysteresis = hysteresis
+        self._interval = int(1_000_000_000 / max_rate) if max_rate > 0 else 0
+        self._smoothed = None
+        self._recent = []
+        self._shown = None
+        self._shown_at = None
+        self._held = None
+        self.readings = 0
+        """The number of raw readings received."""
+        self.updates = 0
+        """The number of readings that reached the gauge."""
+
+    def push(self, reading: float) -> bool:
+        """Run one raw reading through the pipeline.
+
+        :return: ``True`` if it was passed on to the gauge.
+        """
+        self.readings += 1
+        value = (reading - self.minimum) * 100 / (self.maximum - self.minimum)
+        value = max(0, min(100, value))
+
+        if self.smoothing == "ema":
+            if self._smoothed is None:
+                self._smoothed = value
+            else:
+                self._smoothed += self.alpha * (value - self._smoothed)
+            value = self._smoothed
+        elif self.smoothing == "median":
+            recent = self._recent
+            recent.append(value)
+            if len(recent) > self.window:
+                recent.pop(0)
+            value = sorted(recent)[len(recent) // 2]
+
+        if self._shown is not None and abs(value - self._shown) < self.hysteresis:
+            # Back within the band: a value held by the rate limit is stale now
+            self._held = None
+            return False
+
+        now = time.monotonic_ns()
+        if self._interval and self._shown_at is not None and now - self._shown_at < self._interval:
+            self._held = value
+            return False
+        self._show(value, now)
+        return True
+
+    def _show(self, value: float, now: int) -> None:
+        self._held = None
+        self._shown = value
+        self._shown_at = now
+        self.updates += 1
+        self.gauge.progress = value
+
+    def flush(self) -> bool:
+        """Pass on the latest value the rate limit held back, if any.
+
+        :return: ``True`` if a value was passed on.
+        """
+        if self._held is None:
+            return False
+        self._show(self._held, time.monotonic_ns())
+        return True
+
+    def run(self) -> int:
+        """Consume the source iterator to its end.
+
+        :return: The number of values passed on to the gauge.
+        """
+        for reading in self.source:
+            self.push(reading)
+        self.flush()
+        return self.updates
+
+    async def run_async(self) -> int:
+        """Consume the source async iterator to its end, without blocking other tasks.
+
+        :return: The number of values passed on to the gauge.
+        """
+        async for reading in self.source:
+            self.push(reading)
+        self.flush()
+        return self.updates
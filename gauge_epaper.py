@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_epaper`
+================================================================================
+
+E-paper refresh budgeting for `gauge`.
+
+`GaugeEPaperPolicy` collects the regions its gauges redraw and refreshes the
+panel only once enough pixels changed or a change has waited too long, within
+the panel's own refresh limits.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+import time
+
+
+class GaugeEPaperPolicy:
+    """Refresh an e-paper display only when the gauges on it changed enough.
+
+    Registered gauges report the rectangle and number of pixels every redraw
+    or color change affects. The policy keeps their union and sum since the last refresh, and
+    refreshes once the changed pixels reach ``threshold`` or the oldest
+    unrefreshed change is ``max_staleness`` seconds old. It never refreshes
+    before the panel's ``time_to_refresh`` runs out or while it is ``busy``.
+
+    Call `poll` once per pass of a plain main loop, or run `run` as an asyncio
+    task.
+
+    :param display: The e-paper display to refresh, such as an ``EPaperDisplay``.
+    :param int|None threshold: The changed pixels that trigger a refresh. Defaults
+                               to 1% of the display area.
+    :param float max_staleness: The longest a change may stay off the panel, in
+                                seconds. 0 waits for the threshold alone.
+    """
+
+    def __init__(self, display, *, threshold: Optional[int] = None, max_staleness: float = 60) -> None:
+        self.display = display
+        self.threshold = (
+            threshold if threshold is not None else max(1, display.width * display.height // 100)
+        )
+        self.max_staleness = max_staleness
+        self._gauges = []
+        self._dirty = None
+        self._oldest_ns = 0
+        self._closed = False
+        self.changed_pixels = 0
+        """The number of changed pixels since the last refresh."""
+        self.updates = 0
+        """The number of redraws reported since the last refresh."""
+        self.refreshes = 0
+        """The number of refreshes triggered."""
+        self.skipped_refreshes = 0
+        """The number of redraws shown by a later, shared refresh instead of their own."""
+        self.deferred_refreshes = 0
+        """The number of due refreshes held back by ``time_to_refresh`` or a busy panel."""
+
+    def register(self, gauge) -> None:
+        """Track the changes of ``gauge`` from now on."""
+        if gauge not in self._gauges:
+            self._gauges.append(gauge)
+            gauge._epaper = self  # pylint: disable=protected-access
+
+    def unregister(self, gauge) -> None:
+        """Stop tracking ``gauge``. Its changes so far stay pending."""
+        if gauge in self._gauges:
+            self._gauges.remove(gauge)
+            gauge._epaper = None  # pylint: disable=protected-access
+
+    def mark(self, x1: int, y1: int, x2: int, y2: int, pixels: int) -> None:
+        """Add a changed display rectangle, ``x2`` and ``y2`` exclusive, and its pixel count."""
+        dirty = self._dirty
+        if dirty is None:
+            self._dirty = [x1, y1, x2, y2]
+            self._oldest_ns = time.monotonic_ns()
+        else:
+            dirty[0] = min(dirty[0], x1)
+            dirty[1] = min(dirty[1], y1)
+            dirty[2] = max(dirty[2], x2)
+            dirty[3] = max(dirty[3], y2)
+        self.changed_pixels += pixels
+        self.updates += 1
+
+    @property
+    def dirty(self) -> Optional[tuple]:
+        """The union of the changed rectangles since the last refresh, or ``None``."""
+        return tuple(self._dirty) if self._dirty is not None else None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the oldest unrefreshed change has waited ``max_staleness`` seconds."""
+        return (
+            self._dirty is not None
+            and self.max_staleness > 0
+            and time.monotonic_ns() - self._oldest_ns >= int(self.max_staleness * 1_000_000_000)
+        )
+
+    @property
+    def due(self) -> bool:
+        """Whether enough has changed, or for long enough, to refresh."""
+        return self._dirty is not None and (self.changed_pixels >= self.threshold or self.stale)
+
+    @property
+    def time_to_refresh(self) -> float:
+        """Seconds until the panel accepts a refresh, 0 when it is ready."""
+        return max(0, getattr(self.display, "time_to_refresh", 0))
+
+    def poll(self) -> bool:
+        """Refresh the display if it is due and the panel is ready.
+
+        :return: ``True`` if the display was refreshed.
+        """
+        if not self.due:
+            return False
+        if self.time_to_refresh > 0 or getattr(self.display, "busy", False):
+            self.deferred_refreshes += 1
+            return False
+        try:
+            self.display.refresh()
+        except RuntimeError:
+            # Refresh too soon, by the panel's own clock
+            self.deferred_refreshes += 1
+            return False
+        self.refreshes += 1
+        self.skipped_refreshes += self.updates - 1
+        self._dirty = None
+        self.changed_pixels = 0
+        self.updates = 0
+        return True
+
+    async def run(self, interval: float = 1) -> None:
+        """Poll every ``interval`` seconds, or sooner once the panel allows a refresh, until `close`."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        while not self._closed:
+            self.poll()
+            wait = interval
+            if self.due:
+                wait = min(interval, max(self.time_to_refresh, 0.01))
+            await asyncio.sleep(wait)
+
+    def close(self) -> None:
+        """Stop `run` and release every gauge."""
+        self._closed = True
+        for gauge in list(self._gauges):
+            self.unregister(gauge)
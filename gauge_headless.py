@@ -0,0 +1,962 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_headless`
+================================================================================
+
+Headless CPython stand-ins for ``displayio`` and ``bitmaptools``.
+
+Lets `gauge` build, render and be inspected pixel-for-pixel on a desktop or CI
+host, without a board or Blinka. Bitmaps are NumPy arrays, so fills, blits and
+compositing are vectorized while single-pixel access stays cheap.
+`FramebufferSink` pushes the composed frames as RGB565 into a Linux
+framebuffer or shared-memory file.
+
+.. code-block:: python
+
+    import gauge_headless
+
+    gauge_headless.install()  # before importing gauge
+
+    from gauge import Gauge
+
+    gauge = Gauge(30, 30, 27, 8, progress=40)
+    print(gauge_headless.compose(gauge, 64, 64))
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* CPython 3 with NumPy
+"""
+
+import mmap
+import os
+import sys
+import time
+import types
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+import numpy as np
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/your_repo/Adafruit_CircuitPython_Display_Shapes.git"
+
+counters = {
+    "pixel_writes": 0,
+    "fill": 0,
+    "fill_region": 0,
+    "draw_line": 0,
+    "paint_fill": 0,
+    "blit": 0,
+}
+"""Pixels written and bitmaptools calls made while counting is enabled."""
+
+_counting = False
+
+
+def _count(operation: Optional[str], pixels: int) -> None:
+    if operation is not None:
+        counters[operation] += 1
+    counters["pixel_writes"] += pixels
+
+
+def set_counting(enabled: bool) -> None:
+    """Turn the write `counters` on or off.
+
+    Counting is off by default so timings are not skewed by bookkeeping.
+    """
+    global _counting  # pylint: disable=global-statement
+    _counting = enabled
+    Bitmap.__setitem__ = Bitmap._counted_setitem if enabled else Bitmap._plain_setitem
+
+
+def reset_counters() -> None:
+    """Zero every entry in `counters`."""
+    for key in counters:
+        counters[key] = 0
+
+
+class Bitmap:
+    """A 2D array of palette indices, like ``displayio.Bitmap``.
+
+    :param int width: The number of values wide.
+    :param int height: The number of values high.
+    :param int value_count: The number of possible pixel values.
+    """
+
+    def __init__(self, width: int, height: int, value_count: int) -> None:
+        if value_count <= 0x100:
+            dtype = np.uint8
+        elif value_count <= 0x10000:
+            dtype = np.uint16
+        else:
+            dtype = np.uint32
+        self._width = width
+        self._height = height
+        self._value_count = value_count
+        self._array = np.zeros((height, width), dtype)
+        # Flat view for fast single-pixel access from Python
+        self._flat = memoryview(self._array.reshape(-1))
+
+    @property
+    def width(self) -> int:
+        """Width of the bitmap."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Height of the bitmap."""
+        return self._height
+
+    @property
+    def value_count(self) -> int:
+        """The number of possible pixel values."""
+        return self._value_count
+
+    @property
+    def array(self) -> np.ndarray:
+        """The pixel values as a writable ``(height, width)`` NumPy view."""
+        return self._array
+
+    def buffer(self) -> memoryview:
+        """Return the pixel values as a flat, writable memoryview, without copying.
+
+        Values are one element each, row-major, in the smallest unsigned type
+        that holds ``value_count``. This works on every Python version;
+        ``memoryview(bitmap)``, as on CircuitPython, needs Python 3.12+ and
+        raises `TypeError` on older versions.
+        """
+        return self._flat
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Expose the pixel values to ``memoryview(bitmap)`` (Python 3.12+). See `buffer`."""
+        return memoryview(self._flat)
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        view.release()
+
+    def _offset(self, index: Union[int, Tuple[int, int]]) -> int:
+        if isinstance(index, tuple):
+            x, y = index
+            if not (0 <= x < self._width and 0 <= y < self._height):
+                raise IndexError("pixel coordinates out of bounds")
+            return y * self._width + x
+        if not 0 <= index < self._width * self._height:
+            raise IndexError("pixel index out of bounds")
+        return index
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> int:
+        return self._flat[self._offset(index)]
+
+    def _plain_setitem(self, index: Union[int, Tuple[int, int]], value: int) -> None:
+        self._flat[self._offset(index)] = value
+
+    def _counted_setitem(self, index: Union[int, Tuple[int, int]], value: int) -> None:
+        self._flat[self._offset(index)] = value
+        counters["pixel_writes"] += 1
+
+    __setitem__ = _plain_setitem
+
+    def fill(self, value: int) -> None:
+        """Fill the bitmap with the supplied palette index value."""
+        self._array.fill(value)
+        if _counting:
+            _count("fill", self._array.size)
+
+    def dirty(self, x1: int = 0, y1: int = 0, x2: int = -1, y2: int = -1) -> None:
+        """Inform the display of a region changed by direct buffer access.
+
+        Nothing is cached here, so this is a no-op kept for API compatibility.
+        """
+
+    def blit(self, x: int, y: int, source_bitmap: "Bitmap", **kwargs) -> None:
+        """Copy a region of ``source_bitmap`` into this bitmap (pre-9.0 API)."""
+        blit(self, source_bitmap, x, y, **kwargs)
+
+
+class Palette:
+    """Map pixel values to 24-bit RGB colors, like ``displayio.Palette``.
+
+    :param int color_count: The number of colors in the palette.
+    """
+
+    def __init__(self, color_count: int, *, dither: bool = False) -> None:
+        self._colors = np.zeros(color_count, np.uint32)
+        self._transparent = np.zeros(color_count, bool)
+        self.dither = dither
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __getitem__(self, index: int) -> int:
+        return int(self._colors[index])
+
+    def __setitem__(self, index: int, value) -> None:
+        if isinstance(value, (bytes, bytearray, tuple, list)):
+            value = (value[0] << 16) | (value[1] << 8) | value[2]
+        self._colors[index] = value & 0xFFFFFF
+
+    def make_transparent(self, index: int) -> None:
+        """Mark ``index`` as transparent."""
+        self._transparent[index] = True
+
+    def make_opaque(self, index: int) -> None:
+        """Mark ``index`` as opaque."""
+        self._transparent[index] = False
+
+    def is_transparent(self, index: int) -> bool:
+        """Return whether ``index`` is transparent."""
+        return bool(self._transparent[index])
+
+
+class OnDiskBitmap:
+    """A read-only bitmap loaded from an indexed BMP file, like ``displayio.OnDiskBitmap``.
+
+    Supports the 1, 4 and 8 bits per pixel uncompressed files `gauge` writes.
+    The whole image is decoded up front instead of streamed.
+
+    :param str|file file: The BMP file name or an open binary file.
+    """
+
+    def __init__(self, file) -> None:
+        if isinstance(file, str):
+            with open(file, "rb") as stream:
+                data = stream.read()
+        else:
+            data = file.read()
+        if data[:2] != b"BM":
+            raise ValueError("Invalid BMP file")
+        offset = int.from_bytes(data[10:14], "little")
+        header_size = int.from_bytes(data[14:18], "little")
+        width = int.from_bytes(data[18:22], "little", signed=True)
+        height = int.from_bytes(data[22:26], "little", signed=True)
+        depth = int.from_bytes(data[28:30], "little")
+        compression = int.from_bytes(data[30:34], "little")
+        colors = int.from_bytes(data[46:50], "little") or 1 << depth
+        if depth not in (1, 4, 8) or compression:
+            raise ValueError("Only uncompressed 1, 4 or 8 bit indexed BMP files are supported")
+
+        self._pixel_shader = Palette(colors)
+        table = 14 + header_size
+        for index in range(colors):
+            blue, green, red = data[table + 4 * index : table + 4 * index + 3]
+            self._pixel_shader[index] = (red, green, blue)
+
+        stride = (abs(width) * depth + 31) // 32 * 4
+        rows = np.frombuffer(data, np.uint8, stride * abs(height), offset).reshape(-1, stride)
+        bits = np.unpackbits(rows, axis=1).reshape(abs(height), -1, depth)
+        weights = 1 << np.arange(depth - 1, -1, -1, dtype=np.uint8)
+        array = (bits * weights).sum(axis=2, dtype=np.uint8)[:, : abs(width)]
+        # Positive heights store rows bottom-up
+        self._array = array[::-1] if height > 0 else array
+        self._array.flags.writeable = False
+        self._width = abs(width)
+        self._height = abs(height)
+
+    @property
+    def width(self) -> int:
+        """Width of the bitmap."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Height of the bitmap."""
+        return self._height
+
+    @property
+    def pixel_shader(self) -> Palette:
+        """The palette read from the file."""
+        return self._pixel_shader
+
+    @property
+    def array(self) -> np.ndarray:
+        """The pixel values as a read-only ``(height, width)`` NumPy view."""
+        return self._array
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> int:
+        if isinstance(index, tuple):
+            x, y = index
+        else:
+            y, x = divmod(index, self._width)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise IndexError("pixel coordinates out of bounds")
+        return int(self._array[y, x])
+
+
+class TileGrid:
+    """A grid of tiles sourced from one bitmap, like ``displayio.TileGrid``.
+
+    State lives in name-mangled attributes so subclasses such as `gauge.Gauge`
+    can keep their own ``_x``, ``_bitmap`` or ``width`` without clashing.
+    """
+
+    def __init__(
+        self,
+        bitmap: Bitmap,
+        *,
+        pixel_shader: Palette,
+        width: int = 1,
+        height: int = 1,
+        tile_width: Optional[int] = None,
+        tile_height: Optional[int] = None,
+        default_tile: int = 0,
+        x: int = 0,
+        y: int = 0,
+    ) -> None:
+        self.__bitmap = bitmap
+        self.__pixel_shader = pixel_shader
+        self.__width = width
+        self.__height = height
+        self.__tile_width = tile_width if tile_width is not None else bitmap.width
+        self.__tile_height = tile_height if tile_height is not None else bitmap.height
+        if bitmap.width % self.__tile_width or bitmap.height % self.__tile_height:
+            raise ValueError("Tile width and height must divide the bitmap size")
+        self.__tiles = [default_tile] * (width * height)
+        self.__x = x
+        self.__y = y
+        self.__hidden = False
+        self.__flip_x = False
+        self.__flip_y = False
+
+    @property
+    def x(self) -> int:
+        """X position of the left edge in the parent."""
+        return self.__x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self.__x = value
+
+    @property
+    def y(self) -> int:
+        """Y position of the top edge in the parent."""
+        return self.__y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self.__y = value
+
+    @property
+    def width(self) -> int:
+        """Width of the tilegrid in tiles."""
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        """Height of the tilegrid in tiles."""
+        return self.__height
+
+    @property
+    def tile_width(self) -> int:
+        """Width of a single tile in pixels."""
+        return self.__tile_width
+
+    @property
+    def tile_height(self) -> int:
+        """Height of a single tile in pixels."""
+        return self.__tile_height
+
+    @property
+    def bitmap(self) -> Bitmap:
+        """The bitmap the tiles are taken from. A new one must have the same size."""
+        return self.__bitmap
+
+    @bitmap.setter
+    def bitmap(self, value: Bitmap) -> None:
+        if value.width != self.__bitmap.width or value.height != self.__bitmap.height:
+            raise ValueError("New bitmap must be same size as old bitmap")
+        self.__bitmap = value
+
+    @property
+    def pixel_shader(self) -> Palette:
+        """The palette used to color the bitmap."""
+        return self.__pixel_shader
+
+    @pixel_shader.setter
+    def pixel_shader(self, value: Palette) -> None:
+        self.__pixel_shader = value
+
+    @property
+    def hidden(self) -> bool:
+        """True when the TileGrid is hidden."""
+        return self.__hidden
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        self.__hidden = bool(value)
+
+    @property
+    def flip_x(self) -> bool:
+        """If true, the left edge rendered will be the right edge of the bitmap."""
+        return self.__flip_x
+
+    @flip_x.setter
+    def flip_x(self, value: bool) -> None:
+        self.__flip_x = bool(value)
+
+    @property
+    def flip_y(self) -> bool:
+        """If true, the top edge rendered will be the bottom edge of the bitmap."""
+        return self.__flip_y
+
+    @flip_y.setter
+    def flip_y(self, value: bool) -> None:
+        self.__flip_y = bool(value)
+
+    def _tile_offset(self, index: Union[int, Tuple[int, int]]) -> int:
+        if isinstance(index, tuple):
+            return index[1] * self.__width + index[0]
+        return index
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> int:
+        return self.__tiles[self._tile_offset(index)]
+
+    def __setitem__(self, index: Union[int, Tuple[int, int]], value: int) -> None:
+        self.__tiles[self._tile_offset(index)] = value
+
+    def _render(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the grid as ``(rgb, opaque)`` arrays at 1x scale."""
+        bitmap = self.__bitmap.array
+        palette = self.__pixel_shader
+        tile_width = self.__tile_width
+        tile_height = self.__tile_height
+        columns = self.__bitmap.width // tile_width
+
+        indices = np.empty((self.__height * tile_height, self.__width * tile_width), bitmap.dtype)
+        for i, tile in enumerate(self.__tiles):
+            left = i % self.__width * tile_width
+            top = i // self.__width * tile_height
+            source_left = tile % columns * tile_width
+            source_top = tile // columns * tile_height
+            indices[top : top + tile_height, left : left + tile_width] = bitmap[
+                source_top : source_top + tile_height, source_left : source_left + tile_width
+            ]
+        if self.__flip_x:
+            indices = indices[:, ::-1]
+        if self.__flip_y:
+            indices = indices[::-1, :]
+        return palette._colors[indices], ~palette._transparent[indices]
+
+
+class Group:
+    """A list of layers drawn in order, like ``displayio.Group``.
+
+    Position and scale live in name-mangled attributes, as in `TileGrid`, so
+    subclasses can shadow ``x`` and ``y``.
+
+    :param int scale: Scale of layer pixels in one dimension.
+    :param int x: Initial x position within the parent.
+    :param int y: Initial y position within the parent.
+    """
+
+    def __init__(self, *, scale: int = 1, x: int = 0, y: int = 0) -> None:
+        self.__scale = scale
+        self.__x = x
+        self.__y = y
+        self.__hidden = False
+        self._layers = []
+
+    @property
+    def scale(self) -> int:
+        """Scale of layer pixels in one dimension."""
+        return self.__scale
+
+    @scale.setter
+    def scale(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("scale must be >= 1")
+        self.__scale = value
+
+    @property
+    def x(self) -> int:
+        """X position of the group in the parent."""
+        return self.__x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self.__x = value
+
+    @property
+    def y(self) -> int:
+        """Y position of the group in the parent."""
+        return self.__y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self.__y = value
+
+    @property
+    def hidden(self) -> bool:
+        """True when the group and all of its layers are not visible."""
+        return self.__hidden
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        self.__hidden = value
+
+    def append(self, layer) -> None:
+        """Append a layer to the group."""
+        self._layers.append(layer)
+
+    def insert(self, index: int, layer) -> None:
+        """Insert a layer into the group."""
+        self._layers.insert(index, layer)
+
+    def index(self, layer) -> int:
+        """Return the index of the first copy of ``layer``."""
+        return self._layers.index(layer)
+
+    def pop(self, index: int = -1):
+        """Remove the ith item and return it."""
+        return self._layers.pop(index)
+
+    def remove(self, layer) -> None:
+        """Remove the first copy of ``layer``."""
+        self._layers.remove(layer)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __getitem__(self, index: int):
+        return self._layers[index]
+
+    def __setitem__(self, index: int, layer) -> None:
+        self._layers[index] = layer
+
+    def __delitem__(self, index: int) -> None:
+        del self._layers[index]
+
+    def __contains__(self, layer) -> bool:
+        return layer in self._layers
+
+
+def _clip(bitmap: Bitmap, x1: int, y1: int, x2: int, y2: int) -> Tuple[int, int, int, int]:
+    if x1 > x2:
+        x1, x2 = x2, x1
+    if y1 > y2:
+        y1, y2 = y2, y1
+    return (
+        max(0, x1),
+        max(0, y1),
+        min(bitmap.width, x2),
+        min(bitmap.height, y2),
+    )
+
+
+def fill_region(dest_bitmap: Bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    """Fill the rectangle from (x1, y1) up to, but not including, (x2, y2)."""
+    x1, y1, x2, y2 = _clip(dest_bitmap, x1, y1, x2, y2)
+    if _counting:
+        _count("fill_region", max(0, x2 - x1) * max(0, y2 - y1))
+    if x1 < x2 and y1 < y2:
+        dest_bitmap.array[y1:y2, x1:x2] = value
+
+
+def draw_line(dest_bitmap: Bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    """Draw a line from (x1, y1) to (x2, y2), inclusive.
+
+    Uses the same integer Bresenham stepping as the CircuitPython core, so the
+    pixels match the on-device rendering exactly.
+    """
+    steep = abs(y2 - y1) > abs(x2 - x1)
+    if steep:
+        x1, y1, x2, y2 = y1, x1, y2, x2
+    if x1 > x2:
+        x1, y1, x2, y2 = x2, y2, x1, y1
+    dx = x2 - x1
+    dy = abs(y2 - y1)
+    ystep = 1 if y1 < y2 else -1
+
+    # err starts at dx // 2 and y steps each time it drops below zero
+    step = np.arange(dx + 1)
+    xs = x1 + step
+    ys = y1 + ystep * np.maximum(0, -((dx // 2 - step * dy) // max(dx, 1)))
+    if steep:
+        xs, ys = ys, xs
+    inside = (xs >= 0) & (xs < dest_bitmap.width) & (ys >= 0) & (ys < dest_bitmap.height)
+    dest_bitmap.array[ys[inside], xs[inside]] = value
+    if _counting:
+        _count("draw_line", int(inside.sum()))
+
+
+def paint_fill(
+    dest_bitmap: Bitmap, x: int, y: int, value: int, background_value: Optional[int] = None
+) -> None:
+    """Flood fill the 4-connected region of ``background_value`` containing (x, y).
+
+    Works span by span, so each row run is found and filled with a single
+    vectorized operation.
+    """
+    if _counting:
+        _count("paint_fill", 0)
+    pixels = dest_bitmap.array
+    if background_value is None:
+        background_value = int(pixels[y, x])
+    if value == background_value or pixels[y, x] != background_value:
+        return
+
+    width = dest_bitmap.width
+    height = dest_bitmap.height
+    seeds = [(x, y)]
+    while seeds:
+        x, y = seeds.pop()
+        row = pixels[y]
+        if row[x] != background_value:
+            continue
+        # Grow the seed into the full run on its row
+        blocked = np.flatnonzero(row[:x] != background_value)
+        left = blocked[-1] + 1 if len(blocked) else 0
+        blocked = np.flatnonzero(row[x:] != background_value)
+        right = x + blocked[0] if len(blocked) else width
+        row[left:right] = value
+        if _counting:
+            _count(None, int(right - left))
+
+        # Seed every background run touching this one above and below
+        for neighbor in (y - 1, y + 1):
+            if 0 <= neighbor < height:
+                open_pixels = pixels[neighbor, left:right] == background_value
+                if open_pixels.any():
+                    starts = np.flatnonzero(open_pixels & ~np.r_[False, open_pixels[:-1]])
+                    seeds.extend((left + int(start), neighbor) for start in starts)
+
+
+def blit(
+    dest_bitmap: Bitmap,
+    source_bitmap: Bitmap,
+    x: int,
+    y: int,
+    *,
+    x1: int = 0,
+    y1: int = 0,
+    x2: Optional[int] = None,
+    y2: Optional[int] = None,
+    skip_source_index: Optional[int] = None,
+    skip_dest_index: Optional[int] = None,
+) -> None:
+    """Copy a rectangle of ``source_bitmap`` to (x, y) in ``dest_bitmap``."""
+    if x2 is None:
+        x2 = source_bitmap.width
+    if y2 is None:
+        y2 = source_bitmap.height
+    x1, y1, x2, y2 = _clip(source_bitmap, x1, y1, x2, y2)
+
+    # Clip the destination, shifting the source window to match
+    if x < 0:
+        x1 -= x
+        x = 0
+    if y < 0:
+        y1 -= y
+        y = 0
+    x2 = min(x2, x1 + dest_bitmap.width - x)
+    y2 = min(y2, y1 + dest_bitmap.height - y)
+    if x1 >= x2 or y1 >= y2:
+        if _counting:
+            _count("blit", 0)
+        return
+
+    source = source_bitmap.array[y1:y2, x1:x2].copy()
+    dest = dest_bitmap.array[y : y + y2 - y1, x : x + x2 - x1]
+    if skip_source_index is None and skip_dest_index is None:
+        dest[...] = source
+        if _counting:
+            _count("blit", source.size)
+        return
+    mask = np.ones(source.shape, bool)
+    if skip_source_index is not None:
+        mask &= source != skip_source_index
+    if skip_dest_index is not None:
+        mask &= dest != skip_dest_index
+    dest[mask] = source[mask]
+    if _counting:
+        _count("blit", int(mask.sum()))
+
+
+def _compose(layer, canvas: np.ndarray, x: int, y: int, scale: int) -> None:
+    if layer.hidden:
+        return
+    if isinstance(layer, Group):
+        # Read the native position, which scaled gauges shadow with their center
+        x += layer._Group__x * scale
+        y += layer._Group__y * scale
+        for child in layer:
+            _compose(child, canvas, x, y, scale * layer._Group__scale)
+        return
+
+    rgb, opaque = layer._render()
+    if scale > 1:
+        rgb = rgb.repeat(scale, 0).repeat(scale, 1)
+        opaque = opaque.repeat(scale, 0).repeat(scale, 1)
+    # Read the native position, which gauges shadow with their center
+    left = x + layer._TileGrid__x * scale
+    top = y + layer._TileGrid__y * scale
+    height, width = canvas.shape
+    clip_left = max(0, -left)
+    clip_top = max(0, -top)
+    clip_right = min(rgb.shape[1], width - left)
+    clip_bottom = min(rgb.shape[0], height - top)
+    if clip_left >= clip_right or clip_top >= clip_bottom:
+        return
+    rgb = rgb[clip_top:clip_bottom, clip_left:clip_right]
+    opaque = opaque[clip_top:clip_bottom, clip_left:clip_right]
+    region = canvas[
+        top + clip_top : top + clip_bottom, left + clip_left : left + clip_right
+    ]
+    region[opaque] = rgb[opaque]
+
+
+def compose(root, width: int, height: int, background: int = 0x000000) -> np.ndarray:
+    """Composite a layer tree the way a display would.
+
+    :param root: A `Group` or `TileGrid` (including a `gauge.Gauge`).
+    :param int width: The width of the virtual display.
+    :param int height: The height of the virtual display.
+    :param int background: The color shown where no layer is opaque.
+    :return: A ``(height, width)`` array of ``0xRRGGBB`` colors.
+    """
+    canvas = np.full((height, width), background, np.uint32)
+    _compose(root, canvas, 0, 0, 1)
+    return canvas
+
+
+class Display:
+    """A virtual display that composites its root group on refresh, like ``board.DISPLAY``.
+
+    ``refresh`` follows CircuitPython's frame pacing: with auto-refresh off and a
+    target frame rate, it waits to align with the frame rate, and returns
+    ``False`` without refreshing when the previous call was more than one frame
+    ago.
+
+    :param int width: The width of the display in pixels.
+    :param int height: The height of the display in pixels.
+    :param bool auto_refresh: The initial `auto_refresh` setting.
+    :param int background: The color shown where no layer is opaque.
+    :param FramebufferSink|None sink: Also write every refreshed frame to this sink.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        auto_refresh: bool = True,
+        background: int = 0x000000,
+        sink: Optional["FramebufferSink"] = None,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.auto_refresh = auto_refresh
+        """Ignored here; frames are only produced by `refresh`."""
+        self.root_group = None
+        """The `Group` or `TileGrid` shown on the display."""
+        self.background = background
+        self.sink = sink
+        """The `FramebufferSink` refreshed frames are written to, if any."""
+        self.frame = None
+        """The last refreshed frame, as returned by `compose`."""
+        self.refreshes = 0
+        """The number of refreshes that updated `frame`."""
+        self._last_refresh = None
+        self._last_call = None
+
+    def show(self, group) -> None:
+        """Show ``group`` on the display (older CircuitPython API)."""
+        self.root_group = group
+
+    def refresh(
+        self,
+        *,
+        target_frames_per_second: Optional[int] = None,
+        minimum_frames_per_second: int = 0,
+    ) -> bool:
+        """Composite the root group into `frame`.
+
+        :return: ``False`` if the refresh was skipped to catch up with the frame rate.
+        """
+        now = time.monotonic_ns() // 1_000_000
+        if (
+            not self.auto_refresh
+            and target_frames_per_second is not None
+            and self._last_refresh is not None
+        ):
+            frame_ms = 1000 // target_frames_per_second
+            since_refresh = now - self._last_refresh
+            if minimum_frames_per_second and since_refresh > 1000 // minimum_frames_per_second:
+                raise RuntimeError("Below minimum frame rate")
+            since_call = now - self._last_call
+            self._last_call = now
+            if since_call > frame_ms:
+                return False
+            remaining = frame_ms - since_refresh % frame_ms
+            if remaining:
+                time.sleep(remaining / 1000)
+                now += remaining
+        self._last_call = now
+        self._last_refresh = now
+        if self.root_group is None:
+            self.frame = np.full((self.height, self.width), self.background, np.uint32)
+        else:
+            self.frame = compose(self.root_group, self.width, self.height, self.background)
+        if self.sink is not None:
+            self.sink.write(self.frame)
+        self.refreshes += 1
+        return True
+
+
+def to_rgb565(colors: np.ndarray, swap_bytes: bool = False) -> np.ndarray:
+    """Convert an array of ``0xRRGGBB`` colors to RGB565 in one vectorized pass.
+
+    :param bool swap_bytes: Return big-endian values, as many SPI panels expect.
+    """
+    colors = colors.astype(np.uint32, copy=False)
+    rgb565 = (
+        (colors >> 8 & 0xF800) | (colors >> 5 & 0x07E0) | (colors >> 3 & 0x001F)
+    ).astype(np.uint16)
+    return rgb565.byteswap() if swap_bytes else rgb565
+
+
+class FramebufferSink:
+    """Write composed frames as RGB565 straight into a writable buffer.
+
+    The buffer can be an ``mmap`` of a Linux framebuffer or a shared-memory
+    file, or any writable object with the buffer protocol. It is wrapped in a
+    NumPy view, never copied. Each frame is converted in one pass and compared
+    row by row with a shadow copy of the last frame written, so the target is
+    never read back, and only rows that changed are written. The first frame,
+    and the first after `invalidate`, is written in full.
+
+    :param buffer: The writable target, at least ``height * stride`` bytes.
+    :param int width: The frame width in pixels.
+    :param int height: The frame height in pixels.
+    :param int|None stride: Bytes per buffer row, such as a framebuffer's
+                            ``line_length``. Defaults to ``width * 2``.
+    :param bool swap_bytes: Store big-endian RGB565.
+    """
+
+    def __init__(
+        self,
+        buffer,
+        width: int,
+        height: int,
+        *,
+        stride: Optional[int] = None,
+        swap_bytes: bool = False,
+    ) -> None:
+        stride = stride if stride is not None else width * 2
+        if stride < width * 2 or stride % 2:
+            raise ValueError("stride must be even and hold a full row")
+        self.width = width
+        self.height = height
+        self.swap_bytes = swap_bytes
+        self.rows_written = 0
+        """The number of buffer rows written so far."""
+        self._file = None
+        self._mmap = None
+        rows = np.ndarray((height, stride // 2), np.uint16, buffer=buffer)
+        self._pixels = rows[:, :width]
+        self._shadow = np.zeros((height, width), np.uint16)
+        self._shadow_valid = False
+
+    @classmethod
+    def open(
+        cls,
+        path: str,
+        width: int,
+        height: int,
+        *,
+        stride: Optional[int] = None,
+        swap_bytes: bool = False,
+    ) -> "FramebufferSink":
+        """Map ``path``, such as ``/dev/fb0`` or a file in ``/dev/shm``, and write into it.
+
+        Regular files are grown to fit the frame.
+        """
+        size = height * (stride if stride is not None else width * 2)
+        file = open(path, "r+b" if os.path.exists(path) else "w+b")  # pylint: disable=consider-using-with
+        try:
+            if os.path.isfile(path) and os.path.getsize(path) < size:
+                file.truncate(size)
+            mapping = mmap.mmap(file.fileno(), size)
+        except Exception:
+            file.close()
+            raise
+        sink = cls(mapping, width, height, stride=stride, swap_bytes=swap_bytes)
+        sink._file = file
+        sink._mmap = mapping
+        return sink
+
+    @property
+    def pixels(self) -> np.ndarray:
+        """The ``(height, width)`` RGB565 view of the buffer."""
+        return self._pixels
+
+    def write(self, frame: np.ndarray) -> int:
+        """Write a frame of ``0xRRGGBB`` colors, as from `compose`, skipping unchanged rows.
+
+        :return: The number of rows written.
+        """
+        rgb565 = to_rgb565(frame, self.swap_bytes)
+        shadow = self._shadow
+        if self._shadow_valid:
+            changed = np.flatnonzero((rgb565 != shadow).any(axis=1))
+        else:
+            changed = np.arange(len(rgb565))
+            self._shadow_valid = True
+        if len(changed) == len(rgb565):
+            self._pixels[:] = rgb565
+            shadow[:] = rgb565
+        elif len(changed):
+            self._pixels[changed] = rgb565[changed]
+            shadow[changed] = rgb565[changed]
+        self.rows_written += len(changed)
+        return len(changed)
+
+    def invalidate(self) -> None:
+        """Write the next frame in full, after something else has drawn into the buffer."""
+        self._shadow_valid = False
+
+    def show(self, root) -> int:
+        """Composite ``root`` and write it. See `write`."""
+        return self.write(compose(root, self.width, self.height))
+
+    def close(self) -> None:
+        """Unmap and close a sink made by `open`."""
+        # Drop the NumPy view first, mmap refuses to close while it is exported
+        self._pixels = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "FramebufferSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def install() -> None:
+    """Register this backend as the ``displayio`` and ``bitmaptools`` modules.
+
+    Call it before importing `gauge` (or anything else that imports them).
+    """
+    displayio = types.ModuleType("displayio")
+    displayio.__doc__ = "Headless displayio backed by gauge_headless."
+    for name in ("Bitmap", "OnDiskBitmap", "Palette", "TileGrid", "Group", "Display"):
+        setattr(displayio, name, globals()[name])
+    bitmaptools = types.ModuleType("bitmaptools")
+    bitmaptools.__doc__ = "Headless bitmaptools backed by gauge_headless."
+    for name in ("blit", "draw_line", "fill_region", "paint_fill"):
+        setattr(bitmaptools, name, globals()[name])
+    sys.modules["displayio"] = displayio
+    sys.modules["bitmaptools"] = bitmaptools
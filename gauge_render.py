@@ -0,0 +1,315 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_render`
+================================================================================
+
+Batch renderer for `gauge` images.
+
+Runs on CPython through the `gauge_headless` backend. Takes a stream of gauge
+configs and progress values, draws them with the same code as the device, and
+writes each one as an indexed PNG or BMP. The palette indices match the bitmap
+of an on-device `Gauge` with the same options pixel for pixel. With
+``incremental`` set, the BMP files are also byte-identical to the sprite sheet
+cache files `gauge` writes for the same frame, which are drawn the same way.
+
+Records are JSON objects, one per line, with the `Gauge` shape, colors and
+drawing mode (``radius``, ``width``, ``outline``, ``fill``, ``background``,
+``zones``, ``segmented``, ``start_angle``, ``sweep``, ``incremental``), the
+``progress`` and optionally an ``output`` file name. Large batches are spread
+over a process pool.
+
+.. code-block:: shell
+
+    python gauge_render.py records.jsonl --output-dir out --format png
+    generate_records | python gauge_render.py - --output-dir out --workers 8
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* CPython 3 with NumPy
+"""
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+
+try:
+    from typing import Iterable, Iterator, List, Optional
+except ImportError:
+    pass
+
+import numpy as np
+
+import gauge_headless
+
+gauge_headless.install()
+
+# pylint: disable=wrong-import-position
+import gauge
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/your_repo/Adafruit_CircuitPython_Display_Shapes.git"
+
+FORMATS = ("png", "bmp")
+CONFIG_KEYS = (
+    "radius", "width", "outline", "fill", "background", "zones", "segmented", "start_angle",
+    "sweep", "incremental",
+)
+
+# Batches smaller than this are rendered in-process
+PARALLEL_THRESHOLD = 2048
+# Records sent to a worker at a time
+CHUNK_SIZE = 1024
+# Gauges kept per process, reused across records with the same config
+_GAUGE_CACHE_SIZE = 64
+
+_gauges = {}
+
+
+def _config_key(record: dict) -> tuple:
+    """Return a hashable key for the gauge config in ``record``."""
+    unknown = set(record) - set(CONFIG_KEYS) - {"progress", "output"}
+    if unknown:
+        raise ValueError("Unknown record keys: " + ", ".join(sorted(unknown)))
+    zones = record.get("zones")
+    return (
+        record["radius"],
+        record["width"],
+        record.get("outline", 0xFFFFFF),
+        record.get("fill", 0x00FF00),
+        record.get("background", 0x000000),
+        tuple(tuple(zone) for zone in zones) if zones else None,
+        bool(record.get("segmented", False)),
+        record.get("start_angle", 315) % 360,
+        record.get("sweep", 270),
+        bool(record.get("incremental", False)),
+    )
+
+
+def _gauge_for(key: tuple) -> gauge.Gauge:
+    """Return this process's gauge for ``key``, building it on first use.
+
+    Gauges are reused, so a new value only redraws the part of the ring that
+    changed. Base frames and angle indices are shared through the `gauge`
+    geometry cache.
+    """
+    subject = _gauges.get(key)
+    if subject is None:
+        if len(_gauges) >= _GAUGE_CACHE_SIZE:
+            _gauges.clear()
+        (
+            radius, width, outline, fill, background, zones, segmented, start_angle, sweep,
+            incremental,
+        ) = key
+        subject = _gauges[key] = gauge.Gauge(
+            radius, radius, radius, width,
+            outline=outline, fill=fill, background=background,
+            incremental=incremental, zones=list(zones) if zones else None, segmented=segmented,
+            start_angle=start_angle, sweep=sweep,
+        )
+    return subject
+
+
+def _colors(subject: gauge.Gauge) -> List[int]:
+    palette = subject._palette  # pylint: disable=protected-access
+    return [palette[index] for index in range(len(palette))]
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data)) + kind + data
+        + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(indices: np.ndarray, colors: List[int]) -> bytes:
+    """Encode a ``(height, width)`` array of palette indices as an 8-bit indexed PNG."""
+    height, width = indices.shape
+    rows = np.zeros((height, width + 1), np.uint8)
+    rows[:, 1:] = indices
+    palette = b"".join(struct.pack(">I", color)[1:] for color in colors)
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)),
+        _chunk(b"PLTE", palette),
+        _chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)),
+        _chunk(b"IEND", b""),
+    ))
+
+
+def encode_bmp(indices: np.ndarray, colors: List[int]) -> bytes:
+    """Encode a ``(height, width)`` array of palette indices as an indexed BMP.
+
+    Matches the layout of the files written by ``gauge._save_bmp``: four bits
+    per pixel for up to 16 colors, eight otherwise, rows bottom-up.
+    """
+    height, width = indices.shape
+    count = len(colors)
+    depth = 4 if count <= 16 else 8
+    stride = (width * depth + 31) // 32 * 4
+    offset = 14 + 40 + 4 * count
+    if depth == 4:
+        packed = np.zeros((height, (width + 1) // 2 * 2), np.uint8)
+        packed[:, :width] = indices
+        packed = packed[:, 0::2] << 4 | packed[:, 1::2]
+    else:
+        packed = indices.astype(np.uint8)
+    rows = np.zeros((height, stride), np.uint8)
+    rows[:, : packed.shape[1]] = packed
+    return b"".join((
+        struct.pack("<2sIHHI", b"BM", offset + stride * height, 0, 0, offset),
+        struct.pack(
+            "<IiiHHIIiiII", 40, width, height, 1, depth, 0, stride * height, 2835, 2835, count, count
+        ),
+        b"".join(
+            struct.pack("<BBBB", color & 0xFF, color >> 8 & 0xFF, color >> 16, 0)
+            for color in colors
+        ),
+        rows[::-1].tobytes(),
+    ))
+
+
+_ENCODERS = {"png": encode_png, "bmp": encode_bmp}
+
+
+def render(record: dict, image_format: str = "png") -> bytes:
+    """Render one record and return the encoded image.
+
+    :param dict record: The gauge config and its ``progress``.
+    :param str image_format: ``"png"`` or ``"bmp"``.
+    """
+    subject = _gauge_for(_config_key(record))
+    subject.progress = record.get("progress", 0)
+    return _ENCODERS[image_format](subject.bitmap.array, _colors(subject))
+
+
+def _output_name(record: dict, number: int, image_format: str) -> str:
+    """Return the file name for ``record``, which must stay inside the output directory."""
+    name = record.get("output")
+    if not name:
+        return "{:08d}.{}".format(number, image_format)
+    separators = {"/", os.sep, os.altsep} - {None}
+    if name in (".", "..") or any(separator in name for separator in separators):
+        raise ValueError("Output must be a plain file name: " + repr(name))
+    return name
+
+
+def _render_chunk(chunk: List[tuple], directory: str, image_format: str) -> int:
+    """Render ``(number, record)`` pairs to files in ``directory``, grouped by config."""
+    encoder = _ENCODERS[image_format]
+    keyed = sorted(
+        ((_config_key(record), number, record) for number, record in chunk),
+        key=lambda item: (repr(item[0]), item[2].get("progress", 0)),
+    )
+    for key, number, record in keyed:
+        subject = _gauge_for(key)
+        subject.progress = record.get("progress", 0)
+        name = _output_name(record, number, image_format)
+        with open(os.path.join(directory, name), "wb") as file:
+            file.write(encoder(subject.bitmap.array, _colors(subject)))
+    return len(keyed)
+
+
+def render_batch(
+    records: Iterable[dict],
+    directory: str = ".",
+    image_format: str = "png",
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Render ``records`` to image files in ``directory``.
+
+    Files are named by the record's ``output`` key, a plain file name without
+    any directory part, or by the record's position in the stream. The stream is read in chunks. A single chunk is rendered
+    in-process. Longer streams go to a process pool, with a bounded number of
+    chunks in flight.
+
+    :param workers: Worker processes, 1 to stay in-process, ``None`` for the CPU count.
+    :return: The number of images written.
+    """
+    if image_format not in _ENCODERS:
+        raise ValueError("Unsupported format: " + image_format)
+    os.makedirs(directory, exist_ok=True)
+    numbered = enumerate(records)
+    first = list(itertools.islice(numbered, PARALLEL_THRESHOLD))
+    if workers == 1 or len(first) < PARALLEL_THRESHOLD:
+        written = _render_chunk(first, directory, image_format)
+        for chunk in _chunks(numbered, chunk_size):
+            written += _render_chunk(chunk, directory, image_format)
+        return written
+
+    written = 0
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        limit = 2 * (workers or os.cpu_count() or 1)
+        pending = set()
+        for chunk in _chunks(itertools.chain(first, numbered), chunk_size):
+            if len(pending) >= limit:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                written += sum(future.result() for future in done)
+            pending.add(pool.submit(_render_chunk, chunk, directory, image_format))
+        written += sum(future.result() for future in concurrent.futures.as_completed(pending))
+    return written
+
+
+def _chunks(items: Iterator, size: int) -> Iterator[list]:
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_records(stream) -> Iterator[dict]:
+    """Yield the JSON records in ``stream``, one per non-blank line."""
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("records", help="JSON lines file of records, or - for stdin")
+    parser.add_argument("--output-dir", default=".", help="directory to write the images to")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="image format")
+    parser.add_argument(
+        "--workers", type=int, help="worker processes (default: CPU count, 1 for in-process)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="records per task")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.records == "-":
+        written = render_batch(
+            read_records(sys.stdin), args.output_dir, args.format, args.workers, args.chunk_size
+        )
+    else:
+        with open(args.records, encoding="utf-8") as file:
+            written = render_batch(
+                read_records(file), args.output_dir, args.format, args.workers, args.chunk_size
+            )
+    elapsed = time.perf_counter() - start
+    print(
+        "Rendered {} images in {:.2f}s ({:.0f}/min)".format(
+            written, elapsed, written * 60 / elapsed if elapsed else 0
+        ),
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
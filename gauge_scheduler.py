@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gauge_scheduler`
+================================================================================
+
+Frame-paced display refreshes for `gauge`.
+
+`GaugeDisplayScheduler` queues the progress and color changes of its gauges,
+keeps only the latest of each, and draws them all right before a single
+display refresh per frame.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+import time
+
+from gauge_animation import _wait_for_frame
+
+
+# How early GaugeDisplayScheduler.run wakes up, leaving display.refresh to align the frame
+_REFRESH_LEAD_NS = 2_000_000
+
+
+class GaugeDisplayScheduler:
+    """Apply gauge updates in batches, with one display refresh per frame.
+
+    Progress and color assignments on registered gauges are queued instead of
+    drawn right away. Once per frame the scheduler applies only the latest
+    queued value of each gauge property and then refreshes the display itself,
+    so the display never shows a set of gauges caught mid-update. Queued values
+    read back from the gauge properties before they are drawn.
+
+    Call `refresh` once per pass of a plain main loop, or run `run` as an
+    asyncio task.
+
+    :param display: The display to refresh, such as ``board.DISPLAY``. Its
+                    ``auto_refresh`` is off until `close` restores it.
+    :param int frame_rate: The target number of frames per second.
+    """
+
+    def __init__(self, display, frame_rate: int = 30) -> None:
+        self.display = display
+        self.frame_rate = frame_rate
+        self._frame_ns = 1_000_000_000 // frame_rate
+        self._auto_refresh = display.auto_refresh
+        display.auto_refresh = False
+        self._gauges = []
+        self._pending = {}
+        self._closed = False
+        self.frames = 0
+        """The number of frames refreshed."""
+        self.dropped_frames = 0
+        """The number of frames skipped, by the display or for running over budget."""
+        self.applied_updates = 0
+        """The number of queued assignments drawn."""
+        self.merged_updates = 0
+        """The number of queued assignments replaced by a newer one before being drawn."""
+
+    def register(self, gauge) -> None:
+        """Queue the progress and color changes of ``gauge`` from now on."""
+        if gauge not in self._gauges:
+            self._gauges.append(gauge)
+            gauge._scheduler = self  # pylint: disable=protected-access
+
+    def unregister(self, gauge) -> None:
+        """Apply the queued changes of ``gauge`` and let it draw immediately again."""
+        if gauge in self._gauges:
+            self._apply(gauge, self._pending.pop(gauge, None))
+            self._gauges.remove(gauge)
+            gauge._scheduler = None  # pylint: disable=protected-access
+
+    def request(self, gauge, key, value) -> None:
+        """Queue ``value`` for a gauge property.
+
+        :param key: ``"progress"``, or the palette index of a color.
+        """
+        changes = self._pending.get(gauge)
+        if changes is None:
+            changes = self._pending[gauge] = {}
+        elif key in changes:
+            self.merged_updates += 1
+        changes[key] = value
+
+    def pending(self, gauge, key, default):
+        """Return the queued value of a gauge property, or ``default`` if none is queued."""
+        changes = self._pending.get(gauge)
+        if changes is None:
+            return default
+        return changes.get(key, default)
+
+    def _apply(self, gauge, changes: Optional[dict]) -> None:
+        if not changes:
+            return
+        for key, value in changes.items():
+            if key == "progress":
+                gauge.set_progress(value)
+            else:
+                gauge._set_color(key, value)  # pylint: disable=protected-access
+            self.applied_updates += 1
+
+    def apply(self) -> int:
+        """Draw every queued change without refreshing the display.
+
+        :return: The number of gauges that had changes queued.
+        """
+        pending = self._pending
+        self._pending = {}
+        for gauge, changes in pending.items():
+            self._apply(gauge, changes)
+        return len(pending)
+
+    def refresh(self) -> bool:
+        """Draw every queued change, then refresh the display at the target frame rate.
+
+        :return: ``False`` if the display skipped the refresh to catch up.
+        """
+        self.apply()
+        refreshed = self.display.refresh(target_frames_per_second=self.frame_rate)
+        if refreshed:
+            self.frames += 1
+        else:
+            self.dropped_frames += 1
+        return refreshed
+
+    async def run(self) -> None:
+        """Refresh once per frame until `close` is called."""
+        deadline = time.monotonic_ns()
+        while not self._closed:
+            self.refresh()
+            deadline = await _wait_for_frame(self, deadline, _REFRESH_LEAD_NS)
+
+    def close(self) -> None:
+        """Apply queued changes, release every gauge and restore ``auto_refresh``."""
+        self._closed = True
+        for gauge in list(self._gauges):
+            self.unregister(gauge)
+        self.display.auto_refresh = self._auto_refresh
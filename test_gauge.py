@@ -0,0 +1,468 @@
+# SPDX-FileCopyrightText: 2024 Gary Zielke
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`test_gauge`
+================================================================================
+
+Pixel regression tests for `gauge`, run on CPython through `gauge_headless`.
+
+Updated gauges must show exactly what a gauge built at the same progress shows,
+in every drawing mode, and the default outline must stay pixel-identical to the
+baseline per-pixel rasterizer.
+
+.. code-block:: shell
+
+    python -m pytest -q test_gauge.py
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* CPython 3 with NumPy and pytest
+"""
+
+import asyncio
+import math
+import random
+import time
+
+import numpy as np
+import pytest
+
+import gauge_headless
+
+gauge_headless.install()
+
+# pylint: disable=wrong-import-position
+import bitmaptools
+import displayio
+import gauge
+
+SHAPES = [(9, 3), (30, 7), (57, 19)]
+
+MODES = {
+    "spans": {},
+    "incremental": {"incremental": True},
+    "needle": {"needle": True},
+    "zones": {"zones": [(40, 0xFF0000), (75, 0x0000FF)]},
+    "segmented": {"zones": [(40, 0xFF0000), (75, 0x0000FF)], "segmented": True},
+    "sprite_steps": {"sprite_steps": 24},
+    "tile_size": {"tile_size": 8},
+    "readout": {"readout": "{:.0f}"},
+    "half_dial": {"start_angle": 270, "sweep": 180},
+    "full_ring": {"start_angle": 0, "sweep": 360},
+    "quarter_needle": {"start_angle": 225, "sweep": 90, "needle": True},
+}
+
+
+def _progress_values(seed: int) -> list:
+    """Random values, plus the ends and a few exact repeats and reversals."""
+    rng = random.Random(seed)
+    values = [rng.uniform(0, 100) for _ in range(12)]
+    return values + [0, 100, 100, 50, 0, 0.1, 99.9, 37.5, 37.5]
+
+
+def _screen(subject, radius: int) -> np.ndarray:
+    return gauge_headless.compose(subject, 2 * radius + 4, 2 * radius + 4)
+
+
+def _baseline_outline(radius: int, width: int) -> np.ndarray:
+    """Rasterize an empty 270 degree gauge the way the original per-pixel code did.
+
+    Six Bresenham octants of the outer and inner arcs, skipping the two at the
+    bottom, joined by lines between their end points. The center is at
+    (``radius``, ``radius``).
+    """
+    bitmap = displayio.Bitmap(2 * radius + 1, math.ceil(0.71 * radius) + radius + 1, 3)
+    ends = []
+    for arc in (radius, radius - width + 1):
+        x = 0
+        y = arc
+        d = 3 - 2 * arc
+        while x <= y:
+            for dx, dy in ((-x, -y), (x, -y), (y, x), (-y, x), (-y, -x), (y, -x)):
+                bitmap[radius + dx, radius + dy] = 1
+            if d <= 0:
+                d = d + 4 * x + 6
+            else:
+                d = d + 4 * (x - y) + 10
+                y -= 1
+            x += 1
+        ends.append(x - 1)
+    outer, inner = ends
+    bitmaptools.draw_line(bitmap, radius + outer, radius + outer, radius + inner, radius + inner, 1)
+    bitmaptools.draw_line(bitmap, radius - outer, radius + outer, radius - inner, radius + inner, 1)
+    return np.array(bitmap.array)
+
+
+@pytest.mark.parametrize("mode", sorted(MODES))
+@pytest.mark.parametrize("radius, width", SHAPES)
+def test_updates_match_fresh_renders(mode, radius, width):
+    options = MODES[mode]
+    if mode == "readout" and radius < 20:
+        pytest.skip("the readout does not fit inside small gauges")
+    center = radius + 1
+    subject = gauge.Gauge(center, center, radius, width, 0, **options)
+    for value in _progress_values(radius):
+        subject.progress = value
+        fresh = gauge.Gauge(center, center, radius, width, value, **options)
+        assert np.array_equal(_screen(subject, radius), _screen(fresh, radius)), value
+
+
+@pytest.mark.parametrize("radius, width", SHAPES)
+def test_sprite_frames_match_span_renders(radius, width):
+    center = radius + 1
+    steps = 24
+    subject = gauge.Gauge(center, center, radius, width, 0, sprite_steps=steps)
+    for frame in list(range(steps + 1)) + [steps // 2, 0]:
+        value = frame * 100 / steps
+        subject.progress = value
+        fresh = gauge.Gauge(center, center, radius, width, value)
+        assert np.array_equal(_screen(subject, radius), _screen(fresh, radius)), frame
+
+
+DIALS = [{}, {"start_angle": 270, "sweep": 180}, {"start_angle": 0, "sweep": 360}]
+
+
+@pytest.mark.parametrize("dial", DIALS)
+@pytest.mark.parametrize("radius, width", SHAPES + [(16, 16), (44, 2)])
+def test_indexed_renders_match_span_renders(radius, width, dial):
+    center = radius + 1
+    geometry = gauge._get_geometry(radius, width, **dial)  # pylint: disable=protected-access
+    for level in range(geometry.steps + 1):
+        value = level * 100 / geometry.steps
+        indexed = gauge.Gauge(center, center, radius, width, value, incremental=True, **dial)
+        spans = gauge.Gauge(center, center, radius, width, value, **dial)
+        assert np.array_equal(_screen(indexed, radius), _screen(spans, radius)), level
+
+
+@pytest.mark.parametrize("radius", [2, 3, 5, 8, 13, 21, 34, 55, 89, 144])
+def test_default_outline_matches_baseline(radius):
+    for width in sorted({2, 3, 4, radius // 3, radius // 2, radius}):
+        if not 2 <= width <= radius:
+            continue
+        expected = _baseline_outline(radius, width)
+        subject = gauge.Gauge(radius, radius, radius, width, 0)
+        geometry = subject._geometry  # pylint: disable=protected-access
+        bitmap = np.array(subject.bitmap.array)
+        # The new bitmap is cropped to the outline, so place it by its center
+        top = radius - geometry.center_y
+        left = radius - geometry.center_x
+        placed = np.zeros_like(expected)
+        placed[top:top + bitmap.shape[0], left:left + bitmap.shape[1]] = bitmap
+        assert np.array_equal(placed, expected), width
+
+
+def test_readout_keeps_leading_digits():
+    subject = gauge.Gauge(40, 40, 38, 6, 37.5, readout="{:g}")
+    assert subject.readout.strip() == "37.5"
+    subject.progress = 100
+    assert subject.readout.strip() == "100"
+    with pytest.raises(ValueError):
+        subject.progress = 0.000123
+
+
+def test_lazy_gauges_defer_the_angle_index():
+    geometry = gauge._get_geometry(23, 5)  # pylint: disable=protected-access
+    geometry._angle_index = None  # pylint: disable=protected-access
+    subject = gauge.Gauge(24, 24, 23, 5, 40, incremental=True, lazy=True)
+    assert geometry._angle_index is None  # pylint: disable=protected-access
+    subject.render()
+    assert geometry._angle_index is not None  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_sprite_sheets_fall_back_when_out_of_memory(monkeypatch, lazy):
+    radius = 30
+    frame = gauge._get_geometry(radius, 7)  # pylint: disable=protected-access
+    limit = frame.bitmap_width * frame.bitmap_height
+
+    class SmallBitmap(displayio.Bitmap):
+        def __init__(self, width, height, value_count):
+            if width * height > limit:
+                raise MemoryError
+            super().__init__(width, height, value_count)
+
+    monkeypatch.setattr(displayio, "Bitmap", SmallBitmap)
+    subject = gauge.Gauge(radius + 1, radius + 1, radius, 7, 40, sprite_steps=24, lazy=lazy)
+    subject.hidden = False
+    assert subject.rendered and subject.step == 100 / frame.steps
+    subject.progress = 70
+    monkeypatch.undo()
+    fresh = gauge.Gauge(radius + 1, radius + 1, radius, 7, 70)
+    assert np.array_equal(_screen(subject, radius), _screen(fresh, radius))
+
+
+def test_frame_cache_leaves_other_files_alone(tmp_path):
+    user_files = {"VERSION": "1.2.3", "deadbeef.bmp": "photo", "holiday.bmp": "photo"}
+    for name, text in user_files.items():
+        (tmp_path / name).write_text(text)
+    frames = tmp_path / "gauge_cache"
+    frames.mkdir()
+    (frames / "VERSION").write_text("stale")
+    (frames / "0000abcd.bmp").write_text("old frames")
+    (frames / "notes.txt").write_text("kept")
+    gauge._frame_cache_dirs.discard(str(tmp_path))  # pylint: disable=protected-access
+    gauge.Gauge(30, 30, 20, 4, 50, sprite_steps=10, cache_dir=str(tmp_path))
+    for name, text in user_files.items():
+        assert (tmp_path / name).read_text() == text
+    assert not (frames / "0000abcd.bmp").exists()
+    assert (frames / "notes.txt").exists()
+    assert (frames / "VERSION").read_text() == gauge.__version__
+    assert len(list(frames.glob("*.bmp"))) == 1
+
+
+@pytest.mark.parametrize("name", ["../escaped.png", "/tmp/escaped.png", "sub/escaped.png", ".."])
+def test_render_batch_keeps_outputs_in_its_directory(tmp_path, name):
+    import gauge_render  # pylint: disable=import-outside-toplevel
+
+    directory = tmp_path / "out"
+    records = [{"radius": 10, "width": 3, "progress": 40, "output": name}]
+    with pytest.raises(ValueError):
+        gauge_render.render_batch(records, str(directory), workers=1)
+    assert not (tmp_path / "escaped.png").exists()
+    records[0]["output"] = "kept.png"
+    assert gauge_render.render_batch(records, str(directory), workers=1) == 1
+    assert (directory / "kept.png").exists()
+
+
+def test_framebuffer_sink_writes_changed_rows_from_its_shadow():
+    target = bytearray(6 * 4 * 2)
+    sink = gauge_headless.FramebufferSink(target, 4, 6)
+    frame = np.zeros((6, 4), np.uint32)
+    assert sink.write(frame) == 6
+    frame[2, 1] = 0xFFFFFF
+    assert sink.write(frame) == 1
+    assert sink.pixels[2, 1] == 0xFFFF
+    # The target is never read back, so outside writes go unnoticed until invalidated
+    target[:] = bytes(len(target))
+    assert sink.write(frame) == 0
+    sink.invalidate()
+    assert sink.write(frame) == 6
+    assert sink.pixels[2, 1] == 0xFFFF
+
+
+def test_bitmap_buffer_is_a_writable_view():
+    bitmap = displayio.Bitmap(5, 3, 4)
+    view = bitmap.buffer()
+    view[7] = 3
+    assert bitmap[2, 1] == 3 and len(view) == 15
+
+
+def test_stats_and_allocation_check_stack_in_any_order(monkeypatch):
+    import gc  # pylint: disable=import-outside-toplevel
+
+    heap = [0]
+
+    def mem_alloc():
+        heap[0] += 16  # every call looks like an allocation
+        return heap[0]
+
+    monkeypatch.setattr(gc, "mem_alloc", mem_alloc, raising=False)
+    subject = gauge.Gauge(24, 24, 20, 5, 0)
+    subject.enable_allocation_check()
+    subject.enable_stats()
+    with pytest.raises(RuntimeError):
+        subject.progress = 10
+    subject.disable_stats()
+    with pytest.raises(RuntimeError):
+        subject.progress = 20
+    counters = subject.enable_stats()
+    subject.disable_allocation_check()
+    subject.progress = 30
+    assert counters["updates"] == 1
+    subject.disable_stats()
+    assert "set_progress" not in vars(subject)
+    subject.progress = 40
+
+
+def test_scheduled_progress_reads_back_clamped():
+    import gauge_scheduler  # pylint: disable=import-outside-toplevel
+
+    display = gauge_headless.Display(64, 64)
+    scheduler = gauge_scheduler.GaugeDisplayScheduler(display)
+    subject = gauge.Gauge(24, 24, 20, 5, 0)
+    scheduler.register(subject)
+    subject.progress = 150
+    assert subject.progress == 100
+    subject.progress = -5
+    assert subject.progress == 0 and scheduler.merged_updates == 1
+    scheduler.apply()
+    assert subject.progress == 0
+    scheduler.close()
+    assert display.auto_refresh
+
+
+def test_animate_to_reaches_the_target():
+    import gauge_animation  # pylint: disable=import-outside-toplevel
+
+    subject = gauge.Gauge(24, 24, 20, 5, 10)
+    animator = gauge_animation.GaugeAnimator(frame_rate=200)
+    reached = asyncio.run(subject.animate_to(60, 0.05, gauge_animation.ease_in_out, animator))
+    assert reached and subject.progress == 60 and animator.frames > 1
+    assert asyncio.run(subject.animate_to(20, 0.01))
+    assert subject.progress == 20
+
+
+class _Clock:
+    """A `time.monotonic_ns` stand-in that only moves when told to."""
+
+    def __init__(self, monkeypatch):
+        self.now = 1_000_000_000
+        monkeypatch.setattr(time, "monotonic_ns", lambda: self.now)
+
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * 1_000_000_000)
+
+
+def test_binding_smooths_readings():
+    subject = gauge.Gauge(24, 24, 20, 5, 0)
+    shown = []
+    median = subject.bind(None, smoothing="median", window=3)
+    for reading in (10, 90, 20, 30):
+        median.push(reading)
+        shown.append(subject.progress)
+    assert shown == [10, 90, 20, 30]
+    ema = subject.bind(None, minimum=0, maximum=200, smoothing="ema", alpha=0.5)
+    shown = []
+    for reading in (0, 200, 200):
+        ema.push(reading)
+        shown.append(subject.progress)
+    assert shown == [0, 50, 75]
+
+
+def test_binding_hysteresis_drops_small_changes():
+    subject = gauge.Gauge(24, 24, 20, 5, 0)
+    binding = subject.bind([50, 53, 60, 57, 56], hysteresis=5)
+    assert binding.run() == 2
+    assert binding.readings == 5 and subject.progress == 60
+
+
+def test_binding_rate_limit_holds_and_flushes(monkeypatch):
+    clock = _Clock(monkeypatch)
+    subject = gauge.Gauge(24, 24, 20, 5, 0)
+    binding = subject.bind(None, hysteresis=5, max_rate=10)
+    assert binding.push(50)
+    clock.advance(0.01)
+    assert not binding.push(70) and not binding.push(90)
+    assert subject.progress == 50
+    assert binding.flush() and subject.progress == 90
+    assert not binding.flush()
+    # A held value is dropped once readings return within the band
+    clock.advance(0.01)
+    assert not binding.push(30)
+    assert not binding.push(88)
+    assert not binding.flush() and subject.progress == 90
+    clock.advance(0.1)
+    assert binding.push(30) and subject.progress == 30
+    assert binding.updates == 3
+
+
+class _EPaperDisplay:
+    """Just enough of an ``EPaperDisplay`` for `gauge_epaper.GaugeEPaperPolicy`."""
+
+    width = 200
+    height = 100
+
+    def __init__(self):
+        self.time_to_refresh = 0
+        self.busy = False
+        self.refused = False
+        self.refreshes = 0
+
+    def refresh(self):
+        if self.refused:
+            raise RuntimeError("Refresh too soon")
+        self.refreshes += 1
+
+
+def _epaper_gauge(threshold=None, max_staleness=60):
+    import gauge_epaper  # pylint: disable=import-outside-toplevel
+
+    display = _EPaperDisplay()
+    policy = gauge_epaper.GaugeEPaperPolicy(
+        display, threshold=threshold, max_staleness=max_staleness
+    )
+    subject = gauge.Gauge(24, 24, 20, 5, 0)
+    policy.register(subject)
+    return display, policy, subject
+
+
+def _frame_box(subject) -> tuple:
+    """The display rectangle of a gauge's frame, ``x2`` and ``y2`` exclusive."""
+    geometry = subject._geometry  # pylint: disable=protected-access
+    left = subject.x - geometry.center_x + 1
+    top = subject.y - geometry.center_y + 1
+    return left, top, left + geometry.bitmap_width, top + geometry.bitmap_height
+
+
+def test_epaper_refreshes_once_enough_pixels_changed():
+    display, policy, subject = _epaper_gauge()
+    geometry = subject._geometry  # pylint: disable=protected-access
+    assert policy.threshold == 200 and not policy.due and not policy.poll()
+    subject.progress = 2
+    small = geometry.filled_pixels(geometry.level(2))
+    assert 0 < policy.changed_pixels == small < policy.threshold
+    assert not policy.poll() and display.refreshes == 0
+    subject.progress = 80
+    assert policy.changed_pixels == geometry.filled_pixels(geometry.level(80))
+    assert policy.updates == 2 and policy.due
+    x1, y1, x2, y2 = policy.dirty
+    left, top, right, bottom = _frame_box(subject)
+    assert left <= x1 < x2 <= right and top <= y1 < y2 <= bottom
+    assert policy.poll()
+    assert display.refreshes == 1 and policy.skipped_refreshes == 1
+    assert policy.dirty is None and policy.changed_pixels == 0 and not policy.due
+
+
+def test_epaper_refreshes_stale_changes(monkeypatch):
+    clock = _Clock(monkeypatch)
+    display, policy, subject = _epaper_gauge(threshold=10_000, max_staleness=30)
+    subject.progress = 5
+    clock.advance(29)
+    assert not policy.stale and not policy.poll()
+    clock.advance(1)
+    assert policy.stale and policy.poll() and display.refreshes == 1
+    # Without a staleness limit only the threshold counts
+    policy.max_staleness = 0
+    subject.progress = 10
+    clock.advance(3600)
+    assert not policy.stale and not policy.poll()
+
+
+def test_epaper_defers_to_the_panel():
+    display, policy, subject = _epaper_gauge(threshold=1)
+    subject.progress = 50
+    display.time_to_refresh = 12.5
+    assert policy.time_to_refresh == 12.5 and not policy.poll()
+    display.time_to_refresh = 0
+    display.busy = True
+    assert not policy.poll()
+    display.busy = False
+    display.refused = True
+    assert not policy.poll()
+    assert policy.deferred_refreshes == 3 and policy.due and display.refreshes == 0
+    display.refused = False
+    assert policy.poll() and policy.refreshes == 1
+
+
+def test_epaper_counts_palette_changes():
+    display, policy, subject = _epaper_gauge(threshold=1)
+    geometry = subject._geometry  # pylint: disable=protected-access
+    subject.progress = 50
+    policy.poll()
+    subject.fill = subject.fill
+    assert policy.dirty is None
+    subject.fill = 0x123456
+    assert policy.changed_pixels == geometry.filled_pixels(geometry.level(50))
+    subject.outline = 0x654321
+    assert policy.changed_pixels == (
+        geometry.filled_pixels(geometry.level(50)) + geometry.outline_pixels
+    )
+    assert policy.dirty == _frame_box(subject)
+    policy.unregister(subject)
+    subject.background = 0x00FF00
+    assert policy.updates == 2 and display.refreshes == 1